@@ -0,0 +1,76 @@
+"""
+Run benchmarks and store results as JSON.
+
+Usage:
+    python -m benchmarks [--filter PATTERN] [--output results.json] [--compare baseline.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .runner import BenchmarkResult, collect_benchmarks, compare_results, run_benchmarks
+
+
+def _format_time(value: float | None) -> str:
+    if value is None:
+        return "-"
+
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.2f}{unit}"
+
+    return f"{value / 1e-9:.2f}ns"
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(  # noqa: T201
+        f"{result.name:<60} median={_format_time(result.median):>10} "
+        f"stdev={_format_time(result.stdev):>10} ops={result.ops:>12.1f}/s",
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", "--filter", default=None, help="glob pattern of benchmark names to run")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="path to store JSON results")
+    parser.add_argument("-c", "--compare", type=Path, default=None, help="path to JSON results to compare with")
+    parser.add_argument("--rounds", type=int, default=5, help="number of measured rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimal duration of a single round in seconds")
+    parser.add_argument("--list", action="store_true", help="list available benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    benchmarks = collect_benchmarks(args.filter)
+
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)  # noqa: T201
+
+        return 0
+
+    results = run_benchmarks(
+        benchmarks,
+        rounds=args.rounds,
+        min_time=args.min_time,
+        on_result=_print_result,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+
+        print()  # noqa: T201
+        for name, before, after, change in compare_results(baseline, results):
+            diff = f"{change:+.1%}" if change is not None else "-"
+            print(f"{name:<60} {_format_time(before):>10} -> {_format_time(after):>10} {diff:>8}")  # noqa: T201
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi import FastAPI
+
+from fastapi_pagination import Page, add_pagination, paginate
+
+from .runner import benchmark
+
+
+def _send(app: FastAPI, query: bytes) -> Any:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/items",
+        "raw_path": b"/items",
+        "root_path": "",
+        "query_string": query,
+        "headers": [],
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        pass
+
+    return lambda: app(scope, receive, send)
+
+
+@benchmark("api.route", is_async=True)
+@contextmanager
+def _route() -> Iterator[Any]:
+    app = FastAPI()
+    items = [*range(10)]
+
+    @app.get("/items")
+    async def route() -> Page[int]:
+        return paginate(items)
+
+    add_pagination(app)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        yield _send(app, b"page=1&size=10")
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi_pagination import Page
+from fastapi_pagination.customization import (
+    CustomizedPage,
+    UseFieldsAliases,
+    UseIncludeTotal,
+    UseName,
+    UseParamsFields,
+    clear_customized_page_cache,
+)
+
+from .data import Item
+from .runner import benchmark
+
+
+def _customize() -> Any:
+    return CustomizedPage[
+        Page[Item],
+        UseName("BenchPage"),
+        UseIncludeTotal(False),
+        UseParamsFields(size=100),
+        UseFieldsAliases(total="count"),
+    ]
+
+
+@benchmark("customization.build")
+@contextmanager
+def _build() -> Iterator[Any]:
+    def _run() -> Any:
+        clear_customized_page_cache()
+        return _customize()
+
+    yield _run
+    clear_customized_page_cache()
+
+
+@benchmark("customization.cached")
+@contextmanager
+def _cached() -> Iterator[Any]:
+    _customize()
+
+    yield _customize
+    clear_customized_page_cache()
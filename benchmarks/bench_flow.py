@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, set_page
+from fastapi_pagination.flow import flow, flow_expr, run_async_flow, run_sync_flow
+from fastapi_pagination.flows import generic_flow
+
+from .runner import benchmark
+
+_ITEMS = list(range(100))
+
+
+@flow
+def _noop_flow() -> Any:
+    result = yield None
+    return result
+
+
+@flow
+def _nested_flow(depth: int) -> Any:
+    if depth:
+        result = yield from _nested_flow(depth - 1)
+        return result
+
+    result = yield depth
+    return result
+
+
+def _generic_flow(async_: bool) -> Any:
+    return generic_flow(
+        async_=async_,
+        total_flow=flow_expr(lambda: len(_ITEMS)),
+        limit_offset_flow=flow_expr(lambda r: _ITEMS[r.as_slice()]),
+        params=LimitOffsetParams(limit=10, offset=10),
+    )
+
+
+@benchmark("flow.run_sync_flow")
+@contextmanager
+def _run_sync_flow() -> Iterator[Any]:
+    yield lambda: run_sync_flow(_noop_flow())
+
+
+@benchmark("flow.run_sync_flow[nested]")
+@contextmanager
+def _run_sync_flow_nested() -> Iterator[Any]:
+    yield lambda: run_sync_flow(_nested_flow(10))
+
+
+@benchmark("flow.run_async_flow", is_async=True)
+@contextmanager
+def _run_async_flow() -> Iterator[Any]:
+    yield lambda: run_async_flow(_noop_flow())
+
+
+@benchmark("flow.generic_flow[sync]")
+@contextmanager
+def _generic_sync_flow() -> Iterator[Any]:
+    with set_page(LimitOffsetPage[int]):
+        yield lambda: run_sync_flow(_generic_flow(async_=False))
+
+
+@benchmark("flow.generic_flow[async]", is_async=True)
+@contextmanager
+def _generic_async_flow() -> Iterator[Any]:
+    with set_page(LimitOffsetPage[int]):
+        yield lambda: run_async_flow(_generic_flow(async_=True))
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi_pagination.customization import clear_customized_page_cache
+
+from .runner import benchmark
+
+_MODULES = (
+    "fastapi_pagination.optional",
+    "fastapi_pagination.links.default",
+    "fastapi_pagination.links.limit_offset",
+)
+
+
+@benchmark("import.customized_pages")
+@contextmanager
+def _import_customized_pages() -> Iterator[Any]:
+    # modules are executed again on each call to measure cold-start cost of pages creation
+    originals = {name: sys.modules.get(name) for name in _MODULES}
+
+    def _run() -> None:
+        clear_customized_page_cache()
+
+        for name in _MODULES:
+            sys.modules.pop(name, None)
+            importlib.import_module(name)
+
+    yield _run
+
+    clear_customized_page_cache()
+    for name, module in originals.items():
+        if module is not None:
+            sys.modules[name] = module
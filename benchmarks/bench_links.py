@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi import Response
+
+from fastapi_pagination import Params
+from fastapi_pagination.api import _ctx_with_reset
+from fastapi_pagination.limit_offset import LimitOffsetParams
+from fastapi_pagination.links import LimitOffsetPage, Page
+
+from .data import Item, make_items, make_request
+from .runner import benchmark
+
+
+@contextmanager
+def _request_ctx(query: str) -> Iterator[None]:
+    with _ctx_with_reset(request=make_request(query=query), response=Response()):
+        yield
+
+
+@benchmark("links.page")
+@contextmanager
+def _page_links() -> Iterator[Any]:
+    items = make_items(50)
+    params = Params(page=2, size=50)
+
+    with _request_ctx("page=2&size=50"):
+        yield lambda: Page[Item].create(items, params, total=10_000)
+
+
+@benchmark("links.limit-offset")
+@contextmanager
+def _limit_offset_links() -> Iterator[Any]:
+    items = make_items(50)
+    params = LimitOffsetParams(limit=50, offset=50)
+
+    with _request_ctx("limit=50&offset=50"):
+        yield lambda: LimitOffsetPage[Item].create(items, params, total=10_000)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, Page, Params
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.customization import (
+    CustomizedPage,
+    UseFieldsAliases,
+    UseIncludeTotal,
+    UseOptionalParams,
+    UseParamsFields,
+    UseTrustedConstruction,
+)
+
+from .data import Item, NestedItem, make_items, make_nested_items
+from .runner import benchmark
+
+_SIZE = 100
+
+
+def _create(page_cls: Any, params: Any, items: Any, **kwargs: Any) -> Callable[[], Any]:
+    return lambda: page_cls.create(items, params, **kwargs)
+
+
+def _register(name: str, page_cls: Any, params: Any, items_factory: Callable[[int], Any], **kwargs: Any) -> None:
+    @benchmark(f"pages.{name}")
+    @contextmanager
+    def _bench() -> Iterator[Any]:
+        yield _create(page_cls, params, items_factory(_SIZE), **kwargs)
+
+
+def _as_dicts(factory: Callable[[int], Any]) -> Callable[[int], Any]:
+    return lambda count: [item.model_dump() for item in factory(count)]
+
+
+_register("page", Page[Item], Params(size=_SIZE), make_items, total=10_000)
+_register("page[dicts]", Page[Item], Params(size=_SIZE), _as_dicts(make_items), total=10_000)
+_register("page[nested]", Page[NestedItem], Params(size=_SIZE), make_nested_items, total=10_000)
+_register("limit-offset", LimitOffsetPage[Item], LimitOffsetParams(limit=_SIZE), make_items, total=10_000)
+_register("cursor", CursorPage[Item], CursorParams(size=_SIZE), make_items, total=10_000, next_="next")
+_register(
+    "customized[trusted]",
+    CustomizedPage[Page[NestedItem], UseTrustedConstruction()],
+    Params(size=_SIZE),
+    make_nested_items,
+    total=10_000,
+)
+_register(
+    "customized[no-total]",
+    CustomizedPage[Page[Item], UseIncludeTotal(False)],
+    Params(size=_SIZE),
+    make_items,
+)
+_register(
+    "customized[optional-params]",
+    CustomizedPage[Page[Item], UseOptionalParams()],
+    Params(size=_SIZE),
+    make_items,
+    total=10_000,
+)
+_register(
+    "customized[aliases-params-fields]",
+    CustomizedPage[Page[Item], UseFieldsAliases(total="count"), UseParamsFields(size=_SIZE)],
+    Params(size=_SIZE),
+    make_items,
+    total=10_000,
+)
+
+
+@benchmark("pages.customized-class-creation")
+@contextmanager
+def _customized_class_creation() -> Iterator[Any]:
+    yield lambda: CustomizedPage[Page[Item], UseIncludeTotal(False), UseFieldsAliases(items="data")]
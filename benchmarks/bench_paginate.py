@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.async_paginator import apaginate
+from fastapi_pagination.iterables import Page as IterablesPage
+from fastapi_pagination.iterables import Params as IterablesParams
+from fastapi_pagination.iterables import paginate as iterables_paginate
+from fastapi_pagination.paginator import paginate
+
+from .data import Item, make_items
+from .runner import benchmark
+
+_TOTAL = 10_000
+
+
+@benchmark("paginate.paginator")
+@contextmanager
+def _paginator() -> Iterator[Any]:
+    items = make_items(_TOTAL)
+    params = Params(page=10, size=50)
+
+    with set_page(Page[Item]), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+
+        yield lambda: paginate(items, params)
+
+
+@benchmark("paginate.paginator[safe]")
+@contextmanager
+def _paginator_safe() -> Iterator[Any]:
+    items = make_items(_TOTAL)
+    params = Params(page=10, size=50)
+
+    with set_page(Page[Item]):
+        yield lambda: paginate(items, params, safe=True)
+
+
+@benchmark("paginate.async_paginator", is_async=True)
+@contextmanager
+def _async_paginator() -> Iterator[Any]:
+    items = make_items(_TOTAL)
+    params = Params(page=10, size=50)
+
+    with set_page(Page[Item]):
+        yield lambda: apaginate(items, params, safe=True)
+
+
+@benchmark("paginate.iterables")
+@contextmanager
+def _iterables() -> Iterator[Any]:
+    items = make_items(_TOTAL)
+    params = IterablesParams(page=10, size=50)
+
+    with set_page(IterablesPage[Item]):
+        yield lambda: iterables_paginate(iter(items), params, total=_TOTAL)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import Integer, String, create_engine, func, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+from sqlalchemy.pool import StaticPool
+
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.ext.sqlalchemy import paginate
+
+from .data import Item
+from .runner import benchmark
+
+_TOTAL = 10_000
+_SIZE = 50
+_DEEP_PAGE = 150
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _User(_Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String, index=True)
+
+
+@contextmanager
+def _session() -> Iterator[Session]:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    _Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.execute(
+            _User.__table__.insert(),
+            [{"id": i, "name": f"user-{i % 1_000:04}"} for i in range(_TOTAL)],
+        )
+        session.commit()
+
+        yield session
+
+    engine.dispose()
+
+
+def _register_offset(name: str, page: int, **kwargs: Any) -> None:
+    @benchmark(f"sqlalchemy.{name}")
+    @contextmanager
+    def _bench() -> Iterator[Any]:
+        query = select(_User).order_by(_User.id)
+        params = Params(page=page, size=_SIZE)
+
+        with _session() as session, set_page(Page[Item]):
+            yield lambda: paginate(session, query, params, **kwargs)
+
+
+def _register_cursor(name: str, page: int) -> None:
+    @benchmark(f"sqlalchemy.{name}")
+    @contextmanager
+    def _bench() -> Iterator[Any]:
+        query = select(_User).order_by(_User.name, _User.id)
+
+        with _session() as session, set_page(CursorPage[Item]):
+            cursor = None
+            for _ in range(page - 1):
+                cursor = paginate(session, query, CursorParams(size=_SIZE, cursor=cursor)).next_page
+
+            params = CursorParams(size=_SIZE, cursor=cursor)
+            yield lambda: paginate(session, query, params)
+
+
+_register_offset("offset[first]", page=1)
+_register_offset(f"offset[page={_DEEP_PAGE}]", page=_DEEP_PAGE)
+_register_offset("offset[no-subquery-count]", page=1, subquery_count=False)
+_register_offset("inline_count[first]", page=1, inline_count=func.count().over())
+_register_offset(f"inline_count[page={_DEEP_PAGE}]", page=_DEEP_PAGE, inline_count=func.count().over())
+_register_cursor("cursor[first]", page=1)
+_register_cursor(f"cursor[page={_DEEP_PAGE}]", page=_DEEP_PAGE)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+__all__ = [
+    "Item",
+    "NestedItem",
+    "make_items",
+    "make_nested_items",
+    "make_request",
+]
+
+from pydantic import BaseModel
+from starlette.requests import Request
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class NestedItem(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    children: list[Item]
+
+
+def make_items(count: int) -> list[Item]:
+    return [Item(id=i, name=f"item-{i}") for i in range(count)]
+
+
+def make_nested_items(count: int) -> list[NestedItem]:
+    return [
+        NestedItem(
+            id=i,
+            name=f"item-{i}",
+            tags=[f"tag-{j}" for j in range(5)],
+            children=make_items(3),
+        )
+        for i in range(count)
+    ]
+
+
+def make_request(path: str = "/items", query: str = "page=2&size=50") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [],
+        },
+    )
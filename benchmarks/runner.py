@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+__all__ = [
+    "Benchmark",
+    "BenchmarkResult",
+    "benchmark",
+    "collect_benchmarks",
+    "compare_results",
+    "run_benchmarks",
+]
+
+import asyncio
+import gc
+import importlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TypeAlias
+
+BenchmarkFunc: TypeAlias = Callable[[], Any] | Callable[[], Awaitable[Any]]
+BenchmarkSetup: TypeAlias = Callable[[], AbstractContextManager[BenchmarkFunc]]
+
+_MODULES_PATTERN = "bench_*.py"
+_PACKAGES = ("fastapi-pagination", "fastapi", "pydantic", "pydantic-core", "sqlalchemy")
+
+_registry: dict[str, Benchmark] = {}
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    setup: BenchmarkSetup
+    is_async: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    loops: int
+    rounds: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stdev: float
+    ops: float
+    timings: list[float] = field(repr=False)
+
+
+def benchmark(
+    name: str,
+    *,
+    group: str | None = None,
+    is_async: bool = False,
+) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """
+    Register benchmark.
+
+    Decorated function is a context manager factory that prepares all required state and yields
+    a function to measure. Measured function can be a coroutine function when `is_async=True`.
+    """
+
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        if name in _registry:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+
+        _registry[name] = Benchmark(
+            name=name,
+            group=group or name.split(".", maxsplit=1)[0],
+            setup=setup,
+            is_async=is_async,
+        )
+        return setup
+
+    return decorator
+
+
+def collect_benchmarks(pattern: str | None = None) -> list[Benchmark]:
+    for path in sorted(Path(__file__).parent.glob(_MODULES_PATTERN)):
+        importlib.import_module(f"{__package__}.{path.stem}")
+
+    return [bench for name, bench in _registry.items() if pattern is None or fnmatch(name, pattern)]
+
+
+def _measure_sync(func: Callable[[], Any], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+
+    return time.perf_counter() - start
+
+
+def _measure_async(loop: asyncio.AbstractEventLoop, func: Callable[[], Awaitable[Any]], loops: int) -> float:
+    async def _run() -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            await func()
+
+        return time.perf_counter() - start
+
+    return loop.run_until_complete(_run())
+
+
+def _calibrate(measure: Callable[[int], float], min_time: float) -> int:
+    loops = 1
+
+    while True:
+        elapsed = measure(loops)
+
+        if elapsed >= min_time or loops >= 1_000_000:
+            return loops
+
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+
+def _run_benchmark(bench: Benchmark, rounds: int, min_time: float) -> BenchmarkResult:
+    loop = asyncio.new_event_loop() if bench.is_async else None
+
+    try:
+        with bench.setup() as func:
+            if loop is not None:
+
+                def measure(loops: int) -> float:
+                    return _measure_async(loop, func, loops)  # type: ignore[ty:invalid-argument-type]
+
+            else:
+
+                def measure(loops: int) -> float:
+                    return _measure_sync(func, loops)
+
+            loops = _calibrate(measure, min_time)
+
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                timings = [measure(loops) / loops for _ in range(rounds)]
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+    finally:
+        if loop is not None:
+            loop.close()
+
+    mean = statistics.fmean(timings)
+
+    return BenchmarkResult(
+        name=bench.name,
+        group=bench.group,
+        loops=loops,
+        rounds=rounds,
+        min=min(timings),
+        max=max(timings),
+        mean=mean,
+        median=statistics.median(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        ops=1 / mean if mean else 0.0,
+        timings=timings,
+    )
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _get_version(package: str) -> str | None:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    *,
+    rounds: int = 5,
+    min_time: float = 0.05,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> dict[str, Any]:
+    results = []
+
+    for bench in benchmarks:
+        result = _run_benchmark(bench, rounds, min_time)
+        results.append(result)
+
+        if on_result is not None:
+            on_result(result)
+
+    return {
+        "machine": {
+            "python": sys.version,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "commit": _get_commit(),
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "versions": {package: _get_version(package) for package in _PACKAGES},
+        "benchmarks": [asdict(result) for result in results],
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+) -> Iterator[tuple[str, float | None, float | None, float | None]]:
+    """Yield benchmark name, baseline median, current median and relative change for each benchmark."""
+    old = {bench["name"]: bench["median"] for bench in baseline["benchmarks"]}
+    new = {bench["name"]: bench["median"] for bench in current["benchmarks"]}
+
+    for name in [*new, *(name for name in old if name not in new)]:
+        before, after = old.get(name), new.get(name)
+        change = (after - before) / before if before and after is not None else None
+
+        yield name, before, after, change
@@ -5,6 +5,7 @@ __all__ = [
     "Params",
     "add_pagination",
     "create_page",
+    "create_page_json",
     "paginate",
     "pagination_ctx",
     "request",
@@ -14,16 +15,54 @@ __all__ = [
     "set_params",
 ]
 
-from .api import (
-    add_pagination,
-    create_page,
-    pagination_ctx,
-    request,
-    resolve_params,
-    response,
-    set_page,
-    set_params,
-)
-from .default import Page, Params
-from .limit_offset import LimitOffsetPage, LimitOffsetParams
-from .paginator import paginate
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import (
+        add_pagination,
+        create_page,
+        create_page_json,
+        pagination_ctx,
+        request,
+        resolve_params,
+        response,
+        set_page,
+        set_params,
+    )
+    from .default import Page, Params
+    from .limit_offset import LimitOffsetPage, LimitOffsetParams
+    from .paginator import paginate
+
+_LAZY_IMPORTS = {
+    "add_pagination": ".api",
+    "create_page": ".api",
+    "create_page_json": ".api",
+    "pagination_ctx": ".api",
+    "request": ".api",
+    "resolve_params": ".api",
+    "response": ".api",
+    "set_page": ".api",
+    "set_params": ".api",
+    "Page": ".default",
+    "Params": ".default",
+    "LimitOffsetPage": ".limit_offset",
+    "LimitOffsetParams": ".limit_offset",
+    "paginate": ".paginator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
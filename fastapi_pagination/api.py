@@ -1,7 +1,9 @@
 __all__ = [
+    "JSONPageResponse",
     "add_pagination",
     "apply_items_transformer",
     "create_page",
+    "create_page_json",
     "pagination_ctx",
     "pagination_items",
     "request",
@@ -16,12 +18,12 @@ __all__ = [
 
 import inspect
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
-from contextlib import AbstractContextManager, ExitStack, asynccontextmanager, contextmanager, suppress
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager, suppress
 from contextvars import ContextVar
 from typing import (
-    Annotated,
     Any,
     Literal,
+    NamedTuple,
     TypeVar,
     cast,
     overload,
@@ -36,39 +38,41 @@ from fastapi.dependencies.utils import (
 )
 from fastapi.routing import APIRoute, APIRouter, _IncludedRouter, request_response
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
 from .bases import AbstractPage, AbstractParams, BaseAbstractPage
 from .errors import UninitializedConfigurationError
+from .pydantic import complete_model_build, trusted_construction
 from .types import AsyncItemsTransformer, ItemsTransformer, SyncItemsTransformer
 from .utils import is_async_callable, unwrap_annotated
 
 T = TypeVar("T")
 TAbstractParams_co = TypeVar("TAbstractParams_co", covariant=True, bound=AbstractParams)
 
-_params_val: ContextVar[AbstractParams] = ContextVar("_params_val")
-_page_val: ContextVar[type[AbstractPage[Any]]] = ContextVar("_page_val")
 
-_rsp_val: ContextVar[Response] = ContextVar("_rsp_val")
-_req_val: ContextVar[Request] = ContextVar("_req_val")
+class _PaginationContext(NamedTuple):
+    page: type[AbstractPage[Any]] | None = None
+    params: AbstractParams | None = None
+    transformer: ItemsTransformer | None = None
+    request: Request | None = None
+    response: Response | None = None
+
+
+# all pagination state is stored in a single immutable object, so route dependency sets only one context var
+_ctx_val: ContextVar[_PaginationContext] = ContextVar("_ctx_val", default=_PaginationContext())  # noqa: B039
 
 _items_val: ContextVar[Sequence[Any]] = ContextVar("_items_val")
-_items_transformer_val: ContextVar[ItemsTransformer | None] = ContextVar("_items_transformer_val", default=None)
 
 
 def resolve_params(params: TAbstractParams_co | None = None) -> TAbstractParams_co:
-    if params is None:
-        try:
-            return cast(TAbstractParams_co, _params_val.get())
-        except LookupError:
-            raise UninitializedConfigurationError("Use params, add_pagination or pagination_ctx") from None
+    if params is None and (params := _ctx_val.get().params) is None:  # type: ignore[ty:invalid-assignment]
+        raise UninitializedConfigurationError("Use params, add_pagination or pagination_ctx")
 
     return params
 
 
 def resolve_items_transformer(transformer: ItemsTransformer | None = None) -> ItemsTransformer | None:
     if transformer is None:
-        return _items_transformer_val.get()
+        return _ctx_val.get().transformer
 
     return transformer
 
@@ -102,18 +106,59 @@ def create_page(
         return resolve_page(params).create(items, **kwargs)
 
 
+class JSONPageResponse(Response):
+    media_type = "application/json"
+
+
+def create_page_json(
+    items: Sequence[T],
+    /,
+    total: int | None = None,
+    params: AbstractParams | None = None,
+    **kwargs: Any,
+) -> JSONPageResponse:
+    """
+    Creates a page and serializes it directly to JSON response.
+
+    Page is created in trusted mode, so items that already have page item type are not validated again.
+    Route should still declare the page class as `response_model` to keep the same OpenAPI schema.
+
+    Returns:
+        JSONPageResponse: A response with serialized page as a body.
+    """
+    with trusted_construction():
+        page = create_page(items, total=total, params=params, **kwargs)
+
+    content = page.model_dump_json(by_alias=True)
+    rsp = JSONPageResponse(content=content)
+
+    _merge_sub_response(rsp)
+    return rsp
+
+
+def _merge_sub_response(rsp: Response, /) -> None:
+    # headers and status code set by page (UseResponseHeaders, etc.) are stored in the route sub-response
+    if (sub_rsp := _ctx_val.get().response) is not None:
+        if sub_rsp.status_code:
+            rsp.status_code = sub_rsp.status_code
+
+        for key, value in sub_rsp.raw_headers:
+            if key != b"content-length":
+                rsp.raw_headers.append((key, value))
+
+
 def response() -> Response:
-    try:
-        return _rsp_val.get()
-    except LookupError:
-        raise RuntimeError("response context var must be set") from None
+    if (rsp := _ctx_val.get().response) is None:
+        raise RuntimeError("response context var must be set")
+
+    return rsp
 
 
 def request() -> Request:
-    try:
-        return _req_val.get()
-    except LookupError:
-        raise RuntimeError("request context var must be set") from None
+    if (req := _ctx_val.get().request) is None:
+        raise RuntimeError("request context var must be set")
+
+    return req
 
 
 def _ctx_var_with_reset(var: ContextVar[T], value: T) -> AbstractContextManager[None]:
@@ -129,29 +174,32 @@ def _ctx_var_with_reset(var: ContextVar[T], value: T) -> AbstractContextManager[
     return _reset_ctx()
 
 
+def _ctx_with_reset(**values: Any) -> AbstractContextManager[None]:
+    return _ctx_var_with_reset(_ctx_val, _ctx_val.get()._replace(**values))
+
+
 def set_params(params: AbstractParams) -> AbstractContextManager[None]:
-    return _ctx_var_with_reset(_params_val, params)
+    return _ctx_with_reset(params=params)
 
 
 def set_page(page: type[AbstractPage[Any]]) -> AbstractContextManager[None]:
-    return _ctx_var_with_reset(_page_val, page)
+    return _ctx_with_reset(page=page)
 
 
 def resolve_page(params: AbstractParams | None = None, /) -> type[AbstractPage[Any]]:
-    try:
-        return _page_val.get()
-    except LookupError:
-        if params and (page := params.__page_type__):
-            return page
-
-        raise UninitializedConfigurationError(
-            "can't resolve page type, use set_page or pagination_ctx with page argument, or use "
-            "params that connected to page via set_page method"
-        ) from None
+    if (page := _ctx_val.get().page) is not None:
+        return page
+    if params and (page := params.__page_type__):
+        return page
+
+    raise UninitializedConfigurationError(
+        "can't resolve page type, use set_page or pagination_ctx with page argument, or use "
+        "params that connected to page via set_page method"
+    )
 
 
 def set_items_transformer(transformer: ItemsTransformer) -> AbstractContextManager[None]:
-    return _ctx_var_with_reset(_items_transformer_val, transformer)
+    return _ctx_with_reset(transformer=transformer)
 
 
 async def async_wrapped(obj: T) -> T:
@@ -204,51 +252,46 @@ def apply_items_transformer(
     return async_wrapped(items) if async_ else items
 
 
-def _create_params_dependency(
+_REQUEST_PARAM = "_pagination_request_"
+_RESPONSE_PARAM = "_pagination_response_"
+
+
+def _create_params_factory(
     params: type[TAbstractParams_co],
-) -> Callable[[TAbstractParams_co], AsyncIterator[TAbstractParams_co]]:
+) -> tuple[Callable[[dict[str, Any]], TAbstractParams_co], list[inspect.Parameter]]:
     is_pydantic_model = False
+    with suppress(ValueError, TypeError):
+        is_pydantic_model = issubclass(params, BaseModel)
 
-    async def _pagination_params(*args: Any, **kwargs: Any) -> AsyncIterator[TAbstractParams_co]:
-        if is_pydantic_model:
-            # should not happen cause all , but let's be safe
-            if args:  # pragma: no cover
-                raise ValueError("Positional arguments are not supported for Pydantic models")
+    if not is_pydantic_model:
+        sign_params = [
+            param.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+            for param in inspect.signature(params).parameters.values()
+        ]
+        return lambda kwargs: params(**kwargs), sign_params
 
-            val = cast(
-                AbstractParams,
-                cast(type[BaseModel], params).model_validate(kwargs, by_name=True),
-            )
-        else:
-            val = params(*args, **kwargs)
+    model = cast(type[BaseModel], params)
+    validate_python: Callable[..., Any] | None = None
 
-        with set_params(val):
-            yield val  # type: ignore[ty:invalid-yield]
+    def _factory(kwargs: dict[str, Any]) -> TAbstractParams_co:
+        nonlocal validate_python
 
-    sign = inspect.signature(params)
+        # validator is resolved on first request, so model schema can be built lazily
+        if validate_python is None:
+            validate_python = model.__pydantic_validator__.validate_python
 
-    def _get_param(name: str, field: FieldInfo) -> inspect.Parameter:
-        return inspect.Parameter(
+        return cast(TAbstractParams_co, validate_python(kwargs, by_name=True))
+
+    sign_params = [
+        inspect.Parameter(
             name=name,
             kind=inspect.Parameter.KEYWORD_ONLY,
             annotation=field.annotation,
             default=field,
         )
-
-    with suppress(ValueError, TypeError):
-        is_pydantic_model = issubclass(params, BaseModel)
-
-    if is_pydantic_model:
-        sign_params = [_get_param(name, field) for name, field in cast(BaseModel, params).model_fields.items()]
-        sign = sign.replace(parameters=sign_params)
-
-    _pagination_params.__signature__ = sign  # type: ignore[ty:unresolved-attribute]
-
-    return _pagination_params
-
-
-async def _noop_dep() -> None:
-    pass
+        for name, field in model.model_fields.items()
+    ]
+    return _factory, sign_params
 
 
 def pagination_ctx(
@@ -260,23 +303,34 @@ def pagination_ctx(
     if page is not None and params is None:
         params = page.__params_type__
 
-    params_dep: Any = _create_params_dependency(params) if params is not None else _noop_dep
-
-    async def _page_ctx_dependency(
-        req: Request,
-        res: Response,
-        _params: Annotated[Any, Depends(params_dep)],
-    ) -> AsyncIterator[AbstractParams]:
-        with ExitStack() as stack:
-            if page is not None:
-                stack.enter_context(set_page(page))
-            if transformer is not None:
-                stack.enter_context(set_items_transformer(transformer))
+    factory: Callable[[dict[str, Any]], AbstractParams] | None = None
+    sign_params: list[inspect.Parameter] = []
+    if params is not None:
+        factory, sign_params = _create_params_factory(params)
+
+    async def _page_ctx_dependency(**kwargs: Any) -> AsyncIterator[AbstractParams]:
+        req = kwargs.pop(_REQUEST_PARAM)
+        res = kwargs.pop(_RESPONSE_PARAM)
+
+        current = _ctx_val.get()
+        ctx = _PaginationContext(
+            page=page or current.page,
+            params=factory(kwargs) if factory is not None else current.params,
+            transformer=transformer or current.transformer,
+            request=req,
+            response=res,
+        )
 
-            stack.enter_context(_ctx_var_with_reset(_rsp_val, res))
-            stack.enter_context(_ctx_var_with_reset(_req_val, req))
+        with _ctx_var_with_reset(_ctx_val, ctx):
+            yield cast(AbstractParams, ctx.params)
 
-            yield cast(AbstractParams, _params)
+    _page_ctx_dependency.__signature__ = inspect.Signature(  # type: ignore[ty:unresolved-attribute]
+        [
+            inspect.Parameter(_REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            inspect.Parameter(_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response),
+            *sign_params,
+        ],
+    )
 
     if __page_ctx_dep__:
         _page_ctx_dependency.__page_ctx_dep__ = True  # type: ignore[ty:unresolved-attribute]
@@ -297,6 +351,11 @@ def _update_route(route: APIRoute) -> None:
         return
 
     cls = cast(type[AbstractPage[Any]], page_cls)
+
+    # pages with deferred schema build are finalized at startup instead of the first request
+    complete_model_build(cls)
+    complete_model_build(getattr(cls, "__params_type__", None))
+
     dep = Depends(pagination_ctx(cls, __page_ctx_dep__=True))
 
     route.dependencies.append(dep)
@@ -125,6 +125,7 @@ class AbstractPage(BaseAbstractPage[TAny], BaseModel, ABC, Generic[TAny]):
 
     __model_aliases__: ClassVar[dict[str, str]] = {}
     __model_exclude__: ClassVar[set[str]] = set()
+    __trusted_construction__: ClassVar[bool] = False
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -148,7 +149,7 @@ class AbstractPage(BaseAbstractPage[TAny], BaseModel, ABC, Generic[TAny]):
             cls.model_fields[name].serialization_alias = alias
 
         # rebuild model only in case if customizations is present
-        if cls.__model_exclude__ or cls.__model_aliases__:
+        if (cls.__model_exclude__ or cls.__model_aliases__) and not cls.model_config.get("defer_build"):
             with suppress(PydanticUndefinedAnnotation):
                 cls.model_rebuild(force=True)
 
@@ -0,0 +1,141 @@
+__all__ = [
+    "AsyncColumnarTransformer",
+    "ColumnarTransformer",
+    "Columns",
+    "SyncColumnarTransformer",
+    "columnar_transformer",
+    "items_from_columns",
+    "items_to_columns",
+]
+
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from importlib import import_module
+from typing import Any, TypeAlias
+
+from .types import AsyncItemsTransformer, SyncItemsTransformer
+from .utils import is_async_callable
+
+Columns: TypeAlias = dict[str, Any]
+
+SyncColumnarTransformer: TypeAlias = Callable[[Columns], Mapping[str, Any]]
+AsyncColumnarTransformer: TypeAlias = Callable[[Columns], Awaitable[Mapping[str, Any]]]
+ColumnarTransformer: TypeAlias = SyncColumnarTransformer | AsyncColumnarTransformer
+
+
+def _import_numpy() -> Any:
+    try:
+        return import_module("numpy")
+    except ImportError:
+        raise ImportError("numpy is required for columnar transformer with numpy=True") from None
+
+
+def _to_array(np: Any, column: Sequence[Any]) -> Any:
+    if all(np.isscalar(value) for value in column):
+        return np.asarray(column)
+
+    # asarray would build nested or ragged arrays from lists and tuples, so each value is kept as a single object
+    array = np.empty(len(column), dtype=object)
+    for i, value in enumerate(column):
+        array[i] = value
+
+    return array
+
+
+def _get_column_names(item: Any) -> list[str]:
+    if isinstance(item, Mapping):
+        return [*item.keys()]
+
+    # sqlalchemy Row and namedtuple
+    if (fields := getattr(item, "_fields", None)) is not None:
+        return [*fields]
+
+    # asyncpg Record
+    if callable(keys := getattr(item, "keys", None)):
+        return [*keys()]
+
+    raise TypeError(
+        f"Columnar transformer supports only mappings and rows with named columns, got {type(item).__name__!r}",
+    )
+
+
+def items_to_columns(items: Sequence[Any], /, *, numpy: bool = False) -> Columns:
+    """
+    Convert page items (mappings, sqlalchemy rows or asyncpg records) to columns.
+
+    Args:
+        items: page items, all items should have the same columns.
+        numpy: whether columns should be numpy arrays instead of lists.
+    """
+    if not items:
+        return {}
+
+    names = _get_column_names(items[0])
+
+    if isinstance(items[0], Mapping):
+        values: list[Sequence[Any]] = [[item[name] for item in items] for name in names]
+    else:
+        # rows are tuple-like, so transposing them builds all columns in a single pass
+        values = [*zip(*items, strict=True)]
+
+    if numpy:
+        np = _import_numpy()
+        return {name: _to_array(np, column) for name, column in zip(names, values, strict=True)}
+
+    return {name: [*column] for name, column in zip(names, values, strict=True)}
+
+
+def items_from_columns(columns: Mapping[str, Any], /) -> list[dict[str, Any]]:
+    """
+    Zip columns (sequences or numpy arrays of the same length) back to item dicts.
+    """
+    if not columns:
+        return []
+
+    # numpy arrays are converted to lists of python scalars, so items can be validated by pydantic
+    values = [column.tolist() if hasattr(column, "tolist") else column for column in columns.values()]
+
+    if len({len(column) for column in values}) != 1:
+        raise ValueError("All columns should have the same length")
+
+    names = [*columns]
+    return [dict(zip(names, row, strict=True)) for row in zip(*values, strict=True)]
+
+
+def columnar_transformer(
+    func: ColumnarTransformer,
+    /,
+    *,
+    numpy: bool = False,
+) -> SyncItemsTransformer | AsyncItemsTransformer:
+    """
+    Create items transformer that processes page as columns instead of item by item.
+
+    `func` receives dict of columns (lists, or numpy arrays when `numpy=True`) and returns columns
+    to add or replace, e.g. `lambda columns: {"total_usd": columns["total"] * rate}`.
+    Items of the page are rebuilt as dicts from the resulting columns.
+
+    Args:
+        func: sync or async function that transforms columns.
+        numpy: whether columns should be numpy arrays instead of lists.
+    """
+
+    def _merge(items: Sequence[Any], columns: Columns, result: Mapping[str, Any]) -> Sequence[Any]:
+        return items_from_columns({**columns, **result}) if items else items
+
+    if is_async_callable(func):
+
+        async def _async_transformer(items: Sequence[Any]) -> Sequence[Any]:
+            columns = items_to_columns(items, numpy=numpy)
+            result = await func(columns) if items else {}  # type: ignore[ty:invalid-await]
+
+            return _merge(items, columns, result)
+
+        return _async_transformer
+
+    def _transformer(items: Sequence[Any]) -> Sequence[Any]:
+        columns = items_to_columns(items, numpy=numpy)
+        result = func(columns) if items else {}
+
+        return _merge(items, columns, result)  # type: ignore[ty:invalid-argument-type]
+
+    return _transformer
@@ -2,10 +2,13 @@ __all__ = [
     "Config",
 ]
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from .bases import AbstractPage
+from .instrumentation import FlowHook
+from .total_cache import TotalCache
 
 
 @dataclass
@@ -13,8 +16,30 @@ class Config:
     """
     Configuration for the pagination.
 
-    For this moment, only `page_cls` is available, which is a class that will be used to create pages.
-    But in the future, more options might be added.
+    Available options:
+
+    * `page_cls` - a class that will be used to create pages.
+    * `concurrent_total` - run the total and the items queries concurrently for async backends.
+      Enable it only when the connection supports concurrent queries (connection pools, separate sessions, etc.).
+    * `total_cache` - cache that will be used to store total counts between requests.
+    * `trusted_construction` - skip page validation when items already have the page item type.
+    * `flow_hooks` - hooks that will receive start/end events of pagination stages (in addition to global hooks).
+    * `fetch_batch_size` - fetch rows by batches of this size using server-side cursors and apply items
+      transformer to each batch, so raw rows of a large page are not kept in memory all at once.
+      Supported by `psycopg` and `sqlalchemy` extensions for limit-offset pagination.
+    * `adaptive_total` - fetch items before the total and skip the count query when a limit-offset page
+      is shorter than the limit, as the total is `offset + len(items)` in this case.
+    * `projection_pushdown` - fetch only fields of the page item model (e.g. `UserOut` for `Page[UserOut]`)
+      instead of whole rows or documents. Supported by `sqlalchemy` (`load_only`), `django` (`.only()`),
+      `pymongo` and `beanie` aggregation (projection) extensions. Item model should be the one that is validated
+      from the fetched items, so push-down is skipped when items transformer is passed.
     """
 
     page_cls: type[AbstractPage[Any]] | None = None
+    concurrent_total: bool = False
+    total_cache: TotalCache | None = None
+    trusted_construction: bool = False
+    flow_hooks: Sequence[FlowHook] = ()
+    fetch_batch_size: int | None = None
+    adaptive_total: bool = False
+    projection_pushdown: bool = False
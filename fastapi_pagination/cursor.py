@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 __all__ = [
+    "CompactCursorCodec",
+    "CursorCodec",
     "CursorDecoder",
     "CursorEncoder",
     "CursorPage",
     "CursorParams",
 ]
 
-import binascii
-from base64 import b64decode, b64encode
+import hashlib
+import hmac
+import zlib
+from base64 import b64decode, b64encode, urlsafe_b64encode
 from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
 from typing import (
     Any,
     ClassVar,
     Generic,
     Literal,
+    Protocol,
     TypeAlias,
     overload,
 )
@@ -34,28 +40,128 @@ CursorEncoder: TypeAlias = "Callable[[CursorParams, Cursor | None], str | None]"
 CursorDecoder: TypeAlias = "Callable[[CursorParams, str | None], Cursor | None]"
 
 
+class CursorCodec(Protocol):
+    def encode(self, cursor: bytes, /) -> str:  # pragma: no cover
+        pass
+
+    def decode(self, cursor: str, /) -> bytes:  # pragma: no cover
+        """Decode cursor, should raise `ValueError` if cursor is invalid."""
+
+
+_COMPRESSED_FLAG = 0x01
+
+
+@dataclass(frozen=True)
+class CompactCursorCodec(CursorCodec):
+    """
+    Compact url-safe cursor codec.
+
+    Cursor is encoded as unpadded base64url, so it does not need to be url-quoted.
+
+    Args:
+        secret: key used to sign cursors with HMAC, tampered cursors are rejected on decoding.
+        compress_threshold: minimal cursor size in bytes to try zlib compression, `None` disables compression.
+        digest: name of hash function used for HMAC.
+        signature_size: number of bytes of HMAC digest to keep in the cursor.
+    """
+
+    secret: str | bytes | None = field(default=None, repr=False)
+    compress_threshold: int | None = 128
+    digest: str = "sha256"
+    signature_size: int = 16
+
+    def _sign(self, payload: bytes) -> bytes:
+        key = self.secret.encode() if isinstance(self.secret, str) else self.secret
+        return hmac.new(key or b"", payload, getattr(hashlib, self.digest)).digest()[: self.signature_size]
+
+    def encode(self, cursor: bytes, /) -> str:
+        flags = 0
+        if self.compress_threshold is not None and len(cursor) >= self.compress_threshold:
+            compressed = zlib.compress(cursor)
+
+            if len(compressed) < len(cursor):
+                cursor, flags = compressed, flags | _COMPRESSED_FLAG
+
+        payload = bytes([flags]) + cursor
+        if self.secret is not None:
+            payload += self._sign(payload)
+
+        return urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+    def decode(self, cursor: str, /) -> bytes:
+        payload = b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True)
+
+        if self.secret is not None:
+            payload, signature = payload[: -self.signature_size], payload[-self.signature_size :]
+
+            # check signature before any further processing of untrusted data
+            if not payload or not hmac.compare_digest(signature, self._sign(payload)):
+                raise ValueError("Invalid cursor signature")
+
+        if not payload:
+            raise ValueError("Empty cursor")
+
+        flags, data = payload[0], payload[1:]
+
+        if flags & _COMPRESSED_FLAG:
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as e:
+                raise ValueError("Invalid compressed cursor") from e
+
+        return data
+
+
+def default_decoder(cursor: str) -> bytes:
+    return b64decode(cursor.encode())
+
+
 @overload
-def decode_cursor(cursor: str | None, *, to_str: Literal[True] = True, quoted: bool = True) -> str | None:
+def decode_cursor(
+    cursor: str | None,
+    *,
+    to_str: Literal[True] = True,
+    quoted: bool = True,
+    decoder: Callable[[str], bytes] = default_decoder,
+) -> str | None:
     pass
 
 
 @overload
-def decode_cursor(cursor: str | None, *, to_str: Literal[False], quoted: bool = True) -> bytes | None:
+def decode_cursor(
+    cursor: str | None,
+    *,
+    to_str: Literal[False],
+    quoted: bool = True,
+    decoder: Callable[[str], bytes] = default_decoder,
+) -> bytes | None:
     pass
 
 
 @overload
-def decode_cursor(cursor: str | None, *, to_str: bool, quoted: bool = True) -> Cursor | None:
+def decode_cursor(
+    cursor: str | None,
+    *,
+    to_str: bool,
+    quoted: bool = True,
+    decoder: Callable[[str], bytes] = default_decoder,
+) -> Cursor | None:
     pass
 
 
-def decode_cursor(cursor: str | None, *, to_str: bool = True, quoted: bool = True) -> Cursor | None:
+def decode_cursor(
+    cursor: str | None,
+    *,
+    to_str: bool = True,
+    quoted: bool = True,
+    decoder: Callable[[str], bytes] = default_decoder,
+) -> Cursor | None:
     if cursor:
         try:
             cursor = unquote(cursor) if quoted else cursor
-            res = b64decode(cursor.encode())
+            res = decoder(cursor)
             return res.decode() if to_str else res
-        except (binascii.Error, UnicodeDecodeError):
+        except ValueError:  # binascii.Error and UnicodeDecodeError are subclasses of ValueError
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid cursor value",
@@ -92,6 +198,7 @@ class CursorParams(BaseModel, AbstractParams):
 
     str_cursor: ClassVar[bool] = True
     quoted_cursor: ClassVar[bool] = True
+    cursor_codec: ClassVar[CursorCodec | None] = None
 
     def to_raw_params(self) -> CursorRawParams:
         return CursorRawParams(
@@ -100,9 +207,15 @@ class CursorParams(BaseModel, AbstractParams):
         )
 
     def encode_cursor(self, cursor: Cursor | None) -> str | None:
+        if self.cursor_codec is not None:
+            return encode_cursor(cursor, quoted=False, encoder=self.cursor_codec.encode)
+
         return encode_cursor(cursor, quoted=self.quoted_cursor)
 
     def decode_cursor(self, cursor: str | None) -> Cursor | None:
+        if self.cursor_codec is not None:
+            return decode_cursor(cursor, to_str=self.str_cursor, quoted=False, decoder=self.cursor_codec.decode)
+
         return decode_cursor(cursor, to_str=self.str_cursor, quoted=self.quoted_cursor)
 
 
@@ -3,10 +3,12 @@ from __future__ import annotations
 __all__ = [
     "ClsNamespace",
     "CustomizedPage",
+    "CustomizedPageCacheInfo",
     "PageCls",
     "PageCustomizer",
     "PageTransformer",
     "UseAdditionalFields",
+    "UseApproximateTotal",
     "UseCursorEncoding",
     "UseExcludedFields",
     "UseFieldTypeAnnotations",
@@ -24,20 +26,26 @@ __all__ = [
     "UseRequiredFields",
     "UseResponseHeaders",
     "UseStrCursor",
+    "UseTrustedConstruction",
+    "clear_customized_page_cache",
+    "customized_page_cache_info",
     "get_page_bases",
     "new_page_cls",
 ]
 from abc import abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from copy import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
 from types import new_class
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Generic,
+    NamedTuple,
     Protocol,
     TypeAlias,
     TypeVar,
@@ -48,12 +56,12 @@ from typing import (
 
 from fastapi import Query
 from fastapi.params import Param
-from pydantic import BaseModel, ConfigDict, RootModel, create_model
+from pydantic import BaseModel, ConfigDict, Field, RootModel, create_model
 from typing_extensions import Self, Unpack
 
 from .api import response
 from .bases import AbstractPage, AbstractParams, BaseAbstractPage, BaseRawParams
-from .cursor import CursorDecoder, CursorEncoder
+from .cursor import CursorCodec, CursorDecoder, CursorEncoder
 from .pydantic import (
     get_field_tp,
     get_model_fields,
@@ -96,6 +104,82 @@ def new_page_cls(cls: TPage, new_ns: ClsNamespace) -> TPage:
     return cast(TPage, new_cls)
 
 
+class CustomizedPageCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+# least recently used pages are evicted, so customizing pages in a loop doesn't grow the cache forever
+_PAGE_CACHE_MAXSIZE = 256
+
+_page_cache: OrderedDict[Any, PageCls] = OrderedDict()
+_page_cache_hits = 0
+_page_cache_misses = 0
+
+
+class _UnhashableError(Exception):
+    pass
+
+
+def _freeze(value: Any) -> Any:
+    match value:
+        case dict():
+            return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+        case list() | tuple():
+            return (type(value), tuple(_freeze(v) for v in value))
+        case set() | frozenset():
+            return frozenset(_freeze(v) for v in value)
+
+    # functions are hashed by identity, so a new closure or lambda would produce a new key on each call
+    if callable(value) and not isinstance(value, type):
+        raise _UnhashableError
+
+    try:
+        hash(value)
+    except TypeError:
+        raise _UnhashableError from None
+
+    return value
+
+
+def _customizer_key(customizer: Any) -> Any:
+    if is_dataclass(customizer):
+        state = {field.name: getattr(customizer, field.name) for field in fields(customizer)}
+    else:
+        state = vars(customizer)
+
+    return type(customizer), _freeze(state)
+
+
+def _page_cache_key(page_cls: PageCls, customizers: Sequence[Any]) -> Any | None:
+    try:
+        return page_cls, tuple(_customizer_key(customizer) for customizer in customizers)
+    except _UnhashableError:
+        return None
+
+
+@cache
+def _is_customizer_type(tp: type[Any], /) -> bool:
+    # runtime protocol isinstance checks are slow, and customizers protocols have only methods
+    return issubclass(tp, (PageCustomizer, PageTransformer, PostPageTransformer))
+
+
+def customized_page_cache_info() -> CustomizedPageCacheInfo:
+    return CustomizedPageCacheInfo(
+        hits=_page_cache_hits,
+        misses=_page_cache_misses,
+        currsize=len(_page_cache),
+    )
+
+
+def clear_customized_page_cache() -> None:
+    global _page_cache_hits, _page_cache_misses  # noqa: PLW0603
+
+    _page_cache.clear()
+    _page_cache_hits = _page_cache_misses = 0
+
+
 def new_params_cls(cls: type[AbstractParams], new_ns: ClsNamespace) -> type[AbstractParams]:
     new_cls = new_class(
         new_ns.get("__name__", cls.__name__),
@@ -111,7 +195,9 @@ if TYPE_CHECKING:
 else:
 
     class CustomizedPage:
-        def __class_getitem__(cls, item: Any) -> Any:  # noqa: C901
+        def __class_getitem__(cls, item: Any) -> Any:
+            global _page_cache_hits, _page_cache_misses  # noqa: PLW0603
+
             if not isinstance(item, tuple):
                 item = (item,)
 
@@ -123,13 +209,33 @@ else:
             if not customizers:
                 return page_cls
 
-            original_name = page_cls.__name__.removesuffix("Customized")
-            cls_name = f"{original_name}Customized"
-
             for customizer in customizers:
-                if not isinstance(customizer, (PageCustomizer, PageTransformer, PostPageTransformer)):
+                if not _is_customizer_type(type(customizer)):
                     raise TypeError(f"Expected PageCustomizer or PageTransformer, got {customizer!r}")
 
+            # customizers with unhashable state or functions in it (callbacks, lambdas, etc.) are not cached
+            key = _page_cache_key(page_cls, customizers)
+            if key is not None and (cached := _page_cache.get(key)) is not None:
+                _page_cache.move_to_end(key)
+                _page_cache_hits += 1
+                return cached
+
+            _page_cache_misses += 1
+
+            new_cls = cls._create(page_cls, customizers, module=get_caller())
+            if key is not None:
+                new_cls = _page_cache.setdefault(key, new_cls)
+
+                if len(_page_cache) > _PAGE_CACHE_MAXSIZE:
+                    _page_cache.popitem(last=False)
+
+            return new_cls
+
+        @staticmethod
+        def _create(page_cls: PageCls, customizers: Sequence[Any], module: str | None) -> PageCls:
+            original_name = page_cls.__name__.removesuffix("Customized")
+            cls_name = f"{original_name}Customized"
+
             for customizer in customizers:
                 if isinstance(customizer, PageTransformer):
                     page_cls = customizer.transform_page_cls(page_cls)
@@ -137,7 +243,7 @@ else:
             new_ns = {
                 "__name__": cls_name,
                 "__qualname__": cls_name,
-                "__module__": get_caller(),
+                "__module__": module,
                 "__params_type__": page_cls.__params_type__,
                 "__model_aliases__": copy(page_cls.__model_aliases__),
                 "__model_exclude__": copy(page_cls.__model_exclude__),
@@ -148,7 +254,11 @@ else:
                 if isinstance(customizer, PageCustomizer):
                     customizer.customize_page_ns(page_cls, new_ns)
 
-            params_type = new_params_cls(cast(type[AbstractParams], new_ns["__params_type__"]), {"__page_type__": None})
+            params_ns: ClsNamespace = {"__page_type__": None}
+            if new_ns["model_config"].get("defer_build"):
+                params_ns["model_config"] = {"defer_build": True}
+
+            params_type = new_params_cls(cast(type[AbstractParams], new_ns["__params_type__"]), params_ns)
             new_ns["__params_type__"] = params_type
 
             new_cls = new_page_cls(page_cls, new_ns)
@@ -290,9 +400,10 @@ class UseIncludeTotal(PageCustomizer):
 class UseCursorEncoding(PageCustomizer):
     encoder: CursorEncoder | None = None
     decoder: CursorDecoder | None = None
+    codec: CursorCodec | None = None
 
     def customize_page_ns(self, page_cls: PageCls, ns: ClsNamespace) -> None:
-        if not (self.encoder or self.decoder):
+        if not (self.encoder or self.decoder or self.codec):
             return
 
         if TYPE_CHECKING:
@@ -303,6 +414,8 @@ class UseCursorEncoding(PageCustomizer):
         src = self
 
         class CustomizedParams(CursorParams):
+            cursor_codec: ClassVar[CursorCodec | None] = src.codec or CursorParams.cursor_codec
+
             def encode_cursor(self, cursor: Cursor | None) -> str | None:
                 if src.encoder:
                     return src.encoder(self, cursor)
@@ -350,6 +463,21 @@ class UseStrCursor(PageCustomizer):
         ns["__params_type__"] = CustomizedParams
 
 
+@dataclass
+class UseTrustedConstruction(PageCustomizer):
+    """
+    Create pages without validation when items already have the page item type.
+
+    Page fields are built by pagination itself, so validation can be skipped for them.
+    Items of other types (ORM objects, dicts, etc.) are still validated as usual.
+    """
+
+    trusted: bool = True
+
+    def customize_page_ns(self, page_cls: PageCls, ns: ClsNamespace) -> None:
+        ns["__trusted_construction__"] = self.trusted
+
+
 @dataclass
 class UseParams(PageCustomizer):
     params: type[AbstractParams]
@@ -469,6 +597,21 @@ class UseFieldTypeAnnotations(PageCustomizer):
         anns.update(self.anns)
 
 
+@dataclass
+class UseApproximateTotal(PageCustomizer):
+    field: str = "total_is_approximate"
+
+    def customize_page_ns(self, page_cls: PageCls, ns: ClsNamespace) -> None:
+        field = Field(
+            default=False,
+            description="Whether total is estimated using database statistics",
+            validation_alias="total_is_approximate",
+        )
+
+        customizer = UseAdditionalFields(**{self.field: (bool, field)})
+        customizer.customize_page_ns(page_cls, ns)
+
+
 @dataclass
 class UseResponseHeaders(PageCustomizer):
     resolver: Callable[[AbstractPage[Any]], dict[str, str | Sequence[str]]]
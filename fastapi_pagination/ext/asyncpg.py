@@ -1,5 +1,6 @@
-__all__ = ["apaginate"]
+__all__ = ["apaginate", "astream_paginate"]
 
+from collections.abc import AsyncIterator
 from functools import partial
 from typing import Any
 
@@ -7,11 +8,21 @@ from asyncpg import Connection
 
 from fastapi_pagination.bases import AbstractParams, RawParams
 from fastapi_pagination.config import Config
-from fastapi_pagination.flow import flow, flow_expr, run_async_flow
-from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.flow import flow, run_async_flow
+from fastapi_pagination.flows import InlineTotal, TotalFlow, approximate_total_flow, generic_flow
+from fastapi_pagination.streaming import StreamingFormat, StreamingPageResponse, create_streaming_page
 from fastapi_pagination.types import AdditionalData, AsyncItemsTransformer
+from fastapi_pagination.utils import verify_params
 
-from .raw_sql import create_count_query_from_text, create_paginate_query_from_text
+from .raw_sql import (
+    create_bound_paginate_query_from_text,
+    create_count_query_from_text,
+    create_explain_query_from_text,
+    get_explain_plan_rows,
+    pop_inline_count,
+)
+
+_APPROXIMATE_TOTAL_THRESHOLD = 10_000
 
 
 @flow
@@ -20,10 +31,39 @@ def _asyncpg_limit_offset_flow(
     query: str,
     args: tuple[Any, ...],
     raw_params: RawParams,
+    *,
+    inline_count: bool = False,
 ) -> Any:
-    items = yield conn.fetch(create_paginate_query_from_text(query, raw_params), *args)
+    with_inline_count = inline_count and raw_params.include_total
+
+    # limit and offset are bind params, so query text is the same for all pages and prepared statement is reused
+    paginate_query, paginate_args = create_bound_paginate_query_from_text(
+        query,
+        raw_params,
+        args,
+        style="numeric",
+        inline_count=with_inline_count,
+    )
+    records = yield conn.fetch(paginate_query, *paginate_args)
+
+    # records are converted using items() iterator, it's faster than lookup of each key by name
+    rows = [dict(r.items()) for r in records]
+    if with_inline_count:
+        return InlineTotal(rows, pop_inline_count(rows))
 
-    return [{**r} for r in items]
+    return rows
+
+
+@flow
+def _asyncpg_total_flow(conn: Connection, query: str, args: tuple[Any, ...]) -> TotalFlow:
+    total = yield conn.fetchval(create_count_query_from_text(query), *args)
+    return total
+
+
+@flow
+def _asyncpg_estimate_total_flow(conn: Connection, query: str, args: tuple[Any, ...]) -> TotalFlow:
+    plan = yield conn.fetchval(create_explain_query_from_text(query), *args)
+    return get_explain_plan_rows(plan)
 
 
 # FIXME: find a way to parse raw sql queries
@@ -35,15 +75,67 @@ async def apaginate(
     params: AbstractParams | None = None,
     additional_data: AdditionalData | None = None,
     config: Config | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
+    inline_count: bool = False,
 ) -> Any:
+    total_flow = partial(_asyncpg_total_flow, conn, query, args)
+    if approximate_total:
+        total_flow = partial(
+            approximate_total_flow,
+            partial(_asyncpg_estimate_total_flow, conn, query, args),
+            total_flow,
+            threshold=approximate_total_threshold,
+        )
+
     return await run_async_flow(
         generic_flow(
             async_=True,
-            limit_offset_flow=partial(_asyncpg_limit_offset_flow, conn, query, args),
-            total_flow=flow_expr(lambda: conn.fetchval(create_count_query_from_text(query), *args)),
+            limit_offset_flow=partial(_asyncpg_limit_offset_flow, conn, query, args, inline_count=inline_count),
+            total_flow=total_flow,
+            inline_total=inline_count,
             params=params,
             transformer=transformer,
             additional_data=additional_data,
             config=config,
         )
     )
+
+
+async def astream_paginate(
+    conn: Connection,
+    query: str,
+    *args: Any,
+    params: AbstractParams | None = None,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    transformer: AsyncItemsTransformer | None = None,
+) -> StreamingPageResponse:
+    """
+    Paginate query and stream page rows as NDJSON or CSV.
+
+    Rows are fetched using server-side cursor (`conn.cursor()`) by chunks of `chunk_size`
+    while the response is being sent, so `conn` should stay open until the response is finished.
+    """
+    params, raw_params = verify_params(params, "limit-offset")
+
+    total = None
+    if raw_params.include_total:
+        total = await run_async_flow(_asyncpg_total_flow(conn, query, args))
+
+    async def _items() -> AsyncIterator[Any]:
+        paginate_query, paginate_args = create_bound_paginate_query_from_text(query, raw_params, args, style="numeric")
+
+        # cursors can be used only inside a transaction
+        async with conn.transaction():
+            async for record in conn.cursor(paginate_query, *paginate_args, prefetch=chunk_size):
+                yield dict(record.items())
+
+    return create_streaming_page(
+        _items(),
+        total=total,
+        params=params,
+        format=format,
+        chunk_size=chunk_size,
+        transformer=transformer,
+    )
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 __all__ = ["apaginate"]
 
-import inspect
+import warnings
+from contextlib import suppress
 from copy import copy
+from functools import partial
 from typing import Any, Literal, TypeVar
 
 from beanie import Document, PydanticObjectId
@@ -12,19 +14,54 @@ from beanie.odm.interfaces.aggregate import DocumentProjectionType
 from beanie.odm.queries.aggregation import AggregationQuery
 from beanie.odm.queries.find import FindMany
 from beanie.odm.utils.projection import get_projection
+from bson import ObjectId
 from bson.errors import InvalidId
+from pydantic import BaseModel
 from pymongo.asynchronous.client_session import AsyncClientSession
 
-from fastapi_pagination.api import apply_items_transformer, create_page
-from fastapi_pagination.bases import AbstractParams, is_cursor, is_limit_offset
-from fastapi_pagination.ext.mongo import AggrPipelineTransformer
-from fastapi_pagination.ext.utils import get_mongo_pipeline_filter_end
-from fastapi_pagination.types import AdditionalData, AsyncItemsTransformer
-from fastapi_pagination.utils import async_resolve_additional_data, verify_params
+from fastapi_pagination.bases import AbstractParams, RawParams
+from fastapi_pagination.config import Config
+from fastapi_pagination.ext.mongo import (
+    AggrPipelineTransformer,
+    KeysetOrdering,
+    aggregate_flow,
+    create_projection,
+    find_cursor_flow,
+)
+from fastapi_pagination.ext.utils import resolve_items_fields
+from fastapi_pagination.flow import flow, flow_expr, run_async_flow
+from fastapi_pagination.flows import LimitOffsetFlow, generic_flow
+from fastapi_pagination.keyset import KeysetCursor, decode_keyset_cursor
+from fastapi_pagination.total_cache import create_total_cache_key
+from fastapi_pagination.types import AdditionalData, AsyncItemsTransformer, Cursor
 
 TDocument = TypeVar("TDocument", bound=Document)
 
 
+def _copy_find_query(query: FindMany[Any]) -> FindMany[Any]:
+    # find query methods mutate the query in place, so the original query is never modified
+    query = copy(query)
+    query.find_expressions = [*query.find_expressions]
+    query.sort_expressions = [*query.sort_expressions]
+    query.pymongo_kwargs = {**query.pymongo_kwargs}
+
+    return query
+
+
+def _total_cache_key(document_model: type[Document], query: Any) -> str:
+    return create_total_cache_key("beanie", document_model.get_pymongo_collection().full_name, query)
+
+
+def _find_total_cache_key(query: FindMany[Any]) -> str:
+    return _total_cache_key(query.document_model, _copy_find_query(query).get_filter_query())
+
+
+@flow
+def _find_limit_offset_flow(query: FindMany[Any], raw_params: RawParams) -> LimitOffsetFlow:
+    items = yield _copy_find_query(query).skip(raw_params.offset).limit(raw_params.limit).to_list()
+    return items
+
+
 def parse_cursor(cursor: str) -> PydanticObjectId:
     try:
         return PydanticObjectId(cursor.split("_", 1)[-1])
@@ -32,9 +69,137 @@ def parse_cursor(cursor: str) -> PydanticObjectId:
         raise ValueError("Invalid cursor") from exc
 
 
-# TODO: simplify this function using flows
-# TODO: refactor it before 0.16.0 release
-async def apaginate(  # noqa: C901, PLR0912, PLR0915
+def _decode_cursor(cursor: Cursor | None) -> KeysetCursor:
+    if isinstance(cursor, bytes):
+        cursor = cursor.decode()
+
+    # cursors of previous versions are "<id>" and "prev_<id>", they are decoded as keyset cursors by _id
+    if cursor and (cursor.startswith("prev_") or ObjectId.is_valid(cursor)):
+        with suppress(ValueError):
+            key = parse_cursor(cursor)
+
+            warnings.warn(
+                "Beanie cursors in '<id>' and 'prev_<id>' format are deprecated, "
+                "they are supported only for queries sorted by '_id'",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return KeysetCursor(key=(key,), backwards=cursor.startswith("prev_"))
+
+    return decode_keyset_cursor(cursor)
+
+
+def _verify_projection_model(model: type[BaseModel], ordering: KeysetOrdering) -> None:
+    # cursors are built from sort field values of parsed documents, fields that are not part
+    # of the projection model are dropped by validation, even if they are added to the projection
+    if model.model_config.get("extra") == "allow":
+        return
+
+    fields = {*model.model_fields, *(info.alias for info in model.model_fields.values() if info.alias)}
+    missing = [field for field, _ in ordering if field.split(".", 1)[0] not in fields]
+
+    if missing:
+        raise ValueError(
+            f"Cursor pagination requires sort fields to be part of the projection model, missing: {', '.join(missing)}"
+        )
+
+
+def _find_documents(
+    query: FindMany[Any],
+    keyset_filter: dict[str, Any] | None,
+    ordering: KeysetOrdering,
+    limit: int,
+) -> Any:
+    _verify_projection_model(query.projection_model, ordering)
+
+    query = _copy_find_query(query)
+    query.sort_expressions = [*ordering]  # type: ignore[ty:invalid-assignment]
+
+    if keyset_filter is not None:
+        query = query.find(keyset_filter)
+
+    return query.limit(limit).to_list()
+
+
+def _find_flow(
+    query: TDocument | FindMany[TDocument],
+    params: AbstractParams | None,
+    *,
+    transformer: AsyncItemsTransformer | None,
+    additional_data: AdditionalData | None,
+    config: Config | None,
+    **find_kwargs: Any,
+) -> Any:
+    if isinstance(query, FindMany):
+        query = _copy_find_query(query)
+
+    find_query = query.find_many(**find_kwargs)
+
+    return generic_flow(
+        async_=True,
+        limit_offset_flow=partial(_find_limit_offset_flow, find_query),
+        cursor_flow=partial(
+            find_cursor_flow,
+            partial(_find_documents, find_query),
+            find_query.sort_expressions,
+            decode_cursor=_decode_cursor,
+        ),
+        total_flow=flow_expr(lambda: _copy_find_query(find_query).count()),
+        total_cache_key=partial(_find_total_cache_key, find_query),
+        params=params,
+        transformer=transformer,
+        additional_data=additional_data,
+        config=config,
+    )
+
+
+def _aggregate_flow(
+    query: AggregationQuery[Any],
+    params: AbstractParams | None,
+    *,
+    transformer: AsyncItemsTransformer | None,
+    additional_data: AdditionalData | None,
+    aggregation_filter_end: int | Literal["auto"] | None,
+    aggregation_pipeline_transformer: AggrPipelineTransformer | None,
+    use_facet: bool,
+    config: Config | None,
+) -> Any:
+    # projection is pushed down to the page documents, beanie would append it after the whole pipeline
+    # that breaks $facet as it changes the document structure, see https://github.com/uriyyo/fastapi-pagination/issues/1514
+    if query.projection_model is not None:
+        projection = get_projection(query.projection_model)
+    else:
+        projection = create_projection(resolve_items_fields(params, config, transformer=transformer))
+
+    query = query.clone()
+    query.projection_model = None
+    pipeline = query.get_aggregation_pipeline()
+
+    # filter end is relative to the user pipeline, while find query is prepended to it as $match stage
+    if isinstance(aggregation_filter_end, int) and aggregation_filter_end >= 0:
+        aggregation_filter_end += len(pipeline) - len(query.aggregation_pipeline)
+
+    return aggregate_flow(
+        partial(
+            query.document_model.get_pymongo_collection().aggregate,
+            session=query.session,
+            **query.pymongo_kwargs,
+        ),
+        pipeline,
+        total_cache_key=partial(_total_cache_key, query.document_model),
+        async_=True,
+        params=params,
+        transformer=transformer,
+        additional_data=additional_data,
+        aggregation_filter_end=aggregation_filter_end,
+        aggregation_pipeline_transformer=aggregation_pipeline_transformer,
+        projection=projection,
+        use_facet=use_facet,
+        config=config,
+    )
+
+
+async def apaginate(
     query: TDocument | FindMany[TDocument] | AggregationQuery[TDocument],
     params: AbstractParams | None = None,
     *,
@@ -48,184 +213,37 @@ async def apaginate(  # noqa: C901, PLR0912, PLR0915
     lazy_parse: bool = False,
     aggregation_filter_end: int | Literal["auto"] | None = None,
     aggregation_pipeline_transformer: AggrPipelineTransformer | None = None,
+    use_facet: bool = True,
+    config: Config | None = None,
     **pymongo_kwargs: Any,
 ) -> Any:
-    params, raw_params = verify_params(params, "limit-offset", "cursor")
-
-    cursor = getattr(raw_params, "cursor", None)
     if isinstance(query, AggregationQuery):
-        aggregation_query = query.clone()
-
-        # Get the projection from the query's projection_model if it exists.
-        # We need to include it inside the $facet's data pipeline because Beanie
-        # appends $project at the end of the pipeline (after $facet), which breaks
-        # the aggregation since $facet changes the document structure.
-        # See: https://github.com/uriyyo/fastapi-pagination/issues/1514
-        projection_pipeline: list[dict[str, Any]] = []
-        if aggregation_query.projection_model is not None:
-            projection = get_projection(aggregation_query.projection_model)
-            if projection is not None:
-                projection_pipeline = [{"$project": projection}]
-            # Clear the projection_model so Beanie doesn't append $project after $facet
-            aggregation_query.projection_model = None
-
-        paginate_data: list[dict[str, Any]] = []
-        if is_limit_offset(raw_params):
-            if raw_params.limit is not None:
-                paginate_data.append({"$limit": raw_params.limit + (raw_params.offset or 0)})
-            if raw_params.offset is not None:
-                paginate_data.append({"$skip": raw_params.offset})
-        elif cursor:
-            if cursor.startswith("prev_"):
-                paginate_data.append(
-                    {
-                        "_id": {
-                            "$lt": parse_cursor(cursor),
-                        },
-                    },
-                )
-            else:
-                paginate_data.append(
-                    {
-                        "_id": {
-                            "$gt": parse_cursor(cursor),
-                        },
-                    },
-                )
-        if aggregation_filter_end is not None:
-            if aggregation_filter_end == "auto":
-                aggregation_filter_end = get_mongo_pipeline_filter_end(aggregation_query.aggregation_pipeline)
-            filter_part = aggregation_query.aggregation_pipeline[:aggregation_filter_end]
-            transform_part = aggregation_query.aggregation_pipeline[aggregation_filter_end:]
-            aggregation_query.aggregation_pipeline = [
-                *filter_part,
-                {
-                    "$facet": {
-                        "metadata": [{"$count": "total"}],
-                        "data": [*paginate_data, *transform_part, *projection_pipeline],
-                    }
-                },
-            ]
-        else:
-            aggregation_query.aggregation_pipeline.extend(
-                [
-                    {"$facet": {"metadata": [{"$count": "total"}], "data": [*paginate_data, *projection_pipeline]}},
-                ],
+        return await run_async_flow(
+            _aggregate_flow(
+                query,
+                params,
+                transformer=transformer,
+                additional_data=additional_data,
+                aggregation_filter_end=aggregation_filter_end,
+                aggregation_pipeline_transformer=aggregation_pipeline_transformer,
+                use_facet=use_facet,
+                config=config,
             )
-
-        # Execute the aggregation pipeline directly using the underlying collection.
-        # We bypass Beanie's to_list() because we've already handled the projection
-        # and need to avoid Beanie appending $project after our $facet stage.
-        pipeline = aggregation_query.get_aggregation_pipeline()
-
-        if aggregation_pipeline_transformer is not None:
-            pipeline = aggregation_pipeline_transformer(pipeline)
-
-        mongo_cursor = aggregation_query.document_model.get_pymongo_collection().aggregate(
-            pipeline,
-            session=aggregation_query.session,
-            **aggregation_query.pymongo_kwargs,
         )
 
-        # in case of pymongo engine we need to await the cursor
-        if inspect.iscoroutine(mongo_cursor):
-            mongo_cursor = await mongo_cursor
-
-        data = (await mongo_cursor.to_list(length=None))[0]
-        items = data["data"]
-        if is_cursor(raw_params) and cursor and cursor.startswith("prev_"):
-            items = list(reversed(items))
-
-        try:
-            total = data["metadata"][0]["total"]
-        except IndexError:
-            total = 0
-
-        cursor_data = (
-            {
-                "next_": str(items[-1].id) if items else None,
-                "previous": f"prev_{items[0].id}" if items else None,
-            }
-            if is_cursor(raw_params)
-            else {}
+    return await run_async_flow(
+        _find_flow(
+            query,
+            params,
+            transformer=transformer,
+            additional_data=additional_data,
+            config=config,
+            projection_model=projection_model,
+            sort=sort,
+            session=session,
+            ignore_cache=ignore_cache,
+            fetch_links=fetch_links,
+            lazy_parse=lazy_parse,
+            **pymongo_kwargs,
         )
-    else:
-        # avoid original query mutation
-        count_query = copy(query)
-        query = copy(query)
-
-        if raw_params.include_total:
-            total = await count_query.find(
-                {},
-                session=session,
-                ignore_cache=ignore_cache,
-                fetch_links=fetch_links,
-                **pymongo_kwargs,
-            ).count()
-        else:
-            total = None
-
-        cursor_data: dict[str, Any] = {}
-
-        if is_limit_offset(raw_params):
-            items = await query.find_many(
-                limit=raw_params.limit,
-                skip=raw_params.offset,
-                projection_model=projection_model,
-                sort=sort,
-                session=session,
-                ignore_cache=ignore_cache,
-                fetch_links=fetch_links,
-                lazy_parse=lazy_parse,
-                **pymongo_kwargs,
-            ).to_list()
-        else:
-            query = query.find_many(
-                projection_model=projection_model,
-                sort=sort,
-                session=session,
-                ignore_cache=ignore_cache,
-                fetch_links=fetch_links,
-                lazy_parse=lazy_parse,
-                **pymongo_kwargs,
-            )
-            if cursor:
-                if cursor.startswith("prev_"):
-                    query = query.find(
-                        {
-                            "_id": {
-                                "$lt": parse_cursor(cursor),
-                            },
-                        },
-                    ).sort("-_id")
-                else:
-                    query = query.find(
-                        {
-                            "_id": {
-                                "$gt": parse_cursor(cursor),
-                            },
-                        },
-                    )
-
-            items = await query.limit(raw_params.size + 1).to_list()  # type: ignore[ty:unresolved-attribute]
-            next_link_available = items and len(items) >= raw_params.size  # type: ignore[ty:unresolved-attribute]
-            items = items[: raw_params.size]  # type: ignore[ty:unresolved-attribute]
-            if cursor and cursor.startswith("prev_"):
-                items = list(reversed(items))
-
-            cursor_data = {
-                "next_": str(items[-1].id) if next_link_available else None,
-                "previous": f"prev_{items[0].id}" if items else None,
-            }
-
-    resolved_additional_data = await async_resolve_additional_data(items, additional_data)
-    resolved_additional_data.update(cursor_data)
-
-    t_items = await apply_items_transformer(items, transformer, async_=True)
-
-    return create_page(
-        t_items,
-        total=total,
-        params=params,
-        **resolved_additional_data,
     )
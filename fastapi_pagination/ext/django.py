@@ -1,19 +1,45 @@
 __all__ = ["paginate"]
 
+from collections.abc import Sequence
 from typing import Any, TypeVar, cast
 
+from django.core.exceptions import EmptyResultSet
 from django.db.models import Model, QuerySet
 from django.db.models.base import ModelBase
 
 from fastapi_pagination.bases import AbstractParams
 from fastapi_pagination.config import Config
+from fastapi_pagination.ext.utils import resolve_items_fields
 from fastapi_pagination.flow import flow_expr, run_sync_flow
 from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.total_cache import create_total_cache_key
 from fastapi_pagination.types import SyncAdditionalData, SyncItemsTransformer
 
 T = TypeVar("T", bound=Model)
 
 
+def _total_cache_key(query_set: QuerySet) -> str:
+    # str(query) inlines params without quoting, so different filters can be rendered the same way
+    try:
+        sql, args = query_set.query.get_compiler(using=query_set.db).as_sql()
+    except EmptyResultSet:
+        sql, args = None, ()
+
+    return create_total_cache_key("django", query_set.db, sql, args)
+
+
+def _apply_only(query_set: QuerySet, fields: Sequence[str] | None) -> QuerySet:
+    if fields is None or query_set._fields is not None:  # values() and values_list() can't be deferred
+        return query_set
+
+    # properties and other non-field attributes can read any field, so everything is loaded in this case
+    concrete_fields = {field.name for field in query_set.model._meta.concrete_fields}  # type: ignore[ty:unresolved-attribute]
+    if any(field not in concrete_fields for field in fields):
+        return query_set
+
+    return query_set.only(*fields)
+
+
 def paginate(
     query: type[T] | QuerySet[T],
     params: AbstractParams | None = None,
@@ -26,11 +52,13 @@ def paginate(
         query = query.objects.all()  # type: ignore[ty:unresolved-attribute]
 
     query_set = cast(QuerySet[T], query)
+    items_query_set = _apply_only(query_set, resolve_items_fields(params, config, transformer=transformer))
 
     return run_sync_flow(
         generic_flow(
             total_flow=flow_expr(lambda: query_set.count()),
-            limit_offset_flow=flow_expr(lambda raw_params: [*query_set[raw_params.as_slice()]]),
+            total_cache_key=lambda: _total_cache_key(query_set),
+            limit_offset_flow=flow_expr(lambda raw_params: [*items_query_set[raw_params.as_slice()]]),
             params=params,
             transformer=transformer,
             additional_data=additional_data,
@@ -1,8 +1,480 @@
 __all__ = [
     "AggrPipelineTransformer",
+    "AggregateFunc",
+    "FindFunc",
+    "KeysetOrdering",
+    "add_ordering_to_projection",
+    "aggregate_cursor_flow",
+    "aggregate_flow",
+    "aggregate_items_flow",
+    "aggregate_limit_offset_flow",
+    "aggregate_total_flow",
+    "create_aggregate_pipeline",
+    "create_count_pipeline",
+    "create_keyset_filter",
+    "create_keyset_page",
+    "create_limit_offset_stages",
+    "create_projection",
+    "find_cursor_flow",
+    "get_keyset_ordering",
+    "parse_count_result",
+    "parse_facet_result",
+    "split_sort_stage",
+    "verify_keyset_cursor",
 ]
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from functools import partial
+from typing import Any, Literal, TypeAlias
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+from fastapi_pagination.bases import AbstractParams, CursorRawParams, RawParams
+from fastapi_pagination.config import Config
+from fastapi_pagination.ext.utils import get_mongo_pipeline_filter_end
+from fastapi_pagination.flow import flow
+from fastapi_pagination.flows import CursorFlow, InlineTotal, TotalFlow, generic_flow
+from fastapi_pagination.keyset import KeysetCursor, create_keyset_page_data, decode_keyset_cursor
+from fastapi_pagination.types import AdditionalData, Cursor, ItemsTransformer
 
 AggrPipelineTransformer = Callable[[list[dict[str, Any]]], list[dict[str, Any]]]
+
+# runs aggregation pipeline and returns command cursor (or awaitable that resolves to it)
+AggregateFunc: TypeAlias = Callable[[list[dict[str, Any]]], Any]
+
+KeysetOrdering: TypeAlias = list[tuple[str, int]]
+
+# runs find query with keyset filter (None for the first page), ordering and limit and returns documents
+FindFunc: TypeAlias = Callable[[dict[str, Any] | None, KeysetOrdering, int], Any]
+
+_ASCENDING = 1
+_DESCENDING = -1
+
+
+def get_keyset_ordering(sort: Any, *, backwards: bool = False) -> KeysetOrdering:
+    """
+    Normalize `find` sort or `$sort` stage specification to a list of `(field, direction)` pairs.
+
+    `_id` is added as the last field when it's missing, so the ordering is unique.
+    """
+    if not sort:
+        ordering = []
+    elif isinstance(sort, str):
+        ordering = [(sort, _ASCENDING)]
+    elif isinstance(sort, Mapping):
+        ordering = [*sort.items()]
+    else:
+        ordering = [(item, _ASCENDING) if isinstance(item, str) else (item[0], item[1]) for item in sort]
+
+    if any(direction not in (_ASCENDING, _DESCENDING) for _, direction in ordering):
+        raise ValueError("Cursor pagination supports only ascending and descending sort directions")
+
+    if all(field != "_id" for field, _ in ordering):
+        ordering.append(("_id", _ASCENDING))
+
+    if backwards:
+        ordering = [(field, -direction) for field, direction in ordering]
+
+    return ordering
+
+
+def _keyset_after(field: str, value: Any, direction: int) -> dict[str, Any] | None:
+    # null and missing values are sorted before any other value
+    if direction == _ASCENDING:
+        return {field: {"$ne": None} if value is None else {"$gt": value}}
+
+    if value is None:
+        return None
+
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def create_keyset_filter(ordering: KeysetOrdering, key: Sequence[Any]) -> dict[str, Any]:
+    """
+    Create filter that matches documents after the key in the ordering,
+    e.g. `{"$or": [{"name": {"$gt": name}}, {"name": name, "_id": {"$gt": id}}]}`.
+    """
+    branches = []
+    for i, (field, direction) in enumerate(ordering):
+        after = _keyset_after(field, key[i], direction)
+
+        if after is not None:
+            equals = {prev_field: value for (prev_field, _), value in zip(ordering[:i], key, strict=False)}
+            branches.append({**equals, **after})
+
+    if len(branches) == 1:
+        return branches[0]
+
+    return {"$or": branches}
+
+
+def _get_model_value(model: BaseModel, field: str) -> Any:
+    # documents are parsed into models by ODMs, so mongo field name can be an alias (e.g. `_id` for `id`)
+    for name, info in type(model).model_fields.items():
+        if (info.alias or name) == field:
+            return getattr(model, name)
+
+    return getattr(model, field, None)
+
+
+def _get_document_value(document: Any, field: str) -> Any:
+    value = document
+    for part in field.split("."):
+        if isinstance(value, Mapping):
+            value = value.get(part)
+        elif isinstance(value, BaseModel):
+            value = _get_model_value(value, part)
+        else:
+            return None
+
+    return value
+
+
+def verify_keyset_cursor(cursor: KeysetCursor, ordering: KeysetOrdering) -> None:
+    """
+    Raise 400 error when cursor key doesn't match the ordering.
+    """
+    if cursor.key is not None and len(cursor.key) != len(ordering):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor value",
+        )
+
+
+def create_keyset_page(
+    documents: Sequence[Any],
+    ordering: KeysetOrdering,
+    cursor: KeysetCursor,
+    size: int,
+) -> tuple[list[Any], dict[str, Any]]:
+    """
+    Create keyset page items and cursors from documents fetched with `size + 1` limit.
+
+    Sort fields should be present in the documents (or models parsed from them),
+    as cursors are built from their values.
+    """
+    keys = [tuple(_get_document_value(document, field) for field, _ in ordering) for document in documents]
+
+    further = keys[size] if len(keys) > size else None
+    items, keys = [*documents[:size]], keys[:size]
+
+    # backwards pages are fetched in reversed order and then reversed back
+    if cursor.backwards:
+        items.reverse()
+        keys.reverse()
+
+    return items, create_keyset_page_data(cursor, keys, further)
+
+
+@flow
+def find_cursor_flow(
+    find: FindFunc,
+    sort: Any,
+    raw_params: CursorRawParams,
+    *,
+    decode_cursor: Callable[[Cursor | None], KeysetCursor] = decode_keyset_cursor,
+) -> CursorFlow:
+    """
+    Keyset cursor flow for `find` queries, `find` receives keyset filter, ordering and limit of the page.
+    """
+    cursor = decode_cursor(raw_params.cursor)
+    ordering = get_keyset_ordering(sort, backwards=cursor.backwards)
+    verify_keyset_cursor(cursor, ordering)
+
+    # documents are selected by (sort fields, _id) range instead of skip, so deep pages are served by an index seek
+    keyset_filter = create_keyset_filter(ordering, cursor.key) if cursor.key is not None else None
+
+    # fetch one extra document to check if there is a further page
+    documents = yield find(keyset_filter, ordering, raw_params.size + 1)
+
+    return create_keyset_page(documents, ordering, cursor, raw_params.size)
+
+
+def create_projection(fields: Sequence[str] | None) -> dict[str, Any] | None:
+    """
+    Create inclusion projection from item fields, `None` means that whole documents should be fetched.
+    """
+    if fields is None:
+        return None
+
+    return dict.fromkeys(fields, 1)
+
+
+def _is_inclusion_projection(projection: Mapping[str, Any]) -> bool:
+    return all(value in (1, True) for field, value in projection.items() if field != "_id")
+
+
+def add_ordering_to_projection(projection: Any, ordering: KeysetOrdering) -> Any:
+    """
+    Add sort fields to inclusion projection, as cursors are built from their values.
+    """
+    if not isinstance(projection, Mapping) or not _is_inclusion_projection(projection):
+        return projection
+
+    projection = {**projection}
+    for field, _ in ordering:
+        # path collision, e.g. `a` and `a.b` can't be used in the same projection
+        if any(field.startswith(f"{key}.") or key.startswith(f"{field}.") for key in projection):
+            continue
+
+        projection[field] = 1
+
+    return projection
+
+
+def split_sort_stage(
+    pipeline: Sequence[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], Any, list[dict[str, Any]]]:
+    """
+    Split aggregation pipeline by the last `$sort` stage into stages before it, sort specification and stages after it.
+    """
+    for i in reversed(range(len(pipeline))):
+        if "$sort" in pipeline[i]:
+            return [*pipeline[:i]], pipeline[i]["$sort"], [*pipeline[i + 1 :]]
+
+    return [*pipeline], None, []
+
+
+def create_limit_offset_stages(raw_params: RawParams) -> list[dict[str, Any]]:
+    stages: list[dict[str, Any]] = []
+    if raw_params.limit is not None:
+        stages.append({"$limit": raw_params.limit + (raw_params.offset or 0)})
+    if raw_params.offset is not None:
+        stages.append({"$skip": raw_params.offset})
+
+    return stages
+
+
+def create_aggregate_pipeline(
+    pipeline: Sequence[dict[str, Any]],
+    data_pipeline: Sequence[dict[str, Any]],
+    *,
+    with_facet: bool,
+) -> list[dict[str, Any]]:
+    """
+    Create pipeline that returns page documents.
+
+    With `$facet` documents are returned together with the total in a single document (see `parse_facet_result`),
+    otherwise page documents are returned as is and can be fetched by batches.
+    """
+    if not with_facet:
+        return [*pipeline, *data_pipeline]
+
+    return [
+        *pipeline,
+        {
+            "$facet": {
+                "metadata": [{"$count": "total"}],
+                "data": [*data_pipeline],
+            },
+        },
+    ]
+
+
+def parse_facet_result(documents: Sequence[Any]) -> tuple[list[Any], int]:
+    data, *_ = documents
+
+    try:
+        total = data["metadata"][0]["total"]
+    except IndexError:
+        total = 0
+
+    return data["data"], total
+
+
+def create_count_pipeline(pipeline: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [*pipeline, {"$count": "total"}]
+
+
+def parse_count_result(documents: Sequence[Any]) -> int:
+    return documents[0]["total"] if documents else 0
+
+
+def _create_data_pipeline(
+    stages: Sequence[dict[str, Any]],
+    transform_part: Sequence[dict[str, Any]],
+    projection: Mapping[str, Any] | None,
+) -> list[dict[str, Any]]:
+    # projection is applied only to the page documents, after all filtering and transforming stages
+    projection_stages = [{"$project": {**projection}}] if projection is not None else []
+    return [*stages, *transform_part, *projection_stages]
+
+
+@flow
+def aggregate_items_flow(
+    aggregate: AggregateFunc,
+    pipeline: Sequence[dict[str, Any]],
+    data_pipeline: Sequence[dict[str, Any]],
+    *,
+    with_facet: bool,
+) -> Any:
+    """
+    Fetch page documents, returns `(items, total)` pair, total is `None` when `$facet` isn't used.
+    """
+    cursor = yield aggregate(create_aggregate_pipeline(pipeline, data_pipeline, with_facet=with_facet))
+    documents = yield cursor.to_list(length=None)
+
+    if with_facet:
+        return parse_facet_result(documents)
+
+    return documents, None
+
+
+@flow
+def aggregate_limit_offset_flow(
+    aggregate: AggregateFunc,
+    pipeline: Sequence[dict[str, Any]],
+    raw_params: RawParams,
+    *,
+    use_facet: bool,
+    aggregation_filter_end: int | Literal["auto"] | None = None,
+    projection: Mapping[str, Any] | None = None,
+) -> Any:
+    pipeline = [*pipeline]
+    transform_part: list[dict[str, Any]] = []
+
+    if aggregation_filter_end is not None:
+        if aggregation_filter_end == "auto":
+            aggregation_filter_end = get_mongo_pipeline_filter_end(pipeline)
+
+        pipeline, transform_part = pipeline[:aggregation_filter_end], pipeline[aggregation_filter_end:]
+
+    items, total = yield from aggregate_items_flow(
+        aggregate,
+        pipeline,
+        _create_data_pipeline(create_limit_offset_stages(raw_params), transform_part, projection),
+        with_facet=use_facet and raw_params.include_total,
+    )
+
+    return InlineTotal(items, total) if use_facet else items
+
+
+@flow
+def aggregate_cursor_flow(
+    aggregate: AggregateFunc,
+    pipeline: Sequence[dict[str, Any]],
+    raw_params: CursorRawParams,
+    *,
+    use_facet: bool,
+    projection: Mapping[str, Any] | None = None,
+) -> Any:
+    cursor = decode_keyset_cursor(raw_params.cursor)
+
+    # ordering is taken from the last $sort stage, stages after it are applied only to the page documents
+    pipeline, sort, transform_part = split_sort_stage(pipeline)
+    if get_mongo_pipeline_filter_end(transform_part):
+        raise ValueError(
+            "Only stages that don't change the number or order of documents ($project, $lookup, etc.) "
+            "are allowed after the last $sort stage for cursor pagination",
+        )
+
+    ordering = get_keyset_ordering(sort, backwards=cursor.backwards)
+    verify_keyset_cursor(cursor, ordering)
+
+    pipeline.append({"$sort": dict(ordering)})
+
+    # $match on sort fields is placed right after $sort, so it can be served by an index seek
+    stages: list[dict[str, Any]] = []
+    if cursor.key is not None:
+        stages.append({"$match": create_keyset_filter(ordering, cursor.key)})
+    # fetch one extra document to check if there is a further page
+    stages.append({"$limit": raw_params.size + 1})
+
+    items, total = yield from aggregate_items_flow(
+        aggregate,
+        pipeline,
+        _create_data_pipeline(stages, transform_part, add_ordering_to_projection(projection, ordering)),
+        with_facet=use_facet and raw_params.include_total,
+    )
+
+    result = create_keyset_page(items, ordering, cursor, raw_params.size)
+    return InlineTotal(result, total) if use_facet else result
+
+
+@flow
+def aggregate_total_flow(aggregate: AggregateFunc, pipeline: Sequence[dict[str, Any]]) -> TotalFlow:
+    cursor = yield aggregate(create_count_pipeline(pipeline))
+    documents = yield cursor.to_list(length=None)
+
+    return parse_count_result(documents)
+
+
+def _apply_pipeline_transformer(
+    aggregate: AggregateFunc,
+    aggregation_pipeline_transformer: AggrPipelineTransformer,
+    pipeline: list[dict[str, Any]],
+) -> Any:
+    return aggregate(aggregation_pipeline_transformer(pipeline))
+
+
+@flow
+def aggregate_flow(
+    aggregate: AggregateFunc,
+    pipeline: Sequence[dict[str, Any]],
+    *,
+    total_cache_key: Callable[[list[dict[str, Any]]], str],
+    async_: bool,
+    params: AbstractParams | None = None,
+    transformer: ItemsTransformer | None = None,
+    additional_data: AdditionalData | None = None,
+    aggregation_filter_end: int | Literal["auto"] | None = None,
+    aggregation_pipeline_transformer: AggrPipelineTransformer | None = None,
+    projection: Mapping[str, Any] | None = None,
+    use_facet: bool = True,
+    config: Config | None = None,
+) -> Any:
+    """
+    Paginate aggregation pipeline, used by all Mongo integrations.
+
+    Args:
+        aggregate: function that runs pipeline, e.g. `collection.aggregate`.
+        pipeline: aggregation pipeline to paginate.
+        total_cache_key: function that creates total cache key from the count pipeline.
+        aggregation_filter_end: index of the first stage that doesn't filter documents,
+            stages from it are applied only to the page documents. `"auto"` detects it from the pipeline.
+        aggregation_pipeline_transformer: function applied to every pipeline before it's run.
+        projection: `$project` specification applied to the page documents.
+        use_facet: whether total should be fetched together with items using `$facet`.
+    """
+    if aggregation_pipeline_transformer is not None:
+        aggregate = partial(_apply_pipeline_transformer, aggregate, aggregation_pipeline_transformer)
+
+    # cached total is not counted again, so plain pipeline is used to fetch items
+    use_facet = use_facet and (config is None or config.total_cache is None)
+
+    def _total_cache_key() -> str:
+        count_pipeline = create_count_pipeline(pipeline)
+        if aggregation_pipeline_transformer is not None:
+            count_pipeline = aggregation_pipeline_transformer(count_pipeline)
+
+        return total_cache_key(count_pipeline)
+
+    page = yield from generic_flow(
+        async_=async_,
+        limit_offset_flow=partial(
+            aggregate_limit_offset_flow,
+            aggregate,
+            pipeline,
+            use_facet=use_facet,
+            aggregation_filter_end=aggregation_filter_end,
+            projection=projection,
+        ),
+        cursor_flow=partial(
+            aggregate_cursor_flow,
+            aggregate,
+            pipeline,
+            use_facet=use_facet,
+            projection=projection,
+        ),
+        # with $facet total is fetched together with items, otherwise it's counted by a separate pipeline
+        total_flow=partial(aggregate_total_flow, aggregate, pipeline),
+        total_cache_key=_total_cache_key,
+        inline_total=use_facet,
+        params=params,
+        transformer=transformer,
+        additional_data=additional_data,
+        config=config,
+    )
+
+    return page
@@ -1,5 +1,6 @@
 __all__ = ["paginate"]
 
+from collections.abc import Sequence
 from functools import partial
 from typing import Any, TypeVar
 
@@ -8,6 +9,8 @@ from mongoengine.base.metaclasses import TopLevelDocumentMetaclass
 
 from fastapi_pagination.bases import AbstractParams, RawParams
 from fastapi_pagination.config import Config
+from fastapi_pagination.ext.mongo import KeysetOrdering, find_cursor_flow
+from fastapi_pagination.ext.utils import resolve_items_fields
 from fastapi_pagination.flow import flow, flow_expr, run_sync_flow
 from fastapi_pagination.flows import LimitOffsetFlow, generic_flow
 from fastapi_pagination.types import SyncAdditionalData, SyncItemsTransformer
@@ -15,6 +18,46 @@ from fastapi_pagination.types import SyncAdditionalData, SyncItemsTransformer
 T = TypeVar("T", bound=TopLevelDocumentMetaclass)
 
 
+def _apply_only(query: QuerySet, fields: Sequence[str] | None) -> QuerySet:
+    if fields is None:
+        return query
+
+    # item fields are mongo keys, but only() accepts document field names
+    names = {field.db_field: name for name, field in query._document._fields.items()}
+    if any(field not in names for field in fields):
+        return query
+
+    return query.only(*(names[field] for field in fields))
+
+
+def _get_sort(query: QuerySet) -> KeysetOrdering:
+    # explicit order_by() ordering or default one from document meta, mongo keys are used in both
+    if query._ordering is not None:
+        return query._ordering
+
+    return query._get_order_by(query._document._meta.get("ordering") or [])
+
+
+def _find_documents(
+    query: QuerySet,
+    fields: Sequence[str] | None,
+    keyset_filter: dict[str, Any] | None,
+    ordering: KeysetOrdering,
+    limit: int,
+) -> list[Any]:
+    if keyset_filter is not None:
+        query = query.filter(__raw__=keyset_filter)
+
+    # sort fields are loaded as cursors are built from their values
+    if fields is not None:
+        fields = [*fields, *(field for field, _ in ordering if field not in fields)]
+
+    keys = [f"{'+' if direction > 0 else '-'}{field}" for field, direction in ordering]
+
+    # raw documents are used, as to_mongo() can omit _id that is needed for cursors
+    return [*_apply_only(query, fields).order_by(*keys).limit(limit).as_pymongo()]
+
+
 @flow
 def _limit_offset_flow(query: QuerySet, raw_params: RawParams) -> LimitOffsetFlow:
     cursor = yield query.skip(raw_params.offset).limit(raw_params.limit)
@@ -33,10 +76,17 @@ def paginate(
     if isinstance(query, TopLevelDocumentMetaclass):
         query = query.objects().all()  # type: ignore[ty:unresolved-attribute]
 
+    fields = resolve_items_fields(params, config, transformer=transformer)
+
     return run_sync_flow(
         generic_flow(
             total_flow=flow_expr(lambda: query.count()),  # type: ignore[ty:unresolved-attribute]
-            limit_offset_flow=partial(_limit_offset_flow, query),  # type: ignore[ty:invalid-argument-type]
+            limit_offset_flow=partial(_limit_offset_flow, _apply_only(query, fields)),  # type: ignore[ty:invalid-argument-type]
+            cursor_flow=partial(
+                find_cursor_flow,
+                partial(_find_documents, query, fields),  # type: ignore[ty:invalid-argument-type]
+                _get_sort(query),  # type: ignore[ty:invalid-argument-type]
+            ),
             params=params,
             transformer=transformer,
             additional_data=additional_data,
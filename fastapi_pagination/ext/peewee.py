@@ -17,9 +17,15 @@ from peewee import Database, ModelSelect, Query
 
 from fastapi_pagination.bases import AbstractParams, RawParams
 from fastapi_pagination.config import Config
-from fastapi_pagination.ext.raw_sql import create_count_query_from_text, create_paginate_query_from_text
+from fastapi_pagination.ext.raw_sql import (
+    create_count_query_from_text,
+    create_inline_count_query_from_text,
+    create_paginate_query_from_text,
+    pop_inline_count,
+)
 from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
 from fastapi_pagination.flows import (
+    InlineTotal,
     LimitOffsetFlow,
     TotalFlow,
     generic_flow,
@@ -123,12 +129,18 @@ def _limit_offset_flow(
     raw_params: RawParams,
     *,
     prefetch: tuple[Query, ...] | None = None,
+    inline_count: bool = False,
 ) -> LimitOffsetFlow:
     if _is_raw_sql(query):
-        paginated_sql = create_paginate_query_from_text(cast(RawSQL, query), raw_params)
-        cursor = yield db.execute_sql(paginated_sql)
+        with_inline_count = inline_count and raw_params.include_total
+        create_query = create_inline_count_query_from_text if with_inline_count else create_paginate_query_from_text
+
+        cursor = yield db.execute_sql(create_query(cast(RawSQL, query), raw_params))
         columns = [desc[0] for desc in cursor.description] if cursor.description else []
         items = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+
+        if with_inline_count:
+            return InlineTotal(items, pop_inline_count(items))
     else:
         query = create_paginate_query(cast(Query, query), raw_params)
         if _is_async_db(db):
@@ -157,11 +169,16 @@ def _peewee_flow(
     transformer: ItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     config: Config | None = None,
+    inline_count: bool = False,
 ) -> Any:
+    if inline_count and not _is_raw_sql(query):
+        raise ValueError("inline_count is supported only for raw SQL queries")
+
     page = yield from generic_flow(
         async_=is_async,
         total_flow=partial(_total_flow, query, db),
-        limit_offset_flow=partial(_limit_offset_flow, query, db, prefetch=prefetch),
+        limit_offset_flow=partial(_limit_offset_flow, query, db, prefetch=prefetch, inline_count=inline_count),
+        inline_total=inline_count,
         params=params,
         inner_transformer=_inner_transformer,
         transformer=transformer,
@@ -205,6 +222,7 @@ def paginate(
     transformer: SyncItemsTransformer | None = None,
     additional_data: SyncAdditionalData | None = None,
     config: Config | None = None,
+    inline_count: bool = False,
 ) -> Any:
     pass
 
@@ -218,6 +236,7 @@ def paginate(
     transformer: SyncItemsTransformer | None = None,
     additional_data: SyncAdditionalData | None = None,
     config: Config | None = None,
+    inline_count: bool = False,
 ) -> Any:
     actual_query, actual_db = _resolve_query_and_db(query, db)
 
@@ -231,6 +250,7 @@ def paginate(
             transformer=transformer,
             additional_data=additional_data,
             config=config,
+            inline_count=inline_count,
         ),
     )
 
@@ -244,6 +264,7 @@ async def apaginate(
     transformer: AsyncItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     config: Config | None = None,
+    inline_count: bool = False,
 ) -> Any:
     if not PEEWEE_ASYNC_AVAILABLE:
         raise TypeError(
@@ -264,5 +285,6 @@ async def apaginate(
             transformer=transformer,
             additional_data=additional_data,
             config=config,
+            inline_count=inline_count,
         ),
     )
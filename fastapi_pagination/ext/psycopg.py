@@ -1,22 +1,39 @@
 __all__ = ["apaginate", "paginate"]
 
-from collections.abc import Iterator, Mapping, Sequence
+from collections import namedtuple
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from functools import partial
 from typing import Any, TypeAlias, cast
+from uuid import uuid4
 
 from psycopg import AsyncConnection, AsyncCursor, Connection, Cursor
-from psycopg.rows import AsyncRowFactory, RowFactory, tuple_row
+from psycopg.rows import AsyncRowFactory, RowFactory, namedtuple_row, tuple_row
 from psycopg.sql import SQL, Composed
 from typing_extensions import LiteralString
 
 from fastapi_pagination.bases import AbstractParams, RawParams
 from fastapi_pagination.config import Config
 from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
-from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.flows import (
+    InlineTotal,
+    LimitOffsetFlowFunc,
+    TotalFlow,
+    TotalFlowFunc,
+    approximate_total_flow,
+    batched_items_flow,
+    generic_flow,
+)
 from fastapi_pagination.types import AdditionalData, AsyncItemsTransformer, ItemsTransformer, SyncAdditionalData
 
-from .raw_sql import create_count_query_from_text, create_paginate_query_from_text
+from .raw_sql import (
+    create_bound_paginate_query_from_text,
+    create_count_query_from_text,
+    create_explain_query_from_text,
+    create_inline_count_query_from_text,
+    create_paginate_query_from_text,
+    get_explain_plan_rows,
+)
 
 _SyncConn: TypeAlias = Connection[Any] | Cursor[Any]
 _AsyncConn: TypeAlias = AsyncConnection[Any] | AsyncCursor[Any]
@@ -26,6 +43,9 @@ _InputQuery: TypeAlias = str | LiteralString | SQL | Composed
 _AnyFactory: TypeAlias = RowFactory[Any] | AsyncRowFactory[Any]
 _QueryParams: TypeAlias = Mapping[str, Any] | Sequence[Any]
 
+_APPROXIMATE_TOTAL_THRESHOLD = 10_000
+_SERVER_CURSOR_PREFIX = "__pagination_cursor"
+
 
 @contextmanager
 def _switch_factory(conn: _AnyConn, factory: _AnyFactory) -> Iterator[None]:
@@ -36,6 +56,24 @@ def _switch_factory(conn: _AnyConn, factory: _AnyFactory) -> Iterator[None]:
         conn.row_factory = original_factory  # type: ignore[ty:invalid-assignment]
 
 
+def _inline_count_row(factory: _AnyFactory) -> _AnyFactory:
+    # inline count is the last column, it's stripped before row is created, so rows are the same
+    # as for the original query, namedtuple rows are created over the original columns as they can't skip values
+    def _row_factory(cursor: Any) -> Callable[[Sequence[Any]], tuple[Any, int]]:
+        if factory is namedtuple_row:
+            names = [column.name for column in (cursor.description or ())[:-1]]
+            make_row = namedtuple("Row", names, rename=True)._make  # noqa: PYI024
+        else:
+            make_row = factory(cursor)
+
+        def _make_row(values: Sequence[Any]) -> tuple[Any, int]:
+            return make_row(values[:-1]), values[-1]
+
+        return _make_row
+
+    return cast(_AnyFactory, _row_factory)
+
+
 def _compile_query(query: _InputQuery, conn: _AnyConn) -> LiteralString:
     if isinstance(query, SQL | Composed):
         query = query.as_string(conn)
@@ -43,18 +81,128 @@ def _compile_query(query: _InputQuery, conn: _AnyConn) -> LiteralString:
     return cast(LiteralString, query)
 
 
+def _create_paginate_query(
+    query: LiteralString,
+    raw_params: RawParams,
+    args: _QueryParams | None,
+    *,
+    inline_count: bool,
+) -> tuple[LiteralString, _QueryParams | None]:
+    # query without arguments is not parsed for placeholders, so it can contain unescaped '%'
+    if args is None:
+        create_query = create_inline_count_query_from_text if inline_count else create_paginate_query_from_text
+        return cast(LiteralString, create_query(query, raw_params)), None
+
+    # limit and offset are bind params, so query text is the same for all pages and can be prepared by psycopg
+    paginate_query, paginate_args = create_bound_paginate_query_from_text(
+        query,
+        raw_params,
+        args,
+        style="pyformat" if isinstance(args, Mapping) else "format",
+        inline_count=inline_count,
+    )
+
+    return cast(LiteralString, paginate_query), paginate_args
+
+
 @flow
 def _psycopg_limit_offset_flow(
     conn: _AnyConn,
     query: _InputQuery,
     args: _QueryParams | None,
     raw_params: RawParams,
+    *,
+    inline_count: bool = False,
 ) -> Any:
-    query = _compile_query(query, conn)
-    cursor = yield conn.execute(cast(LiteralString, create_paginate_query_from_text(query, raw_params)), args)
+    with_inline_count = inline_count and raw_params.include_total
+    paginate_query, paginate_args = _create_paginate_query(
+        _compile_query(query, conn),
+        raw_params,
+        args,
+        inline_count=with_inline_count,
+    )
+
+    if with_inline_count:
+        with _switch_factory(conn, _inline_count_row(conn.row_factory)):
+            cursor = yield conn.execute(paginate_query, paginate_args)
+            rows = yield cursor.fetchall()
+
+        return InlineTotal([row for row, _ in rows], rows[-1][-1] if rows else None)
+
+    cursor = yield conn.execute(paginate_query, paginate_args)
     items = yield cursor.fetchall()
 
-    return [*items]
+    return items
+
+
+def _create_server_cursor(conn: _AnyConn) -> Cursor[Any] | AsyncCursor[Any]:
+    if isinstance(conn, Connection | AsyncConnection):
+        # server-side cursor can be used outside of transaction only if it's declared WITH HOLD
+        # name is unique, so cursors of concurrent or not closed paginations on the same connection don't clash
+        return conn.cursor(name=f"{_SERVER_CURSOR_PREFIX}_{uuid4().hex}", withhold=conn.autocommit)
+
+    # cursor is provided by user, rows are fetched by batches from the client-side result
+    return conn
+
+
+@flow
+def _psycopg_batched_limit_offset_flow(
+    conn: _AnyConn,
+    query: _InputQuery,
+    args: _QueryParams | None,
+    raw_params: RawParams,
+    *,
+    batch_size: int,
+    transformer: ItemsTransformer | None,
+    async_: bool,
+) -> Any:
+    paginate_query, paginate_args = _create_paginate_query(
+        _compile_query(query, conn),
+        raw_params,
+        args,
+        inline_count=False,
+    )
+
+    cursor = _create_server_cursor(conn)
+    try:
+        yield cursor.execute(paginate_query, paginate_args)
+
+        items = yield from batched_items_flow(
+            partial(cursor.fetchmany, batch_size),
+            transformer=transformer,
+            async_=async_,
+        )
+    finally:
+        if cursor is not conn:
+            yield cursor.close()
+
+    return items
+
+
+def _create_limit_offset_flow(
+    conn: _AnyConn,
+    query: _InputQuery,
+    args: _QueryParams | None,
+    inline_count: bool,
+    transformer: ItemsTransformer | None,
+    config: Config | None,
+    async_: bool,
+) -> LimitOffsetFlowFunc:
+    if config is None or config.fetch_batch_size is None:
+        return partial(_psycopg_limit_offset_flow, conn, query, args, inline_count=inline_count)
+
+    if inline_count:
+        raise ValueError("inline_count can't be used together with fetch_batch_size")
+
+    return partial(
+        _psycopg_batched_limit_offset_flow,
+        conn,
+        query,
+        args,
+        batch_size=config.fetch_batch_size,
+        transformer=transformer,
+        async_=async_,
+    )
 
 
 @flow
@@ -76,6 +224,41 @@ def _psycopg_total_flow(
         return None  # pragma: no cover
 
 
+@flow
+def _psycopg_estimate_total_flow(
+    conn: _AnyConn,
+    query: _InputQuery,
+    args: _QueryParams | None,
+) -> TotalFlow:
+    query = _compile_query(query, conn)
+
+    with _switch_factory(conn, tuple_row):
+        cursor = yield conn.execute(cast(LiteralString, create_explain_query_from_text(query)), args)
+        row = yield cursor.fetchone()
+
+    return get_explain_plan_rows(row[0]) if row else None
+
+
+def _create_total_flow(
+    conn: _AnyConn,
+    query: _InputQuery,
+    args: _QueryParams | None,
+    approximate_total: bool,
+    approximate_total_threshold: int,
+) -> TotalFlowFunc:
+    total_flow = partial(_psycopg_total_flow, conn, query, args)
+
+    if approximate_total:
+        return partial(
+            approximate_total_flow,
+            partial(_psycopg_estimate_total_flow, conn, query, args),
+            total_flow,
+            threshold=approximate_total_threshold,
+        )
+
+    return total_flow
+
+
 def _resolve_query_args(args: tuple[Any, ...], query_params: _QueryParams | None) -> _QueryParams | None:
     if args and query_params is not None:
         raise ValueError("Cannot use both positional query arguments and 'query_params' keyword argument")
@@ -92,14 +275,26 @@ async def apaginate(
     params: AbstractParams | None = None,
     additional_data: AdditionalData | None = None,
     config: Config | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
+    inline_count: bool = False,
 ) -> Any:
     resolved = _resolve_query_args(args, query_params)
 
     return await run_async_flow(
         generic_flow(
             async_=True,
-            limit_offset_flow=partial(_psycopg_limit_offset_flow, conn, query, resolved),
-            total_flow=partial(_psycopg_total_flow, conn, query, resolved),
+            limit_offset_flow=_create_limit_offset_flow(
+                conn,
+                query,
+                resolved,
+                inline_count,
+                transformer,
+                config,
+                async_=True,
+            ),
+            total_flow=_create_total_flow(conn, query, resolved, approximate_total, approximate_total_threshold),
+            inline_total=inline_count,
             params=params,
             transformer=transformer,
             additional_data=additional_data,
@@ -117,14 +312,26 @@ def paginate(
     params: AbstractParams | None = None,
     additional_data: SyncAdditionalData | None = None,
     config: Config | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
+    inline_count: bool = False,
 ) -> Any:
     resolved = _resolve_query_args(args, query_params)
 
     return run_sync_flow(
         generic_flow(
             async_=False,
-            limit_offset_flow=partial(_psycopg_limit_offset_flow, conn, query, resolved),
-            total_flow=partial(_psycopg_total_flow, conn, query, resolved),
+            limit_offset_flow=_create_limit_offset_flow(
+                conn,
+                query,
+                resolved,
+                inline_count,
+                transformer,
+                config,
+                async_=False,
+            ),
+            total_flow=_create_total_flow(conn, query, resolved, approximate_total, approximate_total_threshold),
+            inline_total=inline_count,
             params=params,
             transformer=transformer,
             additional_data=additional_data,
@@ -3,29 +3,72 @@ from __future__ import annotations
 __all__ = [
     "apaginate",
     "apaginate_aggregate",
+    "astream_paginate",
     "paginate",
     "paginate_aggregate",
+    "stream_paginate",
 ]
 
 
-from collections.abc import Mapping, Sequence
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from functools import partial
 from typing import Any, Literal, TypeVar
 
 from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.collection import Collection
 
-from fastapi_pagination.bases import AbstractParams
+from fastapi_pagination.bases import AbstractParams, RawParams
 from fastapi_pagination.config import Config
-from fastapi_pagination.ext.mongo import AggrPipelineTransformer
-from fastapi_pagination.ext.utils import get_mongo_pipeline_filter_end
+from fastapi_pagination.ext.mongo import (
+    AggrPipelineTransformer,
+    KeysetOrdering,
+    add_ordering_to_projection,
+    aggregate_flow,
+    create_projection,
+    find_cursor_flow,
+)
+from fastapi_pagination.ext.utils import resolve_items_fields
 from fastapi_pagination.flow import flow, flow_expr, run_async_flow, run_sync_flow
-from fastapi_pagination.flows import additional_data_flow, create_page_flow, generic_flow
-from fastapi_pagination.types import AdditionalData, ItemsTransformer, SyncAdditionalData, SyncItemsTransformer
+from fastapi_pagination.flows import TotalFlow, cached_total_flow, generic_flow
+from fastapi_pagination.streaming import StreamingFormat, StreamingPageResponse, create_streaming_page
+from fastapi_pagination.total_cache import create_total_cache_key
+from fastapi_pagination.types import (
+    AdditionalData,
+    AsyncItemsTransformer,
+    ItemsTransformer,
+    SyncAdditionalData,
+    SyncItemsTransformer,
+)
 from fastapi_pagination.utils import verify_params
 
 T = TypeVar("T", bound=Mapping[str, Any])
 
 
+def _total_cache_key(collection: Collection[T] | AsyncCollection[T], query: Any) -> str:
+    return create_total_cache_key("pymongo", collection.full_name, query)
+
+
+def _find_documents(
+    collection: Collection[T] | AsyncCollection[T],
+    query_filter: dict[Any, Any],
+    filter_fields: dict[Any, Any] | None,
+    kwargs: dict[str, Any],
+    keyset_filter: dict[str, Any] | None,
+    ordering: KeysetOrdering,
+    limit: int,
+) -> Any:
+    if keyset_filter is not None:
+        query_filter = {"$and": [query_filter, keyset_filter]} if query_filter else keyset_filter
+
+    return collection.find(
+        query_filter,
+        add_ordering_to_projection(filter_fields, ordering),
+        limit=limit,
+        sort=ordering,
+        **kwargs,
+    ).to_list()
+
+
 def paginate(
     collection: Collection[T],
     query_filter: dict[Any, Any] | None = None,
@@ -39,10 +82,13 @@ def paginate(
     **kwargs: Any,
 ) -> Any:
     query_filter = query_filter or {}
+    if filter_fields is None:
+        filter_fields = create_projection(resolve_items_fields(params, config, transformer=transformer))
 
     return run_sync_flow(
         generic_flow(
             total_flow=flow_expr(lambda: collection.count_documents(query_filter)),
+            total_cache_key=lambda: _total_cache_key(collection, query_filter),
             limit_offset_flow=flow_expr(
                 lambda raw_params: collection.find(
                     query_filter,
@@ -53,6 +99,11 @@ def paginate(
                     **kwargs,
                 ).to_list()
             ),
+            cursor_flow=partial(
+                find_cursor_flow,
+                partial(_find_documents, collection, query_filter, filter_fields, kwargs),
+                sort,
+            ),
             params=params,
             transformer=transformer,
             additional_data=additional_data,
@@ -74,10 +125,13 @@ async def apaginate(
     **kwargs: Any,
 ) -> Any:
     query_filter = query_filter or {}
+    if filter_fields is None:
+        filter_fields = create_projection(resolve_items_fields(params, config, transformer=transformer))
 
     return await run_async_flow(
         generic_flow(
             total_flow=flow_expr(lambda: collection.count_documents(query_filter)),
+            total_cache_key=lambda: _total_cache_key(collection, query_filter),
             limit_offset_flow=flow_expr(
                 lambda raw_params: collection.find(
                     query_filter,
@@ -88,6 +142,11 @@ async def apaginate(
                     **kwargs,
                 ).to_list()
             ),
+            cursor_flow=partial(
+                find_cursor_flow,
+                partial(_find_documents, collection, query_filter, filter_fields, kwargs),
+                sort,
+            ),
             params=params,
             transformer=transformer,
             additional_data=additional_data,
@@ -96,6 +155,135 @@ async def apaginate(
     )
 
 
+@flow
+def _count_documents_flow(collection: Collection[T] | AsyncCollection[T], query_filter: dict[Any, Any]) -> TotalFlow:
+    total = yield collection.count_documents(query_filter)
+    return total
+
+
+@flow
+def _streaming_total_flow(
+    collection: Collection[T] | AsyncCollection[T],
+    query_filter: dict[Any, Any],
+    raw_params: RawParams,
+    config: Config | None,
+) -> TotalFlow:
+    if not raw_params.include_total:
+        return None
+
+    total = yield from cached_total_flow(
+        partial(_count_documents_flow, collection, query_filter),
+        partial(_total_cache_key, collection, query_filter),
+        config,
+    )
+    return total
+
+
+def _find_page(
+    collection: Collection[T] | AsyncCollection[T],
+    query_filter: dict[Any, Any],
+    filter_fields: dict[Any, Any] | None,
+    raw_params: RawParams,
+    sort: Sequence[Any] | None,
+    chunk_size: int,
+    kwargs: dict[str, Any],
+) -> Any:
+    return collection.find(
+        query_filter,
+        filter_fields,
+        skip=raw_params.offset or 0,
+        limit=raw_params.limit or 0,
+        sort=sort,
+        batch_size=chunk_size,
+        **kwargs,
+    )
+
+
+def stream_paginate(
+    collection: Collection[T],
+    query_filter: dict[Any, Any] | None = None,
+    filter_fields: dict[Any, Any] | None = None,
+    params: AbstractParams | None = None,
+    sort: Sequence[Any] | None = None,
+    *,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    transformer: SyncItemsTransformer | None = None,
+    config: Config | None = None,
+    **kwargs: Any,
+) -> StreamingPageResponse:
+    """
+    Paginate collection and stream page documents as NDJSON or CSV.
+
+    Documents are read from the cursor by batches of `chunk_size` while the response is being sent,
+    so `collection` client should stay open until the response is finished.
+    """
+    query_filter = query_filter or {}
+    params, raw_params = verify_params(params, "limit-offset")
+    if filter_fields is None:
+        filter_fields = create_projection(resolve_items_fields(params, config, transformer=transformer))
+
+    total = run_sync_flow(_streaming_total_flow(collection, query_filter, raw_params, config))
+
+    def _items() -> Iterator[Any]:
+        with _find_page(collection, query_filter, filter_fields, raw_params, sort, chunk_size, kwargs) as cursor:
+            yield from cursor
+
+    return create_streaming_page(
+        _items(),
+        total=total,
+        params=params,
+        format=format,
+        chunk_size=chunk_size,
+        transformer=transformer,
+    )
+
+
+async def astream_paginate(
+    collection: AsyncCollection[T],
+    query_filter: dict[Any, Any] | None = None,
+    filter_fields: dict[Any, Any] | None = None,
+    params: AbstractParams | None = None,
+    sort: Sequence[Any] | None = None,
+    *,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    transformer: AsyncItemsTransformer | None = None,
+    config: Config | None = None,
+    **kwargs: Any,
+) -> StreamingPageResponse:
+    """
+    Paginate collection and stream page documents as NDJSON or CSV.
+
+    Documents are read from the cursor by batches of `chunk_size` while the response is being sent,
+    so `collection` client should stay open until the response is finished.
+    """
+    query_filter = query_filter or {}
+    params, raw_params = verify_params(params, "limit-offset")
+    if filter_fields is None:
+        filter_fields = create_projection(resolve_items_fields(params, config, transformer=transformer))
+
+    total = await run_async_flow(_streaming_total_flow(collection, query_filter, raw_params, config))
+
+    async def _items() -> AsyncIterator[Any]:
+        cursor = _find_page(collection, query_filter, filter_fields, raw_params, sort, chunk_size, kwargs)
+
+        try:
+            async for document in cursor:
+                yield document
+        finally:
+            await cursor.close()
+
+    return create_streaming_page(
+        _items(),
+        total=total,
+        params=params,
+        format=format,
+        chunk_size=chunk_size,
+        transformer=transformer,
+    )
+
+
 @flow
 def _aggregate_flow(
     is_async: bool,
@@ -107,57 +295,22 @@ def _aggregate_flow(
     additional_data: AdditionalData | None = None,
     aggregation_filter_end: int | Literal["auto"] | None = None,
     aggregation_pipeline_transformer: AggrPipelineTransformer | None = None,
+    use_facet: bool = True,
     config: Config | None = None,
 ) -> Any:
-    params, raw_params = verify_params(params, "limit-offset")
-    aggregate_pipeline = aggregate_pipeline or []
-
-    paginate_data = []
-    if raw_params.limit is not None:
-        paginate_data.append({"$limit": raw_params.limit + (raw_params.offset or 0)})
-    if raw_params.offset is not None:
-        paginate_data.append({"$skip": raw_params.offset})
-
-    if aggregation_filter_end is not None:
-        if aggregation_filter_end == "auto":
-            aggregation_filter_end = get_mongo_pipeline_filter_end(aggregate_pipeline)
-        transform_part = aggregate_pipeline[:aggregation_filter_end]
-        aggregate_pipeline = aggregate_pipeline[aggregation_filter_end:]
-        paginate_data.extend(transform_part)
-
-    pipeline = [
-        *aggregate_pipeline,
-        {
-            "$facet": {
-                "metadata": [{"$count": "total"}],
-                "data": paginate_data,
-            },
-        },
-    ]
-
-    if aggregation_pipeline_transformer is not None:
-        pipeline = aggregation_pipeline_transformer(pipeline)
-
-    cursor = yield collection.aggregate(pipeline)
-
-    data, *_ = yield cursor.to_list(length=None)
-
-    items = data["data"]
-    try:
-        total = data["metadata"][0]["total"]
-    except IndexError:
-        total = 0
-
-    resolved_additional_data = yield from additional_data_flow(items, additional_data)
-
-    page = yield from create_page_flow(
-        items,
-        params,
-        total=total,
+    page = yield from aggregate_flow(
+        collection.aggregate,
+        aggregate_pipeline or [],
+        total_cache_key=partial(_total_cache_key, collection),
+        projection=create_projection(resolve_items_fields(params, config, transformer=transformer)),
+        async_=is_async,
+        params=params,
         transformer=transformer,
-        additional_data=resolved_additional_data,
+        additional_data=additional_data,
+        aggregation_filter_end=aggregation_filter_end,
+        aggregation_pipeline_transformer=aggregation_pipeline_transformer,
+        use_facet=use_facet,
         config=config,
-        async_=is_async,
     )
 
     return page
@@ -172,6 +325,7 @@ async def apaginate_aggregate(
     additional_data: AdditionalData | None = None,
     aggregation_filter_end: int | Literal["auto"] | None = None,
     aggregation_pipeline_transformer: AggrPipelineTransformer | None = None,
+    use_facet: bool = True,
     config: Config | None = None,
 ) -> Any:
     return await run_async_flow(
@@ -184,6 +338,7 @@ async def apaginate_aggregate(
             additional_data=additional_data,
             aggregation_filter_end=aggregation_filter_end,
             aggregation_pipeline_transformer=aggregation_pipeline_transformer,
+            use_facet=use_facet,
             config=config,
         )
     )
@@ -198,6 +353,7 @@ def paginate_aggregate(
     additional_data: SyncAdditionalData | None = None,
     aggregation_filter_end: int | Literal["auto"] | None = None,
     aggregation_pipeline_transformer: AggrPipelineTransformer | None = None,
+    use_facet: bool = True,
     config: Config | None = None,
 ) -> Any:
     return run_sync_flow(
@@ -210,6 +366,7 @@ def paginate_aggregate(
             additional_data=additional_data,
             aggregation_filter_end=aggregation_filter_end,
             aggregation_pipeline_transformer=aggregation_pipeline_transformer,
+            use_facet=use_facet,
             config=config,
         )
     )
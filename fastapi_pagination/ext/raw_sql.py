@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 __all__ = [
+    "ParamStyle",
+    "create_bound_paginate_query_from_text",
     "create_count_query_from_text",
+    "create_explain_query_from_text",
+    "create_inline_count_query_from_text",
     "create_paginate_query_from_text",
+    "get_explain_plan_rows",
+    "pop_inline_count",
 ]
 
-from typing import TypeAlias
+import json
+import re
+from collections.abc import Mapping, MutableMapping, Sequence
+from typing import Any, Literal, TypeAlias
 
 from fastapi_pagination.bases import AbstractParams, RawParams
 
 AnyParams: TypeAlias = AbstractParams | RawParams
+QueryArgs: TypeAlias = Sequence[Any] | Mapping[str, Any]
+
+# numeric - $1, $2 (asyncpg), format - %s, pyformat - %(name)s (psycopg)
+ParamStyle: TypeAlias = Literal["numeric", "format", "pyformat"]
+
+_INLINE_COUNT_COLUMN = "__pagination_inline_count__"
+_LIMIT_ARG = "__pagination_limit__"
+_OFFSET_ARG = "__pagination_offset__"
 
 
 def _unwrap_params(params: AnyParams) -> RawParams:
@@ -31,5 +48,125 @@ def create_paginate_query_from_text(query: str, params: AnyParams) -> str:
     return f"{query} {suffix}".strip()
 
 
+_ORDER_BY_RE = re.compile(r"\border\s+by\b", re.IGNORECASE)
+_QUALIFIER_RE = re.compile(r'(?:"[^"]*"|`[^`]*`|\b[a-z_]\w*)\.(?=["`a-z_])', re.IGNORECASE)
+
+
+def _split_order_by(query: str) -> tuple[str, str | None]:
+    # find last ORDER BY that is not nested into subquery, window or string literal
+    depth = 0
+    quote = None
+    order_by_pos = None
+
+    for pos, char in enumerate(query):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0 and char in "oO" and _ORDER_BY_RE.match(query, pos):
+            order_by_pos = pos
+
+    if order_by_pos is None:
+        return query, None
+
+    return query[:order_by_pos].rstrip(), query[order_by_pos:].strip()
+
+
+def _wrap_inline_count(query: str) -> str:
+    # ordering of derived table is not guaranteed to be preserved (MySQL drops it),
+    # so ORDER BY is moved to the outer query, where only output columns are visible
+    query, order_by = _split_order_by(query.strip().rstrip(";"))
+
+    wrapped = f"SELECT *, count(*) OVER () AS {_INLINE_COUNT_COLUMN} FROM ({query}) AS __inline_count_query__"  # noqa: S608
+    if order_by is not None:
+        wrapped += f" {_QUALIFIER_RE.sub('', order_by)}"
+
+    return wrapped
+
+
+def _bind_arg(style: ParamStyle, args: list[Any] | dict[str, Any], name: str, value: Any) -> str:
+    if isinstance(args, dict):
+        args[name] = value
+        return f"%({name})s"
+
+    args.append(value)
+    return "%s" if style == "format" else f"${len(args)}"
+
+
+def create_bound_paginate_query_from_text(
+    query: str,
+    params: AnyParams,
+    args: QueryArgs,
+    *,
+    style: ParamStyle,
+    inline_count: bool = False,
+) -> tuple[str, QueryArgs]:
+    """
+    Creates paginate query with limit and offset passed as bind parameters instead of literals.
+
+    Query text is the same for all pages, so drivers can reuse prepared statements and server-side plans.
+
+    Returns:
+        tuple[str, QueryArgs]: paginate query and its arguments with limit and offset appended.
+    """
+    raw_params = _unwrap_params(params)
+
+    if inline_count:
+        query = _wrap_inline_count(query)
+
+    new_args: list[Any] | dict[str, Any] = {**args} if style == "pyformat" else [*args]  # type: ignore[ty:invalid-argument-type]
+
+    suffix = ""
+    if raw_params.limit is not None:
+        suffix += f" LIMIT {_bind_arg(style, new_args, _LIMIT_ARG, raw_params.limit)}"
+    if raw_params.offset is not None:
+        suffix += f" OFFSET {_bind_arg(style, new_args, _OFFSET_ARG, raw_params.offset)}"
+
+    return f"{query} {suffix}".strip(), new_args
+
+
+def create_inline_count_query_from_text(query: str, params: AnyParams) -> str:
+    """
+    Creates paginate query that also returns total count of rows in the last column (`count(*) OVER ()`).
+
+    Window function is evaluated before LIMIT/OFFSET, so each returned row contains the total of the whole query.
+    Top-level ORDER BY is applied to the wrapping query, so it should reference columns by their output names.
+    """
+    return create_paginate_query_from_text(_wrap_inline_count(query), params)
+
+
+def pop_inline_count(rows: Sequence[MutableMapping[str, Any]]) -> int | None:
+    """
+    Removes inline count column from rows and returns total, None is returned for empty rows.
+    """
+    total = None
+    for row in rows:
+        total = row.pop(_INLINE_COUNT_COLUMN)
+
+    return total
+
+
 def create_count_query_from_text(query: str) -> str:
     return f"SELECT count(*) FROM ({query}) AS __count_query__"  # noqa: S608
+
+
+def create_explain_query_from_text(query: str) -> str:
+    return f"EXPLAIN (FORMAT JSON) {query}"
+
+
+def get_explain_plan_rows(plan: Any) -> int | None:
+    """
+    Extract estimated rows count from the Postgres `EXPLAIN (FORMAT JSON)` output.
+    """
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (LookupError, TypeError, ValueError):
+        return None
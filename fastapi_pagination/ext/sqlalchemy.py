@@ -3,24 +3,39 @@ from __future__ import annotations
 __all__ = [
     "Selectable",
     "apaginate",
+    "astream_paginate",
     "create_count_query",
     "create_count_query_from_text",
     "create_paginate_query",
     "create_paginate_query_from_text",
+    "create_total_cache_key",
     "paginate",
+    "stream_paginate",
 ]
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import suppress
 from functools import partial
-from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar, cast, overload
-
-from sqlalchemy import func, select, text
-from sqlalchemy.engine import Connection
-from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.orm import Query, Session, aliased, noload, scoped_session
-from sqlalchemy.sql import CompoundSelect, Select
-from sqlalchemy.sql.elements import ColumnElement, TextClause
+from typing import TYPE_CHECKING, Any, Generic, Literal, NamedTuple, TypeAlias, TypeVar, cast, overload
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, false, func, inspect, literal, nulls_first, nulls_last, or_, select, text, tuple_
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.exc import InvalidRequestError, UnboundExecutionError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session, aliased, load_only, noload, scoped_session
+from sqlalchemy.sql import CompoundSelect, Select, TableClause, operators
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import (
+    ClauseElement,
+    ColumnElement,
+    Label,
+    TextClause,
+    UnaryExpression,
+    _label_reference,
+    _textual_label_reference,
+)
 from sqlalchemy.sql.util import ColumnAdapter
 from typing_extensions import TypeVarTuple, Unpack, deprecated
 
@@ -29,13 +44,21 @@ from fastapi_pagination.bases import AbstractParams, CursorRawParams, RawParams
 from fastapi_pagination.config import Config
 from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
 from fastapi_pagination.flows import (
+    CountedItems,
     CursorFlow,
     LimitOffsetFlow,
+    LimitOffsetFlowFunc,
     TotalFlow,
     additional_data_flow,
+    approximate_total_flow,
+    batched_items_flow,
+    cached_total_flow,
     create_page_flow,
     generic_flow,
 )
+from fastapi_pagination.keyset import create_keyset_page_data, decode_keyset_cursor
+from fastapi_pagination.streaming import StreamingFormat, StreamingPageResponse, create_streaming_page
+from fastapi_pagination.total_cache import create_total_cache_key as _create_total_cache_key
 from fastapi_pagination.types import (
     AdditionalData,
     AsyncItemsTransformer,
@@ -46,8 +69,9 @@ from fastapi_pagination.types import (
 from fastapi_pagination.utils import verify_params
 
 from .raw_sql import create_count_query_from_text as _create_count_query_from_text
+from .raw_sql import create_explain_query_from_text, get_explain_plan_rows
 from .raw_sql import create_paginate_query_from_text as _create_paginate_query_from_text
-from .utils import generic_query_apply_params, unwrap_scalars
+from .utils import generic_query_apply_params, resolve_items_fields, unwrap_scalars
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
@@ -87,15 +111,20 @@ except ImportError:  # pragma: no cover
             raise ImportError("sqlalchemy.ext.asyncio is not available")
 
 
-try:
-    from sqlakeyset import asyncio as apaging
-    from sqlakeyset import paging
-except ImportError:  # pragma: no cover
-    paging = None  # type: ignore[ty:invalid-assignment]
-    apaging = None  # type: ignore[ty:invalid-assignment]
-
-
 _INLINE_COUNT_LABEL = "__pagination_inline_count__"
+_APPROXIMATE_TOTAL_THRESHOLD = 10_000
+
+_KEYSET_LABEL = "__pagination_keyset_{}__"
+_ORDERING_MODIFIERS: dict[Any, Literal["first", "last"] | None] = {
+    operators.asc_op: None,
+    operators.desc_op: None,
+    operators.nulls_first_op: "first",
+    operators.nulls_last_op: "last",
+}
+# dialects that treat NULL as larger than any other value when ordering
+_NULLS_LARGEST_DIALECTS = {"postgresql", "oracle"}
+# dialects that support row-value comparisons, e.g. (a, b) > (:a, :b)
+_ROW_VALUES_DIALECTS = {"postgresql", "sqlite", "mysql", "mariadb"}
 
 AsyncConn: TypeAlias = "AsyncSession | AsyncConnection | async_scoped_session[Any]"
 SyncConn: TypeAlias = "Session | Connection | scoped_session[Any]"
@@ -165,6 +194,23 @@ def _get_orm_entity(query: Select[Any]) -> type[Any] | None:
     return entity if (expr is not None and expr is entity) else None
 
 
+def _apply_load_only(query: Selectable, fields: Sequence[str] | None) -> Selectable:
+    if fields is None or not isinstance(query, Select) or (entity := _get_orm_entity(query)) is None:
+        return query
+
+    mapper = inspect(entity)
+
+    # fields that are not mapped attributes (properties, hybrids, etc.) can read any column
+    if any(field not in mapper.attrs for field in fields):
+        return query
+
+    columns = [getattr(entity, field) for field in fields if field in mapper.column_attrs]
+    if not columns:
+        return query
+
+    return query.options(load_only(*columns))
+
+
 def _should_unwrap_scalars_for_query(query: Selectable) -> bool:
     cols_desc = query.column_descriptions  # type: ignore[ty:unresolved-attribute]
     all_cols = [*query._all_selected_columns]
@@ -268,11 +314,7 @@ def _maybe_unique(result: Any, unique: bool) -> Any:
 _TSeq = TypeVar("_TSeq", bound=Sequence[Any])
 
 
-def _unwrap_items(
-    items: _TSeq,
-    query: Selectable,
-    unwrap_mode: UnwrapMode | None = None,
-) -> _TSeq:
+def _resolve_unwrap_mode(query: Selectable, unwrap_mode: UnwrapMode | None) -> UnwrapMode:
     # for raw queries we will use legacy mode by default
     # because we can't determine if we should unwrap or not
     if isinstance(query, (TextClause, FromStatement)):  # noqa: SIM108
@@ -280,18 +322,56 @@ def _unwrap_items(
     else:
         unwrap_mode = unwrap_mode or "auto"
 
+    if unwrap_mode == "auto":
+        return "unwrap" if _should_unwrap_scalars(query) else "no-unwrap"
+
+    return unwrap_mode
+
+
+def _unwrap_items(
+    items: _TSeq,
+    query: Selectable,
+    unwrap_mode: UnwrapMode | None = None,
+) -> _TSeq:
+    unwrap_mode = _resolve_unwrap_mode(query, unwrap_mode)
+
     if unwrap_mode == "legacy":
         items = unwrap_scalars(items)  # type: ignore[ty:invalid-assignment]
-    elif unwrap_mode == "no-unwrap":
-        pass
     elif unwrap_mode == "unwrap":
         items = unwrap_scalars(items, force_unwrap=True)  # type: ignore[ty:invalid-assignment]
-    elif unwrap_mode == "auto" and _should_unwrap_scalars(query):
-        items = unwrap_scalars(items, force_unwrap=True)  # type: ignore[ty:invalid-assignment]
 
     return items
 
 
+def _get_dialect(conn: AnyConn) -> Dialect | None:
+    with suppress(AttributeError, UnboundExecutionError):
+        return conn.get_bind().dialect  # type: ignore[ty:unresolved-attribute]
+
+    return getattr(conn, "dialect", None)
+
+
+def create_total_cache_key(
+    conn: AnyConn,
+    query: SelectableOrQuery,
+    count_query: SelectableOrQuery | None = None,
+    *,
+    subquery_count: bool = True,
+) -> str:
+    """
+    Create a total cache key for the query.
+
+    Key is built from the compiled count statement and its bound params,
+    it can be used to invalidate cached total using `Config.total_cache`.
+    """
+    count_query = _prepare_query(count_query)
+
+    if count_query is None:
+        count_query = create_count_query(_prepare_query(query), use_subquery=subquery_count)
+
+    compiled = count_query.compile(dialect=_get_dialect(conn))
+    return _create_total_cache_key("sqlalchemy", str(compiled), compiled.params)
+
+
 @flow
 def _total_flow(
     query: Selectable,
@@ -306,14 +386,129 @@ def _total_flow(
     return cast(int | None, total)
 
 
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Selectable) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kwargs: Any) -> str:
+    return create_explain_query_from_text(compiler.process(element.statement, **kwargs))
+
+
+_RELTUPLES_QUERY = "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+
+
+def _get_unfiltered_table(query: Selectable) -> TableClause | None:
+    if not isinstance(query, Select):
+        return None
+
+    if (
+        query._where_criteria
+        or query._having_criteria
+        or query._group_by_clauses
+        or query._distinct
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+    ):
+        return None
+
+    froms = query.get_final_froms()
+    if len(froms) == 1 and isinstance(froms[0], TableClause):
+        return froms[0]
+
+    return None
+
+
+@flow
+def _estimate_total_flow(query: Selectable, conn: AnyConn, dialect: Dialect) -> TotalFlow:
+    if isinstance(query, FromStatement):
+        query = cast("Selectable", query.element)
+
+    # fast path for unfiltered selects, use table statistics directly
+    if (table := _get_unfiltered_table(query)) is not None:
+        name = dialect.identifier_preparer.format_table(table)
+        reltuples = yield conn.scalar(text(_RELTUPLES_QUERY), {"name": name})
+
+        # reltuples is -1 (or 0) for tables that were never analyzed
+        if reltuples is not None and reltuples > 0:
+            return int(reltuples)
+
+    plan = yield conn.scalar(_Explain(query))
+    return get_explain_plan_rows(plan)
+
+
 @flow
-def _limit_offset_flow(query: Selectable, conn: AnyConn, raw_params: RawParams) -> LimitOffsetFlow:
+def _limit_offset_flow(
+    query: Selectable,
+    conn: AnyConn,
+    raw_params: RawParams,
+    *,
+    counted: bool = False,
+) -> LimitOffsetFlow:
     query = create_paginate_query(query, raw_params)
     items = yield conn.execute(query)
 
+    if counted:
+        # rows are counted before they are uniqued by inner transformer, so adaptive total sees the real page size
+        frozen = items.freeze()
+        return CountedItems(frozen(), len(frozen.data))
+
+    return items
+
+
+@flow
+def _batched_limit_offset_flow(
+    query: Selectable,
+    conn: AnyConn,
+    raw_params: RawParams,
+    *,
+    is_async: bool,
+    batch_size: int,
+    unwrap_mode: UnwrapMode | None,
+    transformer: ItemsTransformer | None,
+) -> LimitOffsetFlow:
+    # unique() can't be used together with yield_per, so rows are not deduplicated in batch mode
+    stmt = create_paginate_query(query, raw_params).execution_options(yield_per=batch_size)
+    result = yield (conn.stream(stmt) if is_async else conn.execute(stmt))  # type: ignore[ty:unresolved-attribute]
+
+    try:
+        items = yield from batched_items_flow(
+            partial(result.fetchmany, batch_size),
+            inner_transformer=partial(_inner_transformer, query=query, unwrap_mode=unwrap_mode, unique=False),
+            transformer=transformer,
+            async_=is_async,
+        )
+    finally:
+        yield result.close()
+
     return items
 
 
+def _create_limit_offset_flow(
+    is_async: bool,
+    conn: AnyConn,
+    query: Selectable,
+    unwrap_mode: UnwrapMode | None,
+    transformer: ItemsTransformer | None,
+    config: Config | None,
+) -> LimitOffsetFlowFunc:
+    if config is None or config.fetch_batch_size is None:
+        return partial(_limit_offset_flow, query, conn, counted=bool(config and config.adaptive_total))
+
+    return partial(
+        _batched_limit_offset_flow,
+        query,
+        conn,
+        is_async=is_async,
+        batch_size=config.fetch_batch_size,
+        unwrap_mode=unwrap_mode,
+        transformer=transformer,
+    )
+
+
 def _apply_inline_count(query: Select[Any], inline_count: ColumnElement[int]) -> Select[Any]:
     """Return *query* with *inline_count* embedded as an extra labeled column.
 
@@ -392,7 +587,11 @@ def _sqlalchemy_inline_count_flow(
         else:
             # No rows returned: the offset is likely past the end of the result set.
             # The inline count cannot be extracted, so fall back to a separate query.
-            total = yield from _total_flow(query, conn, count_query, subquery_count)
+            total = yield from cached_total_flow(
+                partial(_total_flow, query, conn, count_query, subquery_count),
+                partial(create_total_cache_key, conn, query, count_query, subquery_count=subquery_count),
+                config,
+            )
 
     items = _unwrap_items(result, query, unwrap_mode)
 
@@ -412,12 +611,122 @@ def _sqlalchemy_inline_count_flow(
     return page
 
 
+class _KeysetColumn(NamedTuple):
+    expr: ColumnElement[Any]
+    desc: bool = False
+    nulls: Literal["first", "last"] | None = None
+
+    def flip(self) -> _KeysetColumn:
+        nulls = self.nulls and ("last" if self.nulls == "first" else "first")
+        return _KeysetColumn(self.expr, not self.desc, nulls)
+
+    def nulls_first(self, nulls_largest: bool) -> bool:
+        if self.nulls is not None:
+            return self.nulls == "first"
+
+        return self.desc if nulls_largest else not self.desc
+
+    def is_nullable(self) -> bool:
+        return getattr(self.expr, "nullable", True) and not getattr(self.expr, "primary_key", False)
+
+    def to_order_by(self) -> ColumnElement[Any]:
+        clause = self.expr.desc() if self.desc else self.expr.asc()
+
+        if self.nulls == "first":
+            return nulls_first(clause)
+        if self.nulls == "last":
+            return nulls_last(clause)
+
+        return clause
+
+
+def _get_keyset_column(clause: ColumnElement[Any], query: Select[Any]) -> _KeysetColumn:
+    element, desc, nulls = clause, False, None
+
+    while True:
+        if isinstance(element, UnaryExpression) and element.modifier in _ORDERING_MODIFIERS:
+            desc = desc or element.modifier is operators.desc_op
+            nulls = nulls or _ORDERING_MODIFIERS[element.modifier]
+            element = element.element
+        elif isinstance(element, (Label, _label_reference)):
+            element = element.element
+        elif isinstance(element, _textual_label_reference):
+            try:
+                element = query.selected_columns[element.element]
+            except KeyError:
+                raise ValueError(f"Unable to resolve ordering column {element.element!r}") from None
+        else:
+            break
+
+    if not isinstance(element, ColumnElement) or isinstance(element, TextClause):
+        raise ValueError("Cursor pagination does not support ordering by raw SQL expressions")  # noqa: TRY004
+
+    return _KeysetColumn(element, desc, nulls)
+
+
+def _get_keyset_columns(query: Select[Any]) -> list[_KeysetColumn]:
+    return [_get_keyset_column(clause, query) for clause in query._order_by_clauses]
+
+
+def _keyset_equals(column: _KeysetColumn, value: Any) -> ColumnElement[bool]:
+    return column.expr.is_(None) if value is None else column.expr == value
+
+
+def _keyset_after(column: _KeysetColumn, value: Any, nulls_largest: bool) -> ColumnElement[bool] | None:
+    nulls_first = column.nulls_first(nulls_largest)
+
+    if value is None:
+        # nothing can be placed after NULL if NULLs are placed last
+        return column.expr.is_not(None) if nulls_first else None
+
+    compare = column.expr < value if column.desc else column.expr > value
+    return compare if nulls_first else or_(compare, column.expr.is_(None))
+
+
+def _keyset_predicate(
+    columns: Sequence[_KeysetColumn],
+    key: Sequence[Any],
+    *,
+    nulls_largest: bool,
+    row_values: bool,
+) -> ColumnElement[bool]:
+    if (
+        row_values
+        and len({column.desc for column in columns}) == 1
+        and all(value is not None for value in key)
+        and not any(column.is_nullable() for column in columns)
+    ):
+        lhs = tuple_(*(column.expr for column in columns))
+        rhs = tuple_(*(literal(value, column.expr.type) for column, value in zip(columns, key, strict=True)))
+
+        return lhs < rhs if columns[0].desc else lhs > rhs
+
+    criteria = []
+    for i, (column, value) in enumerate(zip(columns, key, strict=True)):
+        after = _keyset_after(column, value, nulls_largest)
+
+        if after is not None:
+            equals = [_keyset_equals(prev, prev_value) for prev, prev_value in zip(columns[:i], key[:i], strict=True)]
+            criteria.append(and_(*equals, after))
+
+    return or_(*criteria) if criteria else false()
+
+
+def _freeze_result(result: Any, unique: bool) -> Any:
+    try:
+        return (result.unique() if unique else result).freeze()
+    except InvalidRequestError as e:  # pragma: no cover
+        if "non-hashable" in str(e):
+            raise NonHashableRowsException("The rows are not hashable, please use `unique=False`") from e
+
+        raise
+
+
 @flow
 def _cursor_flow(
     query: Selectable,
     conn: AnyConn,
     unique: bool,
-    is_async: bool,
     raw_params: CursorRawParams,
 ) -> CursorFlow:
     query = _prepare_query_for_cursor(query)
@@ -426,30 +735,57 @@ def _cursor_flow(
         raise ValueError("Cursor pagination cannot be used with raw SQL queries")  # noqa: TRY004
     if isinstance(query, FromStatement):
         raise ValueError("Cursor pagination cannot be used with FromStatement queries")  # noqa: TRY004
-    if paging is None:  # pragma: no cover
-        raise ImportError("sqlakeyset is not installed")
     if not getattr(query, "_order_by_clauses", True):
         raise ValueError("Cursor pagination requires ordering")
 
-    _select_page = apaging.select_page if is_async else paging.select_page
+    query = cast("Select[Any]", query)
+    columns = _get_keyset_columns(query)
+    cursor = decode_keyset_cursor(raw_params.cursor)
 
-    page = yield _select_page(
-        conn,  # type: ignore[ty:invalid-argument-type]
-        selectable=query,  # type: ignore[ty:invalid-argument-type]
-        unique=unique,
-        per_page=raw_params.size,
-        page=raw_params.cursor,  # type: ignore[ty:invalid-argument-type]
+    if cursor.key is not None and len(cursor.key) != len(columns):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor value",
+        )
+
+    dialect = _get_dialect(conn)
+    dialect_name = dialect.name if dialect is not None else None
+
+    # backwards pages are fetched in reversed order and then reversed back
+    ordering = [column.flip() for column in columns] if cursor.backwards else columns
+
+    stmt = query.order_by(None).order_by(*(column.to_order_by() for column in ordering))
+    if cursor.key is not None:
+        stmt = stmt.where(
+            _keyset_predicate(
+                ordering,
+                cursor.key,
+                nulls_largest=dialect_name in _NULLS_LARGEST_DIALECTS,
+                row_values=dialect_name in _ROW_VALUES_DIALECTS,
+            ),
+        )
+
+    stmt = stmt.add_columns(
+        *(column.expr.label(_KEYSET_LABEL.format(i)) for i, column in enumerate(columns)),
     )
-    items = [*page]
+    # fetch one extra row to check if there is a further page
+    stmt = stmt.limit(raw_params.size + 1)
+
+    result = yield conn.execute(stmt)
+    width = len(result.keys()) - len(columns)
+
+    frozen = _freeze_result(result, unique)
+    keys = [tuple(row[width:]) for row in frozen().all()]
+    items = [*frozen().columns(*range(width)).all()]
+
+    further = keys[raw_params.size] if len(keys) > raw_params.size else None
+    items, keys = items[: raw_params.size], keys[: raw_params.size]
 
-    data = {
-        "current": page.paging.bookmark_current,
-        "current_backwards": page.paging.bookmark_current_backwards,
-        "previous": page.paging.bookmark_previous if page.paging.has_previous else None,
-        "next_": page.paging.bookmark_next if page.paging.has_next else None,
-    }
+    if cursor.backwards:
+        items.reverse()
+        keys.reverse()
 
-    return items, data
+    return items, create_keyset_page_data(cursor, keys, further)
 
 
 @flow
@@ -463,6 +799,8 @@ def _sqlalchemy_flow(
     unwrap_mode: UnwrapMode | None = None,
     count_query: Selectable | None = None,
     inline_count: ColumnElement[int] | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: ItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     unique: bool = True,
@@ -472,11 +810,14 @@ def _sqlalchemy_flow(
     if is_async:
         create_page_factory = partial(greenlet_spawn, create_page_factory)
 
-    if inline_count is not None and isinstance(query, Select):
+    # only columns of the page item model are loaded, total is counted by the original query
+    items_query = _apply_load_only(query, resolve_items_fields(params, config, transformer=transformer))
+
+    if inline_count is not None and isinstance(items_query, Select):
         page = yield from _sqlalchemy_inline_count_flow(
             is_async,
             conn,
-            query,
+            items_query,
             params,
             inline_count,
             count_query=count_query,
@@ -490,13 +831,23 @@ def _sqlalchemy_flow(
         )
         return page
 
+    total_flow = partial(_total_flow, query, conn, count_query, subquery_count)
+    if approximate_total and (dialect := _get_dialect(conn)) is not None and dialect.name == "postgresql":
+        total_flow = partial(
+            approximate_total_flow,
+            partial(_estimate_total_flow, query, conn, dialect),
+            total_flow,
+            threshold=approximate_total_threshold,
+        )
+
     page = yield from generic_flow(
         async_=is_async,
-        total_flow=partial(_total_flow, query, conn, count_query, subquery_count),
-        limit_offset_flow=partial(_limit_offset_flow, query, conn),
-        cursor_flow=partial(_cursor_flow, query, conn, unique, is_async),
+        total_flow=total_flow,
+        total_cache_key=partial(create_total_cache_key, conn, query, count_query, subquery_count=subquery_count),
+        limit_offset_flow=_create_limit_offset_flow(is_async, conn, items_query, unwrap_mode, transformer, config),
+        cursor_flow=partial(_cursor_flow, items_query, conn, unique),
         params=params,
-        inner_transformer=partial(_inner_transformer, query=query, unwrap_mode=unwrap_mode, unique=unique),
+        inner_transformer=partial(_inner_transformer, query=items_query, unwrap_mode=unwrap_mode, unique=unique),
         transformer=transformer,
         additional_data=additional_data,
         config=config,
@@ -513,7 +864,13 @@ def _inner_transformer(
     unwrap_mode: UnwrapMode | None,
     unique: bool,
 ) -> Sequence[Any]:
+    unwrap_mode = _resolve_unwrap_mode(query, unwrap_mode)
+
     with suppress(AttributeError):
+        if unwrap_mode == "unwrap" and len(items.keys()) == 1:  # type: ignore[ty:unresolved-attribute]
+            # scalars are fetched from the result directly, so rows are not created and copied to another list
+            return _maybe_unique(items.scalars(), unique)  # type: ignore[ty:unresolved-attribute]
+
         items = _maybe_unique(items, unique)
 
     return _unwrap_items(items, query, unwrap_mode)
@@ -527,6 +884,8 @@ def paginate(
     *,
     subquery_count: bool = True,
     unwrap_mode: UnwrapMode | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: SyncItemsTransformer | None = None,
     additional_data: SyncAdditionalData | None = None,
     unique: bool = True,
@@ -545,6 +904,8 @@ def paginate(
     inline_count: ColumnElement[int] | None = None,
     subquery_count: bool = True,
     unwrap_mode: UnwrapMode | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: SyncItemsTransformer | None = None,
     additional_data: SyncAdditionalData | None = None,
     unique: bool = True,
@@ -580,6 +941,8 @@ def paginate(*args: Any, **kwargs: Any) -> Any:
             subquery_count,
             unwrap_mode,
             config,
+            approximate_total,
+            approximate_total_threshold,
         ) = _old_paginate_sign(*args, **kwargs)
     except (TypeError, AssertionError):
         (
@@ -594,6 +957,8 @@ def paginate(*args: Any, **kwargs: Any) -> Any:
             subquery_count,
             unwrap_mode,
             config,
+            approximate_total,
+            approximate_total_threshold,
         ) = _new_paginate_sign(*args, **kwargs)
 
     return run_sync_flow(
@@ -606,6 +971,8 @@ def paginate(*args: Any, **kwargs: Any) -> Any:
             unwrap_mode=unwrap_mode,
             count_query=count_query,
             inline_count=inline_count,
+            approximate_total=approximate_total,
+            approximate_total_threshold=approximate_total_threshold,
             transformer=transformer,
             additional_data=additional_data,
             unique=unique,
@@ -620,6 +987,8 @@ def _old_paginate_sign(
     *,
     subquery_count: bool = True,
     unwrap_mode: UnwrapMode | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: ItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     unique: bool = True,
@@ -636,6 +1005,8 @@ def _old_paginate_sign(
     bool,
     UnwrapMode | None,
     Config | None,
+    bool,
+    int,
 ]:
     if query.session is None:
         raise ValueError("query.session is None")
@@ -643,7 +1014,21 @@ def _old_paginate_sign(
     session = query.session
     stmt = _prepare_query(query)
 
-    return stmt, None, None, session, params, transformer, additional_data, unique, subquery_count, unwrap_mode, config
+    return (
+        stmt,
+        None,
+        None,
+        session,
+        params,
+        transformer,
+        additional_data,
+        unique,
+        subquery_count,
+        unwrap_mode,
+        config,
+        approximate_total,
+        approximate_total_threshold,
+    )
 
 
 def _new_paginate_sign(
@@ -655,6 +1040,8 @@ def _new_paginate_sign(
     unwrap_mode: UnwrapMode | None = None,
     count_query: Selectable | None = None,
     inline_count: ColumnElement[int] | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: ItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     unique: bool = True,
@@ -671,6 +1058,8 @@ def _new_paginate_sign(
     bool,
     UnwrapMode | None,
     Config | None,
+    bool,
+    int,
 ]:
     query = _prepare_query(query)
     count_query = _prepare_query(count_query)
@@ -687,6 +1076,8 @@ def _new_paginate_sign(
         subquery_count,
         unwrap_mode,
         config,
+        approximate_total,
+        approximate_total_threshold,
     )
 
 
@@ -699,6 +1090,8 @@ async def apaginate(
     inline_count: ColumnElement[int] | None = None,
     subquery_count: bool = True,
     unwrap_mode: UnwrapMode | None = None,
+    approximate_total: bool = False,
+    approximate_total_threshold: int = _APPROXIMATE_TOTAL_THRESHOLD,
     transformer: AsyncItemsTransformer | None = None,
     additional_data: AdditionalData | None = None,
     unique: bool = True,
@@ -717,9 +1110,123 @@ async def apaginate(
             unwrap_mode=unwrap_mode,
             count_query=count_query,
             inline_count=inline_count,
+            approximate_total=approximate_total,
+            approximate_total_threshold=approximate_total_threshold,
             transformer=transformer,
             additional_data=additional_data,
             unique=unique,
             config=config,
         ),
     )
+
+
+@flow
+def _streaming_total_flow(
+    conn: AnyConn,
+    query: Selectable,
+    raw_params: RawParams,
+    count_query: Selectable | None,
+    subquery_count: bool,
+    config: Config | None,
+) -> TotalFlow:
+    if not raw_params.include_total:
+        return None
+
+    total = yield from cached_total_flow(
+        partial(_total_flow, query, conn, count_query, subquery_count),
+        partial(create_total_cache_key, conn, query, count_query, subquery_count=subquery_count),
+        config,
+    )
+    return total
+
+
+def stream_paginate(
+    conn: SyncConn,
+    query: SelectableOrQuery,
+    params: AbstractParams | None = None,
+    *,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    count_query: SelectableOrQuery | None = None,
+    subquery_count: bool = True,
+    unwrap_mode: UnwrapMode | None = None,
+    transformer: SyncItemsTransformer | None = None,
+    config: Config | None = None,
+) -> StreamingPageResponse:
+    """
+    Paginate query and stream page items as NDJSON or CSV.
+
+    Rows are fetched from the database by chunks of `chunk_size` (`yield_per`), while the response is being sent,
+    so `conn` should stay open until the response is finished. `yield_per` can't be used with
+    eager loading of collections, so rows are not uniqued.
+    """
+    query = _prepare_query(query)
+    count_query = _prepare_query(count_query)
+    params, raw_params = verify_params(params, "limit-offset")
+
+    total = run_sync_flow(_streaming_total_flow(conn, query, raw_params, count_query, subquery_count, config))
+
+    def _items() -> Iterator[Any]:
+        stmt = create_paginate_query(query, raw_params).execution_options(yield_per=chunk_size)
+        result = conn.execute(stmt)
+
+        try:
+            for partition in result.partitions():
+                yield from _unwrap_items(partition, query, unwrap_mode)
+        finally:
+            result.close()
+
+    return create_streaming_page(
+        _items(),
+        total=total,
+        params=params,
+        format=format,
+        chunk_size=chunk_size,
+        transformer=transformer,
+    )
+
+
+async def astream_paginate(
+    conn: AsyncConn,
+    query: Selectable,
+    params: AbstractParams | None = None,
+    *,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    count_query: Selectable | None = None,
+    subquery_count: bool = True,
+    unwrap_mode: UnwrapMode | None = None,
+    transformer: AsyncItemsTransformer | None = None,
+    config: Config | None = None,
+) -> StreamingPageResponse:
+    """
+    Paginate query and stream page items as NDJSON or CSV.
+
+    Rows are fetched using `conn.stream()` by chunks of `chunk_size` while the response is being sent,
+    so `conn` should stay open until the response is finished.
+    """
+    query = _prepare_query(query)
+    count_query = _prepare_query(count_query)
+    params, raw_params = verify_params(params, "limit-offset")
+
+    total = await run_async_flow(_streaming_total_flow(conn, query, raw_params, count_query, subquery_count, config))
+
+    async def _items() -> AsyncIterator[Any]:
+        stmt = create_paginate_query(query, raw_params).execution_options(yield_per=chunk_size)
+        result = await conn.stream(stmt)
+
+        try:
+            async for partition in result.partitions():
+                for item in _unwrap_items(partition, query, unwrap_mode):
+                    yield item
+        finally:
+            await result.close()
+
+    return create_streaming_page(
+        _items(),
+        total=total,
+        params=params,
+        format=format,
+        chunk_size=chunk_size,
+        transformer=transformer,
+    )
@@ -1,5 +1,6 @@
 __all__ = ["apaginate"]
 
+from functools import partial
 from typing import Any, TypeVar
 
 from tortoise.models import Model
@@ -10,6 +11,7 @@ from fastapi_pagination.bases import AbstractParams
 from fastapi_pagination.config import Config
 from fastapi_pagination.flow import flow_expr, run_async_flow
 from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.total_cache import create_total_cache_key
 from fastapi_pagination.types import AdditionalData, AsyncItemsTransformer
 
 from .utils import generic_query_apply_params
@@ -30,6 +32,10 @@ def _generate_query(
     return query
 
 
+def _total_cache_key(query: QuerySet[TModel]) -> str:
+    return create_total_cache_key("tortoise", query.sql(params_inline=True))
+
+
 async def apaginate(
     query: QuerySet[TModel] | type[TModel],
     params: AbstractParams | None = None,
@@ -47,6 +53,7 @@ async def apaginate(
         generic_flow(
             async_=True,
             total_flow=flow_expr(lambda: query.count() if total is None else total),  # type: ignore[ty:invalid-argument-type]
+            total_cache_key=partial(_total_cache_key, query) if total is None else None,
             limit_offset_flow=flow_expr(
                 lambda raw_params: generic_query_apply_params(
                     _generate_query(query, prefetch_related),
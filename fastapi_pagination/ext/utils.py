@@ -2,6 +2,7 @@ __all__ = [
     "generic_query_apply_params",
     "get_mongo_pipeline_filter_end",
     "len_or_none",
+    "resolve_items_fields",
     "unwrap_scalars",
     "wrap_scalars",
 ]
@@ -11,7 +12,11 @@ from typing import Any, Protocol, TypeVar, cast
 
 from typing_extensions import Self
 
-from fastapi_pagination.bases import RawParams
+from fastapi_pagination.api import resolve_page, resolve_params
+from fastapi_pagination.bases import AbstractParams, RawParams
+from fastapi_pagination.config import Config
+from fastapi_pagination.pydantic import get_items_fields
+from fastapi_pagination.types import ItemsTransformer
 
 T = TypeVar("T")
 
@@ -28,9 +33,16 @@ def unwrap_scalars(
     *,
     force_unwrap: bool = False,
 ) -> Sequence[T] | Sequence[Sequence[T]]:
+    if force_unwrap:
+        return [item[0] for item in items]
+
+    # items are returned as is when there is nothing to unwrap, so rows list is not copied
+    if not any(len_or_none(item) == 1 for item in items):
+        return items
+
     return cast(
         Sequence[T] | Sequence[Sequence[T]],
-        [item[0] if force_unwrap or len_or_none(item) == 1 else item for item in items],
+        [item[0] if len_or_none(item) == 1 else item for item in items],
     )
 
 
@@ -38,6 +50,25 @@ def wrap_scalars(items: Sequence[Any]) -> Sequence[Sequence[Any]]:
     return [item if len_or_none(item) is not None else [item] for item in items]
 
 
+def resolve_items_fields(
+    params: AbstractParams | None,
+    config: Config | None,
+    *,
+    transformer: ItemsTransformer | None = None,
+) -> tuple[str, ...] | None:
+    """
+    Get fields of the page item model to fetch when projection push-down is enabled.
+
+    `None` means that all fields should be fetched. Items transformer can read any field of the fetched items,
+    so nothing is pushed down when it's passed.
+    """
+    if config is None or not config.projection_pushdown or transformer is not None:
+        return None
+
+    page_cls = config.page_cls or resolve_page(resolve_params(params))
+    return get_items_fields(page_cls)
+
+
 class AbstractQuery(Protocol):
     def limit(self, *_: Any, **__: Any) -> Self:  # pragma: no cover
         pass
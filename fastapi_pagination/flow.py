@@ -4,11 +4,13 @@ __all__ = [
     "async_flow",
     "flow",
     "flow_expr",
+    "gather_async_flows",
     "run_async_flow",
     "run_sync_flow",
     "sync_flow",
 ]
 
+import asyncio
 from collections.abc import Awaitable, Callable, Generator
 from functools import wraps
 from typing import Any, TypeAlias, cast, overload
@@ -74,6 +76,10 @@ async def run_async_flow(gen: Flow[Any, R], /) -> R:
         return cast(R, exc.value)
 
 
+async def gather_async_flows(*gens: Flow[Any, Any]) -> list[Any]:
+    return await asyncio.gather(*(run_async_flow(gen) for gen in gens))
+
+
 def sync_flow(func: Callable[P, Flow[Any, R]]) -> Callable[P, R]:
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
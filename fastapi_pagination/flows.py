@@ -1,25 +1,36 @@
 __all__ = [
+    "CountedItems",
     "CreatePageFactory",
     "CursorFlow",
     "CursorFlowFunc",
+    "InlineTotal",
     "LimitOffsetFlow",
     "LimitOffsetFlowFunc",
+    "TotalCacheKeyFunc",
     "TotalFlow",
     "TotalFlowFunc",
+    "TransformedItems",
+    "approximate_total_flow",
+    "batched_items_flow",
+    "cached_total_flow",
     "create_page_flow",
     "generic_flow",
 ]
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Sequence, Sized
 from contextlib import ExitStack
-from typing import Any, Protocol, TypeAlias
+from dataclasses import replace
+from typing import Any, NamedTuple, Protocol, TypeAlias
 
 from .api import apply_items_transformer, create_page, set_page
 from .bases import AbstractParams, CursorRawParams, RawParams, is_cursor, is_limit_offset
 from .config import Config
-from .flow import AnyFlow, flow
-from .types import AdditionalData, AdditionalDataResult, ItemsTransformer, ParamsType
-from .utils import is_additional_data_callable, verify_params
+from .flow import AnyFlow, flow, gather_async_flows
+from .instrumentation import FlowInstrumentation, create_flow_instrumentation, instrument_stage
+from .pydantic import trusted_construction
+from .total_cache import TotalCacheKey
+from .types import AdditionalData, AdditionalDataResult, ApproximateTotal, ItemsTransformer, ParamsType
+from .utils import get_caller, is_additional_data_callable, verify_params
 
 LimitOffsetFlow: TypeAlias = AnyFlow
 CursorFlow: TypeAlias = AnyFlow[tuple[Any, dict[str, Any] | None]]
@@ -28,6 +39,42 @@ TotalFlow: TypeAlias = AnyFlow[int | None]
 LimitOffsetFlowFunc: TypeAlias = Callable[[RawParams], AnyFlow]
 CursorFlowFunc: TypeAlias = Callable[[CursorRawParams], AnyFlow[tuple[Any, dict[str, Any] | None]]]
 TotalFlowFunc: TypeAlias = Callable[[], AnyFlow[int | None]]
+TotalCacheKeyFunc: TypeAlias = Callable[[], TotalCacheKey]
+
+
+class InlineTotal(NamedTuple):
+    """
+    Items that were fetched together with the total in the same query (e.g. using `count(*) OVER ()`).
+
+    Total is None when it can't be extracted from items (empty page), then `total_flow` is used instead.
+    """
+
+    items: Any
+    total: int | None = None
+
+
+class CountedItems(NamedTuple):
+    """
+    Items together with the number of raw rows fetched for them.
+
+    Used by adaptive total when items are not sized (e.g. result objects) or when inner transformer
+    can drop rows (e.g. uniqued rows of joined collections), so the page size is not known from items.
+    """
+
+    items: Any
+    count: int
+
+
+class TransformedItems(NamedTuple):
+    """
+    Items that were already transformed by items flow (see `batched_items_flow`).
+
+    Inner transformer and transformer are not applied to such items again.
+    `count` is the number of raw rows the items were built from.
+    """
+
+    items: Any
+    count: int | None = None
 
 
 class CreatePageFactory(Protocol):
@@ -42,6 +89,12 @@ class CreatePageFactory(Protocol):
         pass
 
 
+@flow
+def _call_flow(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> AnyFlow:
+    result = yield func(*args, **kwargs)
+    return result
+
+
 @flow
 def create_page_flow(
     items: Any,
@@ -53,30 +106,75 @@ def create_page_flow(
     config: Config | None = None,
     async_: bool = False,
     create_page_factory: CreatePageFactory | None = None,
+    instrumentation: FlowInstrumentation | None = None,
 ) -> Any:
     with ExitStack() as stack:
         if config and config.page_cls:
             stack.enter_context(set_page(config.page_cls))
+        if config and config.trusted_construction:
+            stack.enter_context(trusted_construction())
 
-        t_items = yield apply_items_transformer(  # type: ignore[ty:no-matching-overload]
-            items,
-            transformer,
-            async_=async_,
+        t_items = yield from instrument_stage(
+            instrumentation,
+            "transformer",
+            _call_flow(
+                apply_items_transformer,
+                items,
+                transformer,
+                async_=async_,
+            ),
         )
 
         if create_page_factory is None:
             create_page_factory = create_page
 
-        page = yield create_page_factory(
-            t_items,
-            total=total,
-            params=params,
-            **(additional_data or {}),
+        page = yield from instrument_stage(
+            instrumentation,
+            "create_page",
+            _call_flow(
+                create_page_factory,
+                t_items,
+                total=total,
+                params=params,
+                **(additional_data or {}),
+            ),
         )
 
         return page
 
 
+def _noop_transformer(items: Any) -> Any:
+    return items
+
+
+@flow
+def batched_items_flow(
+    fetch_batch: Callable[[], Any],
+    /,
+    inner_transformer: ItemsTransformer | None = None,
+    transformer: ItemsTransformer | None = None,
+    *,
+    async_: bool = False,
+) -> AnyFlow[TransformedItems]:
+    """
+    Fetches items by batches until an empty batch is returned and transforms each batch right away,
+    so only one batch of raw rows is kept in memory at a time.
+    """
+    items: list[Any] = []
+    count = 0
+
+    while batch := (yield fetch_batch()):
+        count += len(batch)
+
+        if inner_transformer:
+            batch = yield from _call_flow(apply_items_transformer, batch, inner_transformer, async_=async_)
+
+        batch = yield from _call_flow(apply_items_transformer, batch, transformer, async_=async_)
+        items.extend(batch)
+
+    return TransformedItems(items, count)
+
+
 @flow
 def additional_data_flow(
     items: Sequence[Any],
@@ -90,11 +188,52 @@ def additional_data_flow(
 
 
 @flow
-def generic_flow(  # noqa: C901, PLR0912
+def approximate_total_flow(
+    estimate_flow: TotalFlowFunc,
+    total_flow: TotalFlowFunc,
+    /,
+    threshold: int,
+) -> TotalFlow:
+    estimate = yield from estimate_flow()
+
+    # estimates for small result sets are not reliable, so use exact count for them
+    if estimate is not None and estimate >= threshold:
+        return ApproximateTotal(estimate)
+
+    total = yield from total_flow()
+    return total
+
+
+@flow
+def cached_total_flow(
+    total_flow: TotalFlowFunc,
+    /,
+    total_cache_key: TotalCacheKeyFunc | None = None,
+    config: Config | None = None,
+) -> TotalFlow:
+    if total_cache_key is None or config is None or config.total_cache is None:
+        total = yield from total_flow()
+        return total
+
+    cache = config.total_cache
+    key = total_cache_key()
+
+    total = yield cache.get(key)
+    if total is None:
+        total = yield from total_flow()
+
+        if total is not None:
+            yield cache.set(key, total)
+
+    return total
+
+
+def generic_flow(
     *,
     limit_offset_flow: LimitOffsetFlowFunc | None = None,
     cursor_flow: CursorFlowFunc | None = None,
     total_flow: TotalFlowFunc | None = None,
+    total_cache_key: TotalCacheKeyFunc | None = None,
     params: AbstractParams | None = None,
     inner_transformer: ItemsTransformer | None = None,
     transformer: ItemsTransformer | None = None,
@@ -102,6 +241,104 @@ def generic_flow(  # noqa: C901, PLR0912
     config: Config | None = None,
     async_: bool = False,
     create_page_factory: CreatePageFactory | None = None,
+    inline_total: bool = False,
+) -> AnyFlow:
+    """
+    Generic pagination flow.
+
+    When `inline_total` is True, items flow is executed first and can return `InlineTotal`,
+    `total_flow` is used only when inline total is not available.
+
+    When `config.adaptive_total` is True, items flow is executed first and `total_flow` is used
+    only when the total can't be calculated from a short limit-offset page.
+    Items flow should return `CountedItems` when its items are not sized,
+    otherwise `total_flow` is always used.
+    """
+    instrumentation = create_flow_instrumentation(config)
+    if instrumentation is not None:
+        # caller module is resolved only when there are hooks, as frame inspection is not free
+        instrumentation = replace(instrumentation, module=get_caller())
+
+    return _generic_flow(
+        limit_offset_flow=limit_offset_flow,
+        cursor_flow=cursor_flow,
+        total_flow=total_flow,
+        total_cache_key=total_cache_key,
+        params=params,
+        inner_transformer=inner_transformer,
+        transformer=transformer,
+        additional_data=additional_data,
+        config=config,
+        async_=async_,
+        create_page_factory=create_page_factory,
+        inline_total=inline_total,
+        instrumentation=instrumentation,
+    )
+
+
+@flow
+def _items_and_total_flow(
+    items_flow: AnyFlow,
+    total_flow: TotalFlow | None,
+    /,
+    inline_total: bool = False,
+    concurrent: bool = False,
+) -> AnyFlow[tuple[Any, int | None]]:
+    total = None
+
+    if total_flow is None or inline_total:
+        result = yield from items_flow
+        if isinstance(result, InlineTotal):
+            result, total = result
+
+        if total is None and total_flow is not None:
+            total = yield from total_flow
+    elif concurrent:
+        total, result = yield gather_async_flows(total_flow, items_flow)
+    else:
+        total = yield from total_flow
+        result = yield from items_flow
+
+    return result, total
+
+
+def _get_raw_items_count(items: Any) -> int | None:
+    if isinstance(items, CountedItems | TransformedItems):
+        return items.count
+
+    return len(items) if isinstance(items, Sized) else None
+
+
+def _get_short_page_total(size: int | None, raw_params: RawParams) -> int | None:
+    if size is None:
+        return None
+
+    offset = raw_params.offset or 0
+
+    # page that is shorter than limit is the last one, so total is known without count query,
+    # empty page is not used unless it's the first one, as offset can be beyond the last item
+    if (raw_params.limit is None or size < raw_params.limit) and (size or not offset):
+        return offset + size
+
+    return None
+
+
+@flow
+def _generic_flow(  # noqa: C901, PLR0912, PLR0915
+    *,
+    limit_offset_flow: LimitOffsetFlowFunc | None = None,
+    cursor_flow: CursorFlowFunc | None = None,
+    total_flow: TotalFlowFunc | None = None,
+    total_cache_key: TotalCacheKeyFunc | None = None,
+    params: AbstractParams | None = None,
+    inner_transformer: ItemsTransformer | None = None,
+    transformer: ItemsTransformer | None = None,
+    additional_data: AdditionalData | None = None,
+    config: Config | None = None,
+    async_: bool = False,
+    create_page_factory: CreatePageFactory | None = None,
+    inline_total: bool = False,
+    instrumentation: FlowInstrumentation | None = None,
 ) -> Any:
     types: list[ParamsType] = []
     if limit_offset_flow is not None:
@@ -114,41 +351,88 @@ def generic_flow(  # noqa: C901, PLR0912
 
     params, raw_params = verify_params(params, *types)
 
-    total = None
-    if raw_params.include_total:
-        if total_flow is None:
-            raise ValueError("total_flow is required when include_total is True")
+    if raw_params.include_total and total_flow is None:
+        raise ValueError("total_flow is required when include_total is True")
 
-        total = yield from total_flow()
-
-    cursor_data: dict[str, Any] | None = None
+    items_flow: AnyFlow
     if is_limit_offset(raw_params):
         if limit_offset_flow is None:
             raise ValueError("limit_offset_flow is required for 'limit-offset' params")
 
-        items = yield from limit_offset_flow(raw_params)
+        items_flow = instrument_stage(instrumentation, "items", limit_offset_flow(raw_params))
     elif is_cursor(raw_params):
         if cursor_flow is None:
             raise ValueError("cursor_flow is required for 'cursor' params")
 
-        items, cursor_data = yield from cursor_flow(raw_params)
+        items_flow = instrument_stage(instrumentation, "items", cursor_flow(raw_params))
     else:
         raise ValueError("Invalid params type")
 
+    total_gen = None
+    if total_flow is not None and raw_params.include_total:
+        total_gen = instrument_stage(
+            instrumentation,
+            "total",
+            cached_total_flow(total_flow, total_cache_key, config),
+        )
+
+    # total is resolved after items are fetched, count query is skipped when page is short
+    adaptive_total = bool(config and config.adaptive_total and total_gen is not None and is_limit_offset(raw_params))
+
+    result, total = yield from _items_and_total_flow(
+        items_flow,
+        None if adaptive_total else total_gen,
+        inline_total=inline_total,
+        concurrent=bool(async_ and config and config.concurrent_total),
+    )
+
+    cursor_data: dict[str, Any] | None = None
+    if is_cursor(raw_params):
+        items, cursor_data = result
+    else:
+        items = result
+
+    # page size is taken from raw rows, as transformers can drop some of them
+    raw_count = _get_raw_items_count(items) if adaptive_total else None
+
+    if isinstance(items, CountedItems):
+        items = items.items
+
+    if isinstance(items, TransformedItems):
+        items = items.items
+        inner_transformer, transformer = None, _noop_transformer
+
     if inner_transformer:
-        items = yield apply_items_transformer(  # type: ignore[ty:no-matching-overload]
-            items,
-            inner_transformer,
-            async_=async_,
+        items = yield from instrument_stage(
+            instrumentation,
+            "inner_transformer",
+            _call_flow(
+                apply_items_transformer,
+                items,
+                inner_transformer,
+                async_=async_,
+            ),
         )
 
-    resolved_data = yield from additional_data_flow(
-        items,
-        additional_data,
+    if adaptive_total and total is None:
+        total = _get_short_page_total(raw_count, raw_params)
+
+        if total is None:
+            total = yield from total_gen
+
+    resolved_data = yield from instrument_stage(
+        instrumentation,
+        "additional_data",
+        additional_data_flow(
+            items,
+            additional_data,
+        ),
     )
 
     if cursor_data:
         resolved_data.update(cursor_data)
+    if isinstance(total, ApproximateTotal):
+        resolved_data.setdefault("total_is_approximate", True)
 
     page = yield from create_page_flow(
         items,
@@ -159,6 +443,7 @@ def generic_flow(  # noqa: C901, PLR0912
         config=config,
         async_=async_,
         create_page_factory=create_page_factory,
+        instrumentation=instrumentation,
     )
 
     return page
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+__all__ = [
+    "FlowHook",
+    "FlowInstrumentation",
+    "FlowStage",
+    "NoopTracer",
+    "PerfCounterHistogramHook",
+    "SpanHook",
+    "StageEvent",
+    "StageHistogram",
+    "add_flow_hook",
+    "clear_flow_hooks",
+    "create_flow_instrumentation",
+    "instrument_stage",
+    "remove_flow_hook",
+]
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeAlias, runtime_checkable
+
+from .flow import AnyFlow, flow
+
+if TYPE_CHECKING:
+    from .config import Config
+
+FlowStage: TypeAlias = Literal[
+    "total",
+    "items",
+    "inner_transformer",
+    "additional_data",
+    "transformer",
+    "create_page",
+]
+
+_hooks: list[FlowHook] = []
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    stage: FlowStage
+    module: str | None = None
+
+
+@runtime_checkable
+class FlowHook(Protocol):
+    """
+    Hook that receives start/end events of pagination stages.
+
+    Value returned from `on_stage_start` is passed back to `on_stage_end`, so hooks don't need to
+    keep per-stage state (stages can run concurrently, for instance total and items with `concurrent_total`).
+    """
+
+    def on_stage_start(self, event: StageEvent, /) -> Any:  # pragma: no cover
+        pass
+
+    def on_stage_end(self, event: StageEvent, token: Any, exc: BaseException | None, /) -> None:  # pragma: no cover
+        pass
+
+
+def add_flow_hook(hook: FlowHook, /) -> None:
+    _hooks.append(hook)
+
+
+def remove_flow_hook(hook: FlowHook, /) -> None:
+    _hooks.remove(hook)
+
+
+def clear_flow_hooks() -> None:
+    _hooks.clear()
+
+
+@dataclass(frozen=True)
+class FlowInstrumentation:
+    hooks: Sequence[FlowHook]
+    module: str | None = None
+
+    @flow
+    def stage(self, stage: FlowStage, gen: AnyFlow, /) -> AnyFlow:
+        event = StageEvent(stage=stage, module=self.module)
+        tokens = [hook.on_stage_start(event) for hook in self.hooks]
+
+        try:
+            result = yield from gen
+        except BaseException as exc:
+            for hook, token in zip(self.hooks, tokens, strict=True):
+                hook.on_stage_end(event, token, exc)
+
+            raise
+
+        for hook, token in zip(self.hooks, tokens, strict=True):
+            hook.on_stage_end(event, token, None)
+
+        return result
+
+
+def create_flow_instrumentation(config: Config | None, module: str | None = None) -> FlowInstrumentation | None:
+    hooks = [*_hooks, *(config.flow_hooks if config else ())]
+
+    if not hooks:
+        return None
+
+    return FlowInstrumentation(hooks=hooks, module=module)
+
+
+def instrument_stage(instrumentation: FlowInstrumentation | None, stage: FlowStage, gen: AnyFlow, /) -> AnyFlow:
+    if instrumentation is None:
+        return gen
+
+    return instrumentation.stage(stage, gen)
+
+
+_DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class StageHistogram:
+    buckets: Sequence[float]
+    counts: list[int] = field(init=False)
+    count: int = 0
+    sum: float = 0.0
+    min: float | None = None
+    max: float | None = None
+
+    def __post_init__(self) -> None:
+        # last bucket is for values greater than the largest bound
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def copy(self) -> StageHistogram:
+        histogram = replace(self)
+        histogram.counts = [*self.counts]
+        return histogram
+
+
+class PerfCounterHistogramHook(FlowHook):
+    """
+    Collects `time.perf_counter` durations of stages into histograms grouped by module and stage.
+
+    Args:
+        buckets: upper bounds (in seconds) of histogram buckets.
+    """
+
+    def __init__(self, buckets: Sequence[float] = _DEFAULT_BUCKETS) -> None:
+        self.buckets = sorted(buckets)
+
+        self._histograms: dict[tuple[str | None, FlowStage], StageHistogram] = {}
+        self._lock = threading.Lock()
+
+    def on_stage_start(self, event: StageEvent, /) -> float:
+        return time.perf_counter()
+
+    def on_stage_end(self, event: StageEvent, token: float, exc: BaseException | None, /) -> None:
+        elapsed = time.perf_counter() - token
+
+        with self._lock:
+            key = (event.module, event.stage)
+
+            if (histogram := self._histograms.get(key)) is None:
+                histogram = self._histograms[key] = StageHistogram(self.buckets)
+
+            histogram.observe(elapsed)
+
+    def snapshot(self) -> dict[tuple[str | None, FlowStage], StageHistogram]:
+        with self._lock:
+            return {key: histogram.copy() for key, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+class NoopTracer:
+    """Stand-in for OpenTelemetry tracer, used when `opentelemetry` is not installed."""
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None) -> _NoopSpan:
+        return _NoopSpan()
+
+
+def _get_default_tracer() -> Any:
+    try:
+        from opentelemetry import trace
+    except ImportError:  # pragma: no cover
+        return NoopTracer()
+
+    return trace.get_tracer("fastapi_pagination")
+
+
+class SpanHook(FlowHook):
+    """
+    Creates OpenTelemetry-style span for each stage.
+
+    Args:
+        tracer: object with `start_span(name, attributes=...)` method, by default OpenTelemetry tracer is used
+            if `opentelemetry` is installed, otherwise `NoopTracer`.
+    """
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        self.tracer = tracer if tracer is not None else _get_default_tracer()
+
+    def on_stage_start(self, event: StageEvent, /) -> Any:
+        attributes = {"pagination.stage": event.stage}
+        if event.module is not None:
+            attributes["pagination.module"] = event.module
+
+        return self.tracer.start_span(f"fastapi_pagination.{event.stage}", attributes=attributes)
+
+    def on_stage_end(self, event: StageEvent, token: Any, exc: BaseException | None, /) -> None:
+        if exc is not None:
+            token.record_exception(exc)
+
+        token.end()
@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from functools import partial
 from itertools import islice
 from typing import Any
 
@@ -10,7 +11,7 @@ __all__ = [
     "paginate",
 ]
 
-from .bases import AbstractParams
+from .bases import AbstractParams, RawParams
 from .config import Config
 from .flow import flow_expr, run_sync_flow
 from .flows import generic_flow
@@ -21,6 +22,16 @@ from .optional import OptionalParams as Params
 from .types import SyncAdditionalData, SyncItemsTransformer
 
 
+def _slice_items(iterable: Iterable[Any], raw_params: RawParams) -> Any:
+    # lists are sliced directly, so items before offset are not iterated one by one,
+    # other sequences are not sliced as their slices are not lists (tuple, range, bytearray, etc.)
+    if isinstance(iterable, list):
+        return iterable[raw_params.as_slice()]
+
+    items_slice = raw_params.as_slice()
+    return [*islice(iterable, items_slice.start, items_slice.stop)]
+
+
 def paginate(
     iterable: Iterable[Any],
     params: AbstractParams | None = None,
@@ -32,15 +43,7 @@ def paginate(
 ) -> Any:
     return run_sync_flow(
         generic_flow(
-            limit_offset_flow=flow_expr(
-                lambda r: [
-                    *islice(
-                        iterable,
-                        r.as_slice().start,
-                        r.as_slice().stop,
-                    )
-                ],
-            ),
+            limit_offset_flow=flow_expr(partial(_slice_items, iterable)),
             total_flow=flow_expr(lambda: total),
             params=params,
             transformer=transformer,
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+__all__ = [
+    "RawPage",
+    "aiter_items",
+    "aiter_pages",
+    "iter_items",
+    "iter_pages",
+]
+
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any, Generic
+
+from typing_extensions import Self, TypeVar
+
+from .api import set_page
+from .bases import AbstractParams, BaseAbstractPage, BaseRawParams, CursorRawParams, is_cursor, is_limit_offset
+from .types import Cursor
+from .utils import await_if_coro
+
+TAny = TypeVar("TAny", default=Any)
+
+
+@dataclass
+class RawPage(BaseAbstractPage[TAny], Generic[TAny]):
+    """
+    Lightweight page that is used by iteration helpers instead of pydantic pages.
+
+    It is not validated and not serialized, it only keeps items and data required to fetch the next page.
+    """
+
+    items: Sequence[TAny]
+    total: int | None = None
+    next_cursor: Cursor | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls,
+        items: Sequence[TAny],
+        params: AbstractParams,
+        *,
+        total: int | None = None,
+        next_: Cursor | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        return cls(items=items, total=total, next_cursor=next_, extra=kwargs)
+
+
+@dataclass
+class _IterParams(AbstractParams):
+    raw_params: BaseRawParams
+
+    def to_raw_params(self) -> BaseRawParams:
+        return replace(self.raw_params)  # type: ignore[ty:invalid-argument-type]
+
+
+def _next_raw_params(raw_params: BaseRawParams, page: RawPage[Any]) -> BaseRawParams | None:
+    if is_cursor(raw_params):
+        if page.next_cursor is None or not page.items:
+            return None
+
+        return CursorRawParams(cursor=page.next_cursor, size=raw_params.size, include_total=False)
+
+    if is_limit_offset(raw_params):
+        # short page doesn't mean the end, as items can be uniqued or filtered after fetching
+        if raw_params.limit is None or not page.items:
+            return None
+
+        offset = (raw_params.offset or 0) + raw_params.limit
+        if page.total is not None and offset >= page.total:
+            return None
+
+        return replace(raw_params, offset=offset, include_total=False)
+
+    raise ValueError("Invalid params type")
+
+
+def _should_yield(page: RawPage[Any], is_first: bool) -> bool:
+    # trailing empty page is fetched only to find out that there are no more items
+    return is_first or bool(page.items)
+
+
+def iter_pages(
+    paginate: Callable[..., Any],
+    /,
+    *args: Any,
+    params: AbstractParams,
+    **kwargs: Any,
+) -> Iterator[RawPage[Any]]:
+    """
+    Lazily iterate over all pages returned by `paginate` function.
+
+    Total is fetched only for the first page (if `params` request it), all next pages are fetched without it.
+    Cursor params should be used with extensions that support cursor pagination, so each next page
+    is fetched using keyset cursor instead of growing offset.
+    """
+    raw_params: BaseRawParams | None = params.to_raw_params()
+    is_first = True
+
+    while raw_params is not None:
+        with set_page(RawPage):  # type: ignore[ty:invalid-argument-type]
+            page = paginate(*args, params=_IterParams(raw_params), **kwargs)
+
+        raw_params = _next_raw_params(raw_params, page)
+        if _should_yield(page, is_first):
+            yield page
+
+        is_first = False
+
+        # don't keep current page alive while next page is being fetched
+        del page
+
+
+async def aiter_pages(
+    paginate: Callable[..., Awaitable[Any] | Any],
+    /,
+    *args: Any,
+    params: AbstractParams,
+    **kwargs: Any,
+) -> AsyncIterator[RawPage[Any]]:
+    """Async version of `iter_pages`, `paginate` can be a sync or async function."""
+    raw_params: BaseRawParams | None = params.to_raw_params()
+    is_first = True
+
+    while raw_params is not None:
+        with set_page(RawPage):  # type: ignore[ty:invalid-argument-type]
+            page = await await_if_coro(paginate(*args, params=_IterParams(raw_params), **kwargs))
+
+        raw_params = _next_raw_params(raw_params, page)
+        if _should_yield(page, is_first):
+            yield page
+
+        is_first = False
+
+        del page
+
+
+def iter_items(
+    paginate: Callable[..., Any],
+    /,
+    *args: Any,
+    params: AbstractParams,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    for page in iter_pages(paginate, *args, params=params, **kwargs):
+        yield from page.items
+
+
+async def aiter_items(
+    paginate: Callable[..., Awaitable[Any] | Any],
+    /,
+    *args: Any,
+    params: AbstractParams,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    async for page in aiter_pages(paginate, *args, params=params, **kwargs):
+        for item in page.items:
+            yield item
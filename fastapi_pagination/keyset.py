@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+__all__ = [
+    "KeysetCursor",
+    "create_keyset_page_data",
+    "decode_keyset_cursor",
+    "encode_keyset_cursor",
+]
+
+import json
+from base64 import b64decode, b64encode
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from .types import Cursor
+
+_FORWARD = ">"
+_BACKWARD = "<"
+
+_ENCODERS: dict[type[Any], tuple[str, Callable[[Any], Any]]] = {
+    datetime: ("$dt", datetime.isoformat),
+    date: ("$d", date.isoformat),
+    time: ("$t", time.isoformat),
+    timedelta: ("$td", timedelta.total_seconds),
+    Decimal: ("$dec", str),
+    UUID: ("$uuid", str),
+    bytes: ("$b", lambda v: b64encode(v).decode()),
+}
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "$dt": datetime.fromisoformat,
+    "$d": date.fromisoformat,
+    "$t": time.fromisoformat,
+    "$td": lambda v: timedelta(seconds=v),
+    "$dec": Decimal,
+    "$uuid": UUID,
+    "$b": lambda v: b64decode(v.encode()),
+}
+
+with suppress(ImportError):
+    from bson import ObjectId
+
+    _ENCODERS[ObjectId] = ("$oid", str)
+    _DECODERS["$oid"] = ObjectId
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """
+    Position of a row in a keyset (seek) ordering.
+
+    Args:
+        key: values of ordering columns of the row, `None` means start (or end for backwards pages) of the ordering.
+        backwards: whether rows should be fetched before the key instead of after it.
+    """
+
+    key: tuple[Any, ...] | None = None
+    backwards: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return _encode_value(value.value)
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    for tp, (tag, encoder) in _ENCODERS.items():
+        if isinstance(value, tp):
+            return {tag: encoder(value)}
+
+    raise TypeError(f"Unsupported keyset cursor value type {type(value).__name__!r}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw),) = value.items()
+        return _DECODERS[tag](raw)
+
+    return value
+
+
+def encode_keyset_cursor(cursor: KeysetCursor) -> str:
+    direction = _BACKWARD if cursor.backwards else _FORWARD
+    if cursor.key is None:
+        return direction
+
+    values = [_encode_value(value) for value in cursor.key]
+    return direction + json.dumps(values, separators=(",", ":"))
+
+
+def decode_keyset_cursor(cursor: Cursor | None) -> KeysetCursor:
+    if not cursor:
+        return KeysetCursor()
+
+    if isinstance(cursor, bytes):
+        cursor = cursor.decode()
+
+    direction, raw = cursor[:1], cursor[1:]
+
+    try:
+        if direction not in {_FORWARD, _BACKWARD}:
+            raise ValueError  # noqa: TRY301
+
+        key = tuple(_decode_value(value) for value in json.loads(raw)) if raw else None
+    except (ValueError, TypeError, KeyError, ArithmeticError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor value",
+        ) from None
+
+    return KeysetCursor(key=key, backwards=direction == _BACKWARD)
+
+
+def create_keyset_page_data(
+    cursor: KeysetCursor,
+    keys: Sequence[tuple[Any, ...]],
+    further: tuple[Any, ...] | None,
+) -> dict[str, Any]:
+    """
+    Create cursors of a keyset page.
+
+    Args:
+        cursor: cursor that was used to fetch the page.
+        keys: keys of the page rows in the order they are returned to the user.
+        further: key of the first row beyond the page in the fetch direction, `None` when there are no more rows.
+    """
+    # before - key of the row right before the page, beyond - key of the first row after the page
+    before, beyond = (further, cursor.key) if cursor.backwards else (cursor.key, further)
+    first, last = (keys[0], keys[-1]) if keys else (None, None)
+
+    current_forwards = KeysetCursor(before)
+    current_backwards = KeysetCursor(beyond, backwards=True)
+
+    previous = KeysetCursor(first if first is not None else beyond, backwards=True)
+    next_ = KeysetCursor(last if last is not None else before)
+
+    return {
+        "current": encode_keyset_cursor(current_backwards if cursor.backwards else current_forwards),
+        "current_backwards": encode_keyset_cursor(current_backwards),
+        "previous": encode_keyset_cursor(previous) if before is not None else None,
+        "next_": encode_keyset_cursor(next_) if beyond is not None else None,
+    }
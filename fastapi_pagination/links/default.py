@@ -8,11 +8,11 @@ __all__ = [
 
 from abc import ABC
 from math import ceil
-from typing import Any, TypeAlias
+from typing import TYPE_CHECKING, Any, TypeAlias
 
 from typing_extensions import TypeVar
 
-from fastapi_pagination.customization import CustomizedPage
+from fastapi_pagination.customization import CustomizedPage, UseModelConfig, UseName
 from fastapi_pagination.default import Page as BasePage
 
 from .bases import BaseLinksCustomizer, BaseUseHeaderLinks, BaseUseLinks, Links, create_links
@@ -47,7 +47,17 @@ class UseHeaderLinks(DefaultLinksCustomizer, BaseUseHeaderLinks):
     pass
 
 
-Page: TypeAlias = CustomizedPage[
-    BasePage[TAny],
-    UseLinks(),
-]
+if TYPE_CHECKING:
+    Page: TypeAlias = CustomizedPage[
+        BasePage[TAny],
+        UseLinks(),
+    ]
+else:
+    # base page is not parametrized at runtime, its schema would be built at import time otherwise,
+    # name is built the same way as for the parametrized base page to keep its schema name
+    Page = CustomizedPage[
+        BasePage,
+        UseLinks(),
+        UseName(f"{BasePage.__name__}[{TAny}]Customized"),
+        UseModelConfig(defer_build=True),
+    ]
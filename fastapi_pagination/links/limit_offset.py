@@ -9,11 +9,11 @@ __all__ = [
 
 from abc import ABC
 from math import floor, inf
-from typing import Any, TypeAlias, cast
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 from typing_extensions import TypeVar
 
-from fastapi_pagination.customization import CustomizedPage
+from fastapi_pagination.customization import CustomizedPage, UseModelConfig, UseName
 from fastapi_pagination.limit_offset import LimitOffsetPage as BasePage
 
 from .bases import BaseLinksCustomizer, BaseUseHeaderLinks, BaseUseLinks, Links, create_links
@@ -59,7 +59,17 @@ class UseLimitOffsetHeaderLinks(LimitOffsetLinksCustomizer, BaseUseHeaderLinks):
     pass
 
 
-LimitOffsetPage: TypeAlias = CustomizedPage[
-    BasePage[TAny],
-    UseLimitOffsetLinks(),
-]
+if TYPE_CHECKING:
+    LimitOffsetPage: TypeAlias = CustomizedPage[
+        BasePage[TAny],
+        UseLimitOffsetLinks(),
+    ]
+else:
+    # base page is not parametrized at runtime, its schema would be built at import time otherwise,
+    # name is built the same way as for the parametrized base page to keep its schema name
+    LimitOffsetPage = CustomizedPage[
+        BasePage,
+        UseLimitOffsetLinks(),
+        UseName(f"{BasePage.__name__}[{TAny}]Customized"),
+        UseModelConfig(defer_build=True),
+    ]
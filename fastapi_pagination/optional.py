@@ -7,20 +7,36 @@ __all__ = [
 
 from typing import TYPE_CHECKING, TypeVar
 
-from fastapi_pagination.customization import CustomizedPage, UseOptionalFields
+from fastapi_pagination.customization import CustomizedPage, UseModelConfig, UseName, UseOptionalFields
 from fastapi_pagination.default import Page
 from fastapi_pagination.limit_offset import LimitOffsetPage
 
 T = TypeVar("T")
 
-OptionalPage = CustomizedPage[
-    Page[T],
-    UseOptionalFields(),
-]
-OptionalLimitOffsetPage = CustomizedPage[
-    LimitOffsetPage[T],
-    UseOptionalFields(),
-]
+if TYPE_CHECKING:
+    OptionalPage = CustomizedPage[
+        Page[T],
+        UseOptionalFields(),
+    ]
+    OptionalLimitOffsetPage = CustomizedPage[
+        LimitOffsetPage[T],
+        UseOptionalFields(),
+    ]
+else:
+    # base pages are not parametrized at runtime, their schemas would be built at import time otherwise,
+    # names are built the same way as for the parametrized base pages to keep their schema names
+    OptionalPage = CustomizedPage[
+        Page,
+        UseOptionalFields(),
+        UseName(f"{Page.__name__}[{T}]Customized"),
+        UseModelConfig(defer_build=True),
+    ]
+    OptionalLimitOffsetPage = CustomizedPage[
+        LimitOffsetPage,
+        UseOptionalFields(),
+        UseName(f"{LimitOffsetPage.__name__}[{T}]Customized"),
+        UseModelConfig(defer_build=True),
+    ]
 
 if TYPE_CHECKING:
     from fastapi_pagination.default import Params as OptionalParams
@@ -1,24 +1,121 @@
 __all__ = [
+    "complete_model_build",
     "create_pydantic_model",
     "get_field_tp",
+    "get_items_fields",
     "get_model_fields",
     "is_pydantic_field",
     "make_field_optional",
     "make_field_required",
+    "trusted_construction",
 ]
 
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from copy import copy
-from typing import Any, TypeVar
+from functools import cache
+from typing import Any, TypeVar, get_args, get_origin
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PydanticUndefinedAnnotation
 from pydantic.fields import FieldInfo
 
 from fastapi_pagination.typing_utils import create_annotated_tp, remove_optional_from_tp
 
 TModel = TypeVar("TModel", bound=BaseModel)
 
+_trusted_construction: ContextVar[bool] = ContextVar("_trusted_construction", default=False)
+
+
+@contextmanager
+def trusted_construction(trusted: bool = True) -> Iterator[None]:
+    token = _trusted_construction.set(trusted)
+
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(token)
+
+
+def complete_model_build(model_cls: Any, /) -> None:
+    """
+    Builds schema of a model that was created with `defer_build` config.
+
+    Such models are built on first use otherwise.
+    """
+    if isinstance(model_cls, type) and issubclass(model_cls, BaseModel) and not model_cls.__pydantic_complete__:
+        with suppress(PydanticUndefinedAnnotation):
+            model_cls.model_rebuild()
+
+
+@cache
+def _get_items_tp(model_cls: type[BaseModel], /) -> Any:
+    try:
+        tp = model_cls.model_fields["items"].annotation
+    except KeyError:
+        return None
+
+    origin = get_origin(tp)
+    if not (isinstance(origin, type) and issubclass(origin, Sequence)):
+        return None
+
+    (item_tp,) = get_args(tp) or (Any,)
+    return item_tp
+
+
+@cache
+def get_items_fields(model_cls: type[BaseModel], /) -> tuple[str, ...] | None:
+    """
+    Returns names of attributes (or keys) that are read from items when page items are validated.
+
+    `None` is returned when they can't be determined, e.g. items are not pydantic models
+    or item model accepts extra fields.
+    """
+    item_tp = _get_items_tp(model_cls)
+    if not (isinstance(item_tp, type) and issubclass(item_tp, BaseModel)):
+        return None
+    if item_tp.model_config.get("extra") == "allow":
+        return None
+
+    config = item_tp.model_config
+    by_alias = config.get("validate_by_alias", True)
+    by_name = bool(config.get("validate_by_name") or config.get("populate_by_name")) or not by_alias
+
+    fields: dict[str, None] = {}
+    for name, field in item_tp.model_fields.items():
+        alias = field.validation_alias if field.validation_alias is not None else name
+        if not isinstance(alias, str):  # AliasPath or AliasChoices
+            return None
+
+        # both alias and name can be used to populate the field, so both of them are read from items
+        if by_alias:
+            fields[alias] = None
+        if by_name:
+            fields[name] = None
+
+    return tuple(fields)
+
+
+def _is_items_trusted(model_cls: type[BaseModel], items: Any) -> bool:
+    item_tp = _get_items_tp(model_cls)
+
+    # not parametrized page, items are not validated in this case
+    if item_tp is Any or isinstance(item_tp, TypeVar):
+        return True
+    if not isinstance(item_tp, type) or not isinstance(items, (list, tuple, Sequence)):
+        return False
+
+    # check unique types instead of each item, items usually have the same type
+    return all(issubclass(tp, item_tp) for tp in {*map(type, items)})
+
 
 def create_pydantic_model(model_cls: type[TModel], /, **kwargs: Any) -> TModel:
+    trusted = _trusted_construction.get() or getattr(model_cls, "__trusted_construction__", False)
+
+    # items already have declared type, so page metadata can be set without validation
+    if trusted and _is_items_trusted(model_cls, kwargs.get("items")):
+        return model_cls.model_construct(**kwargs)
+
     return model_cls.model_validate(kwargs, from_attributes=True)
 
 
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+__all__ = [
+    "StreamingFormat",
+    "StreamingPage",
+    "StreamingPageResponse",
+    "StreamingParams",
+    "create_streaming_page",
+]
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Generic, Literal, TypeAlias
+
+from fastapi import Query
+from pydantic import TypeAdapter
+from starlette.responses import StreamingResponse
+from typing_extensions import TypeVar
+
+from .api import _merge_sub_response, apply_items_transformer, create_page, resolve_items_transformer, resolve_params
+from .bases import AbstractParams
+from .limit_offset import LimitOffsetPage, LimitOffsetParams
+from .pydantic import _get_items_tp, trusted_construction
+from .types import ItemsTransformer
+
+TAny = TypeVar("TAny", default=Any)
+
+StreamingFormat: TypeAlias = Literal["ndjson", "csv"]
+
+_MEDIA_TYPES: dict[StreamingFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+_HEADER_PREFIX = "x-pagination-"
+
+
+class StreamingParams(LimitOffsetParams):
+    limit: int = Query(1_000, ge=1, le=1_000_000, description="Page size limit")
+
+
+class StreamingPage(LimitOffsetPage[TAny], Generic[TAny]):
+    """
+    Page that is used to declare streaming routes.
+
+    Route should use it as `response_model` and return `StreamingPageResponse` created by `create_streaming_page`,
+    items are written to the response body and other page fields are sent as `x-pagination-*` headers.
+    """
+
+    __params_type__ = StreamingParams
+
+
+class StreamingPageResponse(StreamingResponse):
+    pass
+
+
+# bounded, as item types can be created dynamically (e.g. parametrized generic models)
+@lru_cache(maxsize=128)
+def _get_item_type_adapter(item_tp: Any, /) -> TypeAdapter[Any]:
+    return TypeAdapter(item_tp)
+
+
+class _ItemSerializer:
+    def __init__(self, page_cls: type[Any]) -> None:
+        item_tp = _get_items_tp(page_cls)
+        if item_tp is None or isinstance(item_tp, TypeVar):
+            item_tp = Any
+
+        self.item_tp = item_tp
+        self.adapter = _get_item_type_adapter(item_tp)
+
+    def _validate(self, item: Any) -> Any:
+        if self.item_tp is Any or (isinstance(self.item_tp, type) and isinstance(item, self.item_tp)):
+            return item
+
+        return self.adapter.validate_python(item, from_attributes=True)
+
+    def to_json(self, item: Any) -> bytes:
+        return self.adapter.dump_json(self._validate(item), by_alias=True)
+
+    def to_python(self, item: Any) -> Any:
+        return self.adapter.dump_python(self._validate(item), mode="json", by_alias=True)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+
+    return value
+
+
+class _CSVEncoder:
+    def __init__(self, serializer: _ItemSerializer) -> None:
+        self.serializer = serializer
+        self.fields: list[str] | None = None
+
+    def __call__(self, chunk: Iterable[Any]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        for item in chunk:
+            data = self.serializer.to_python(item)
+
+            if not isinstance(data, dict):
+                writer.writerow([_csv_value(data)])
+                continue
+
+            if self.fields is None:
+                self.fields = [*data]
+                writer.writerow(self.fields)
+
+            writer.writerow([_csv_value(data.get(field)) for field in self.fields])
+
+        return buffer.getvalue().encode()
+
+
+class _NDJSONEncoder:
+    def __init__(self, serializer: _ItemSerializer) -> None:
+        self.serializer = serializer
+
+    def __call__(self, chunk: Iterable[Any]) -> bytes:
+        return b"".join([self.serializer.to_json(item) + b"\n" for item in chunk])
+
+
+def _iter_chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(items)
+
+    while chunk := [*islice(it, size)]:
+        yield chunk
+
+
+async def _aiter_chunks(items: AsyncIterable[Any], size: int) -> AsyncIterator[list[Any]]:
+    chunk: list[Any] = []
+
+    async for item in items:
+        chunk.append(item)
+
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _page_headers(page: Any) -> dict[str, str]:
+    headers = {}
+    for key, value in page.model_dump(mode="json", by_alias=True, exclude={"items"}).items():
+        if value is None:
+            continue
+
+        name = _HEADER_PREFIX + key.lower().replace("_", "-")
+        headers[name] = json.dumps(value, separators=(",", ":")) if isinstance(value, (dict, list)) else str(value)
+
+    return headers
+
+
+def create_streaming_page(
+    items: Iterable[Any] | AsyncIterable[Any],
+    /,
+    total: int | None = None,
+    params: AbstractParams | None = None,
+    *,
+    format: StreamingFormat = "ndjson",  # noqa: A002
+    chunk_size: int = 1_000,
+    transformer: ItemsTransformer | None = None,
+    **kwargs: Any,
+) -> StreamingPageResponse:
+    """
+    Creates a streaming response that writes items as NDJSON or CSV.
+
+    Items are consumed lazily by chunks of `chunk_size`, so only one chunk is kept in memory at a time.
+    Page metadata (total, limit, offset, etc.) is sent in `x-pagination-*` headers.
+    Items transformer is applied to each chunk separately.
+
+    Returns:
+        StreamingPageResponse: A response that streams serialized items.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than 0")
+
+    params = resolve_params(params)
+
+    with trusted_construction():
+        page = create_page([], total=total, params=params, **kwargs)
+
+    serializer = _ItemSerializer(type(page))
+    encoder = _CSVEncoder(serializer) if format == "csv" else _NDJSONEncoder(serializer)
+
+    # pagination context is not available anymore when body is being streamed
+    transformer = resolve_items_transformer(transformer)
+
+    content: Iterator[bytes] | AsyncIterator[bytes]
+    if isinstance(items, AsyncIterable):
+
+        async def _aiter_content() -> AsyncIterator[bytes]:
+            async for chunk in _aiter_chunks(items, chunk_size):
+                yield encoder(await apply_items_transformer(chunk, transformer, async_=True))
+
+        content = _aiter_content()
+    else:
+
+        def _iter_content() -> Iterator[bytes]:
+            for chunk in _iter_chunks(items, chunk_size):
+                yield encoder(apply_items_transformer(chunk, transformer))  # type: ignore[ty:invalid-argument-type]
+
+        content = _iter_content()
+
+    rsp = StreamingPageResponse(content, media_type=_MEDIA_TYPES[format], headers=_page_headers(page))
+
+    _merge_sub_response(rsp)
+    return rsp
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+__all__ = [
+    "AsyncTotalCache",
+    "InMemoryTotalCache",
+    "SyncTotalCache",
+    "TotalCache",
+    "TotalCacheKey",
+    "create_total_cache_key",
+]
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Hashable
+from typing import Any, Protocol, TypeAlias, runtime_checkable
+
+TotalCacheKey: TypeAlias = Hashable
+
+
+def create_total_cache_key(namespace: str, /, *parts: Any) -> str:
+    """
+    Create a stable cache key for a total count.
+
+    All parts are converted to their repr, so they should have deterministic repr
+    (compiled SQL, bound params, filter dicts, etc.).
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+@runtime_checkable
+class SyncTotalCache(Protocol):
+    def get(self, key: TotalCacheKey, /) -> int | None:  # pragma: no cover
+        pass
+
+    def set(self, key: TotalCacheKey, total: int, /) -> None:  # pragma: no cover
+        pass
+
+    def invalidate(self, key: TotalCacheKey, /) -> None:  # pragma: no cover
+        pass
+
+    def clear(self) -> None:  # pragma: no cover
+        pass
+
+
+@runtime_checkable
+class AsyncTotalCache(Protocol):
+    """
+    Protocol for external total caches (redis, memcached, etc.).
+
+    Can be used only with async paginate functions.
+    """
+
+    def get(self, key: TotalCacheKey, /) -> Awaitable[int | None]:  # pragma: no cover
+        pass
+
+    def set(self, key: TotalCacheKey, total: int, /) -> Awaitable[None]:  # pragma: no cover
+        pass
+
+    def invalidate(self, key: TotalCacheKey, /) -> Awaitable[None]:  # pragma: no cover
+        pass
+
+    def clear(self) -> Awaitable[None]:  # pragma: no cover
+        pass
+
+
+TotalCache: TypeAlias = SyncTotalCache | AsyncTotalCache
+
+
+class InMemoryTotalCache(SyncTotalCache):
+    """
+    In-process LRU cache with TTL for total counts.
+
+    Args:
+        maxsize: maximum number of cached totals, least recently used entries are evicted first.
+        ttl: time in seconds after which cached total is considered stale, `None` means no expiration.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 60.0) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._data: OrderedDict[TotalCacheKey, tuple[int, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: TotalCacheKey, /) -> int | None:
+        with self._lock:
+            try:
+                total, expires_at = self._data[key]
+            except KeyError:
+                return None
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return total
+
+    def set(self, key: TotalCacheKey, total: int, /) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (total, expires_at)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: TotalCacheKey, /) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
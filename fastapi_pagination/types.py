@@ -2,6 +2,7 @@ __all__ = [
     "AdditionalData",
     "AdditionalDataCallable",
     "AdditionalDataResult",
+    "ApproximateTotal",
     "AsyncAdditionalData",
     "AsyncAdditionalDataCallable",
     "AsyncItemsTransformer",
@@ -34,6 +35,13 @@ AsyncItemsTransformer: TypeAlias = Callable[[Sequence[Any]], Sequence[Any] | Awa
 SyncItemsTransformer: TypeAlias = Callable[[Sequence[Any]], Sequence[Any]]
 ItemsTransformer: TypeAlias = AsyncItemsTransformer | SyncItemsTransformer
 
+
+class ApproximateTotal(int):
+    """
+    Total that was estimated using database statistics instead of exact count.
+    """
+
+
 if TYPE_CHECKING:
     GreaterEqualZero: TypeAlias = int
     GreaterEqualOne: TypeAlias = int
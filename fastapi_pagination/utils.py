@@ -20,6 +20,8 @@ import functools
 import inspect
 import warnings
 from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Annotated, Any, Literal, TypeVar, cast, get_origin, overload
 
 from typing_extensions import ParamSpec, TypeIs
@@ -121,13 +123,15 @@ _EXTENSIONS = [
 ]
 
 
-def _check_installed(module: str) -> bool:
-    try:
-        __import__(module)
-    except ImportError:
-        return False
-    else:
-        return True
+@functools.cache
+def _find_installed_extension() -> str | None:
+    # find_spec does not import the package, so heavy libraries are not loaded on the request path
+    for ext in _EXTENSIONS:
+        with suppress(ImportError, ValueError):
+            if find_spec(ext) is not None:
+                return ext
+
+    return None
 
 
 class FastAPIPaginationWarning(UserWarning):
@@ -153,18 +157,34 @@ def disable_installed_extensions_check() -> None:
     _CHECK_INSTALLED_EXTENSIONS = False
 
 
+def _is_warning_ignored(message: str, category: type[Warning]) -> bool:
+    for action, msg, cat, mod, lineno in warnings.filters:
+        # module and line specific filters depend on the caller, let warnings module decide
+        if mod is not None or lineno:
+            return False
+
+        if (msg is None or msg.match(message)) and issubclass(category, cat):
+            return action == "ignore"
+
+    return warnings.defaultaction == "ignore"  # type: ignore[ty:unresolved-attribute]
+
+
 def check_installed_extensions() -> None:
     if not _CHECK_INSTALLED_EXTENSIONS:
         return
 
-    for ext in _EXTENSIONS:
-        if _check_installed(f"fastapi_pagination.ext.{ext}"):
-            warnings.warn(
-                _WARNING_MSG.format(ext=ext),
-                FastAPIPaginationWarning,
-                stacklevel=3,
-            )
-            break
+    if (ext := _find_installed_extension()) is None:
+        return
+
+    message = _WARNING_MSG.format(ext=ext)
+    if _is_warning_ignored(message, FastAPIPaginationWarning):
+        return
+
+    warnings.warn(
+        message,
+        FastAPIPaginationWarning,
+        stacklevel=3,
+    )
 
 
 def get_caller(depth: int = 1) -> str | None:
@@ -1,7 +1,14 @@
+import json
+from typing import Any
+
 import pytest
-from asyncpg import create_pool
+from asyncpg import connect, create_pool
 
-from fastapi_pagination.ext.asyncpg import apaginate
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.columnar import items_to_columns
+from fastapi_pagination.customization import CustomizedPage, UseApproximateTotal
+from fastapi_pagination.ext.asyncpg import apaginate, astream_paginate
+from fastapi_pagination.streaming import StreamingPage, StreamingParams
 from tests.base import BasePaginationTestSuite
 
 
@@ -34,3 +41,114 @@ class TestAsyncpg(BasePaginationTestSuite):
                 return await apaginate(conn, "SELECT id, name FROM users")
 
         return builder.build()
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize(
+    ("threshold", "is_approximate"),
+    [(0, True), (10**9, False)],
+    ids=["estimated", "exact"],
+)
+async def test_approximate_total(database_url, entities, threshold, is_approximate):
+    conn = await connect(database_url)
+
+    try:
+        with set_page(CustomizedPage[Page[Any], UseApproximateTotal()]):
+            page = await apaginate(
+                conn,
+                "SELECT id, name FROM users WHERE id > $1",
+                10,
+                params=Params(page=1, size=10),
+                approximate_total=True,
+                approximate_total_threshold=threshold,
+            )
+    finally:
+        await conn.close()
+
+    assert page.total_is_approximate is is_approximate
+    assert len(page.items) == 10
+
+    if not is_approximate:
+        assert page.total == len(entities) - 10
+
+
+@pytest.mark.asyncio(scope="session")
+@pytest.mark.parametrize(("page", "total"), [(1, 90), (100, 90)], ids=["first", "past-end"])
+async def test_inline_count(database_url, entities, page, total):
+    conn = await connect(database_url)
+
+    try:
+        with set_page(Page[Any]):
+            result = await apaginate(
+                conn,
+                "SELECT id, name FROM users WHERE id > $1 ORDER BY id",
+                10,
+                params=Params(page=page, size=10),
+                inline_count=True,
+            )
+    finally:
+        await conn.close()
+
+    expected = sorted((e for e in entities if e.id > 10), key=lambda e: e.id)[(page - 1) * 10 : page * 10]
+
+    assert result.total == total
+    assert result.items == [{"id": e.id, "name": e.name} for e in expected]
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_paginate_query_prepared_once(database_url, entities):
+    conn = await connect(database_url)
+
+    try:
+        with set_page(Page[Any]):
+            for page in range(1, 4):
+                await apaginate(conn, "SELECT id, name FROM users ORDER BY id", params=Params(page=page, size=10))
+
+        statements = await conn.fetch("SELECT statement FROM pg_prepared_statements")
+    finally:
+        await conn.close()
+
+    assert len([s for (s,) in statements if "LIMIT" in s]) == 1
+    assert len([s for (s,) in statements if "count(*)" in s]) == 1
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_records_to_columns(database_url, entities):
+    conn = await connect(database_url)
+
+    try:
+        records = await conn.fetch("SELECT id, name FROM users ORDER BY id LIMIT 3")
+    finally:
+        await conn.close()
+
+    expected = sorted(entities, key=lambda entity: entity.id)[:3]
+
+    assert items_to_columns(records) == {
+        "id": [entity.id for entity in expected],
+        "name": [entity.name for entity in expected],
+    }
+
+
+@pytest.mark.asyncio(scope="session")
+async def test_astream_paginate(database_url, entities):
+    conn = await connect(database_url)
+
+    try:
+        with set_page(StreamingPage[Any]):
+            rsp = await astream_paginate(
+                conn,
+                "SELECT id, name FROM users WHERE id > $1 ORDER BY id",
+                10,
+                params=StreamingParams(limit=30, offset=5),
+                chunk_size=7,
+            )
+
+        # rows are fetched while the body is being sent
+        lines = [line async for chunk in rsp.body_iterator for line in chunk.splitlines()]
+    finally:
+        await conn.close()
+
+    expected = sorted((e for e in entities if e.id > 10), key=lambda e: e.id)[5:35]
+
+    assert rsp.headers["x-pagination-total"] == str(len(entities) - 10)
+    assert [json.loads(line) for line in lines] == [{"id": e.id, "name": e.name} for e in expected]
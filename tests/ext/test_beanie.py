@@ -1,10 +1,14 @@
+from typing import Any
+
 import pytest
-from beanie import Document, init_beanie
+from beanie import Document, PydanticObjectId, init_beanie
 from pydantic import BaseModel, Field
 from pymongo import AsyncMongoClient
 from pytest_asyncio import fixture as async_fixture
 
-from fastapi_pagination.ext.beanie import apaginate
+from fastapi_pagination import set_page
+from fastapi_pagination.cursor import CursorPage, CursorParams, encode_cursor
+from fastapi_pagination.ext.beanie import apaginate, parse_cursor
 from tests.base import BasePaginationTestSuite
 
 from .utils import mongodb_test
@@ -147,6 +151,9 @@ class TestBeanieAggregate(BasePaginationTestSuite):
 
         return entities
 
+    def _prepare_cursor_entities(self, entities):
+        return entities
+
     @pytest.fixture(scope="session")
     def app(self, builder, be_user, aggr_query):
         builder = builder.new()
@@ -156,8 +163,77 @@ class TestBeanieAggregate(BasePaginationTestSuite):
 
         builder = builder.classes.update(model=Model)
 
+        @builder.cursor.default
+        async def cursor_route():
+            return await apaginate(aggr_query)
+
         @builder.both.default
         async def route():
             return await apaginate(aggr_query)
 
         return builder.build()
+
+
+def test_parse_cursor():
+    object_id = "5f0e7b3e9b1e8a1c2c3d4e5f"
+
+    assert parse_cursor(object_id) == PydanticObjectId(object_id)
+    assert parse_cursor(f"prev_{object_id}") == PydanticObjectId(object_id)
+
+    with pytest.raises(ValueError, match=r"Invalid cursor"):
+        parse_cursor("prev_invalid")
+
+
+@pytest.mark.usefixtures("db_client")
+@mongodb_test
+class TestBeanieLegacyCursor:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_legacy_cursor(self, be_user):
+        documents = await be_user.find_all().sort("_id").to_list()
+        object_id = documents[4].id
+
+        for cursor, expected in [(f"{object_id}", documents[5:8]), (f"prev_{object_id}", documents[1:4])]:
+            with (
+                set_page(CursorPage[Any]),
+                pytest.warns(DeprecationWarning, match=r"cursors in '<id>' and 'prev_<id>' format are deprecated"),
+            ):
+                page = await apaginate(be_user, params=CursorParams(size=3, cursor=encode_cursor(cursor)))
+
+            assert page.items == expected
+
+
+class _UserKeysetProjection(BaseModel):
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+
+
+@pytest.mark.usefixtures("db_client")
+@mongodb_test
+class TestBeanieCursorProjection:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_projection_with_sort_fields(self, be_user):
+        documents = await be_user.find_all().sort("name", "_id").to_list()
+
+        with set_page(CursorPage[Any]):
+            page = await apaginate(
+                be_user.find_all().sort("name"),
+                params=CursorParams(size=3),
+                projection_model=_UserKeysetProjection,
+            )
+            next_page = await apaginate(
+                be_user.find_all().sort("name"),
+                params=CursorParams(size=3, cursor=page.next_page),
+                projection_model=_UserKeysetProjection,
+            )
+
+        assert [item.id for item in [*page.items, *next_page.items]] == [document.id for document in documents[:6]]
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_projection_without_sort_fields(self, be_user):
+        with (
+            set_page(CursorPage[Any]),
+            pytest.raises(ValueError, match=r"sort fields to be part of the projection model, missing: _id"),
+        ):
+            await apaginate(
+                be_user.find_all().sort("name"), params=CursorParams(size=3), projection_model=_UserProjection
+            )
@@ -4,9 +4,14 @@ import sqlite3
 import pytest
 from django import setup
 from django.conf import settings
-from django.db import models
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from pydantic import BaseModel
 
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.config import Config
 from fastapi_pagination.ext.django import paginate
+from fastapi_pagination.total_cache import InMemoryTotalCache
 from tests.base import BasePaginationTestSuite
 
 os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "True"
@@ -70,3 +75,39 @@ class TestDjango(BasePaginationTestSuite):
             return paginate(query)
 
         return builder.build()
+
+
+class _UserIdOut(BaseModel):
+    id: int
+
+
+@pytest.mark.parametrize(
+    ("projection_pushdown", "name_loaded"),
+    [(True, False), (False, True)],
+    ids=["pushdown", "no-pushdown"],
+)
+def test_projection_pushdown(user_cls, entities, projection_pushdown, name_loaded):
+    with CaptureQueriesContext(connection) as ctx, set_page(Page[_UserIdOut]):
+        page = paginate(
+            user_cls.objects.order_by("id"),
+            params=Params(page=1, size=5),
+            config=Config(projection_pushdown=projection_pushdown),
+        )
+
+    assert page.total == len(entities)
+    assert [item.id for item in page.items] == sorted(entity.id for entity in entities)[:5]
+
+    (items_query,) = [query["sql"] for query in ctx.captured_queries if "COUNT" not in query["sql"]]
+    assert ('"users"."name"' in items_query) is name_loaded
+
+
+def test_total_cache_key_includes_params(user_cls, entities):
+    cache = InMemoryTotalCache()
+    config = Config(total_cache=cache)
+
+    with set_page(Page[_UserIdOut]):
+        # both filters are rendered as IN (a, b) by str(query)
+        paginate(user_cls.objects.filter(name__in=["a, b"]), params=Params(), config=config)
+        paginate(user_cls.objects.filter(name__in=["a", "b"]), params=Params(), config=config)
+
+    assert len(cache) == 2
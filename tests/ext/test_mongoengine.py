@@ -42,6 +42,10 @@ def query(request, user):
 class TestMongoEngine(BasePaginationTestSuite):
     @pytest.fixture(scope="session")
     def app(self, builder, db_connect, query):
+        @builder.cursor.default
+        def cursor_route():
+            return paginate(query.objects.order_by("id") if isinstance(query, type) else query.order_by("id"))
+
         @builder.both.default
         def route():
             return paginate(query)
@@ -242,6 +242,41 @@ class TestPeeweeRawSQL(_PeeweePaginateFunc):
 
         assert page.total == 100
 
+    @pytest.mark.parametrize(("page", "total"), [(1, 100), (100, 100)], ids=["first", "past-end"])
+    def test_paginate_raw_sql_inline_count(self, peewee_db, peewee_user, entities, page, total):
+        with peewee_db.atomic():
+            peewee_db.create_tables([peewee_user], safe=True)
+
+        with set_page(Page):
+            result = paginate(
+                "SELECT id, name FROM users ORDER BY id",
+                params=Params(page=page, size=10),
+                db=peewee_db,
+                inline_count=True,
+            )
+
+        assert result.total == total
+        assert result.items == [{"id": e.id, "name": e.name} for e in entities[(page - 1) * 10 : page * 10]]
+
+    def test_paginate_raw_sql_inline_count_order_by(self, peewee_db, peewee_user, entities):
+        with peewee_db.atomic():
+            peewee_db.create_tables([peewee_user], safe=True)
+
+        with set_page(Page):
+            result = paginate(
+                "SELECT u.id, u.name FROM users AS u ORDER BY u.id DESC",
+                params=Params(page=2, size=10),
+                db=peewee_db,
+                inline_count=True,
+            )
+
+        assert result.total == 100
+        assert result.items == [{"id": e.id, "name": e.name} for e in [*reversed(entities)][10:20]]
+
+    def test_paginate_inline_count_model_select(self, peewee_db, peewee_user):
+        with pytest.raises(ValueError, match="inline_count is supported only for raw SQL queries"):
+            paginate(peewee_user.select(), params=Params(), inline_count=True)
+
 
 class TestPeeweeCreateCountQuery:
     def test_create_count_query_with_model_select(self, peewee_db, peewee_user):
@@ -1,10 +1,17 @@
+import asyncio
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Any
 
 import pytest
 from psycopg import AsyncConnection, Connection
-from psycopg.rows import dict_row
+from psycopg.rows import class_row, dict_row, namedtuple_row, tuple_row
 from psycopg.sql import SQL, Identifier
 
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.config import Config
+from fastapi_pagination.customization import CustomizedPage, UseApproximateTotal
 from fastapi_pagination.ext.psycopg import apaginate, paginate
 from tests.base import BasePaginationTestSuite, async_sync_testsuite
 from tests.utils import maybe_async
@@ -78,3 +85,134 @@ class TestPsycopg(BasePaginationTestSuite):
                 return await maybe_async(paginate_func(conn, query_factory(), query_params=query_params))
 
         return builder.build()
+
+
+@pytest.mark.parametrize(
+    ("threshold", "is_approximate"),
+    [(0, True), (10**9, False)],
+    ids=["estimated", "exact"],
+)
+def test_approximate_total(database_url, entities, threshold, is_approximate):
+    with (
+        Connection.connect(database_url, row_factory=dict_row) as conn,
+        set_page(CustomizedPage[Page[Any], UseApproximateTotal()]),
+    ):
+        page = paginate(
+            conn,
+            "SELECT id, name FROM users WHERE id > %s",
+            10,
+            params=Params(page=1, size=10),
+            approximate_total=True,
+            approximate_total_threshold=threshold,
+        )
+
+    assert page.total_is_approximate is is_approximate
+    assert len(page.items) == 10
+
+    if not is_approximate:
+        assert page.total == len(entities) - 10
+
+
+@dataclass
+class _UserRow:
+    id: int
+    name: Any
+
+
+@pytest.mark.parametrize(
+    ("row_factory", "get_id"),
+    [
+        (tuple_row, itemgetter(0)),
+        (dict_row, itemgetter("id")),
+        (namedtuple_row, attrgetter("id")),
+        (class_row(_UserRow), attrgetter("id")),
+    ],
+    ids=["tuple", "dict", "namedtuple", "class"],
+)
+@pytest.mark.parametrize(("page", "total"), [(1, 90), (100, 90)], ids=["first", "past-end"])
+def test_inline_count(database_url, entities, row_factory, get_id, page, total):
+    with (
+        Connection.connect(database_url, row_factory=row_factory) as conn,
+        set_page(Page[Any]),
+    ):
+        result = paginate(
+            conn,
+            "SELECT id, name FROM users WHERE id > %s ORDER BY id",
+            10,
+            params=Params(page=page, size=10),
+            inline_count=True,
+        )
+
+    expected = sorted((e for e in entities if e.id > 10), key=lambda e: e.id)[(page - 1) * 10 : page * 10]
+
+    assert result.total == total
+    # text columns are compared by ids, as they can be loaded as bytes depending on the database encoding
+    assert [get_id(row) for row in result.items] == [e.id for e in expected]
+    # inline count column is not included in rows
+    assert all(len(row) == 2 for row in result.items if not isinstance(row, _UserRow))
+
+
+@pytest.mark.parametrize("query_params", [(0,), {"id": 0}], ids=["args", "kwargs"])
+def test_paginate_query_prepared_once(database_url, entities, query_params):
+    placeholder = "%s" if isinstance(query_params, tuple) else "%(id)s"
+
+    with Connection.connect(database_url, prepare_threshold=0) as conn, set_page(Page[Any]):
+        for page in range(1, 4):
+            paginate(
+                conn,
+                f"SELECT id, name FROM users WHERE id > {placeholder} ORDER BY id",  # noqa: S608
+                query_params=query_params,
+                params=Params(page=page, size=10),
+            )
+
+        (prepared,) = conn.execute(
+            "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE '%%LIMIT%%'",
+            prepare=False,
+        ).fetchone()
+
+    assert prepared == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("is_async", [False, True], ids=["sync", "async"])
+@pytest.mark.parametrize("autocommit", [False, True], ids=["transaction", "autocommit"])
+async def test_fetch_batch_size(database_url, entities, is_async, autocommit):
+    batches: list[int] = []
+
+    def transformer(items):
+        batches.append(len(items))
+        return [row["id"] for row in items]
+
+    kwargs = {
+        "params": Params(page=2, size=25),
+        "transformer": transformer,
+        "config": Config(fetch_batch_size=10),
+    }
+
+    with set_page(Page[Any]):
+        if is_async:
+            async with await AsyncConnection.connect(database_url, row_factory=dict_row, autocommit=autocommit) as conn:
+                page = await apaginate(conn, "SELECT id, name FROM users ORDER BY id", **kwargs)
+        else:
+            with Connection.connect(database_url, row_factory=dict_row, autocommit=autocommit) as conn:
+                page = paginate(conn, "SELECT id, name FROM users ORDER BY id", **kwargs)
+
+    assert batches == [10, 10, 5]
+    assert page.items == sorted(e.id for e in entities)[25:50]
+    assert page.total == len(entities)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_fetch_batch_size_concurrent(database_url, entities):
+    ids = sorted(e.id for e in entities)
+    query = "SELECT id FROM users ORDER BY id"
+    config = Config(fetch_batch_size=5)
+
+    with set_page(Page[Any]):
+        async with await AsyncConnection.connect(database_url) as conn:
+            # server-side cursors of both paginations are open at the same time on the same connection
+            pages = await asyncio.gather(
+                *[apaginate(conn, query, params=Params(page=page, size=20), config=config) for page in (1, 2)],
+            )
+
+    assert [[row[0] for row in page.items] for page in pages] == [ids[:20], ids[20:40]]
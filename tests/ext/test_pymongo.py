@@ -2,8 +2,18 @@ import pytest
 from pymongo import AsyncMongoClient, MongoClient
 from pytest_asyncio import fixture as async_fixture
 
-from fastapi_pagination.ext.pymongo import apaginate, apaginate_aggregate, paginate, paginate_aggregate
+from fastapi_pagination import set_page
+from fastapi_pagination.ext.pymongo import (
+    apaginate,
+    apaginate_aggregate,
+    astream_paginate,
+    paginate,
+    paginate_aggregate,
+    stream_paginate,
+)
+from fastapi_pagination.streaming import StreamingPage, StreamingParams
 from tests.base import BasePaginationTestSuite, async_sync_testsuite
+from tests.schemas import UserOut
 from tests.utils import maybe_async
 
 from .utils import mongodb_test
@@ -36,6 +46,10 @@ class TestPymongo(_BasePymongoSuite, BasePaginationTestSuite):
     def app(self, builder, db_client, paginate_func):
         builder = builder.new()
 
+        @builder.cursor.default
+        async def cursor_route():
+            return await maybe_async(paginate_func(db_client.test.users, sort=[("id", 1)]))
+
         @builder.both.default
         async def route():
             return await maybe_async(paginate_func(db_client.test.users))
@@ -61,20 +75,52 @@ class TestPymongoAggregate(_BasePymongoSuite, BasePaginationTestSuite):
         )
         return await maybe_async(cursor.to_list(length=None))
 
+    def _prepare_cursor_entities(self, entities):
+        return entities
+
+    @pytest.fixture(scope="session", params=[True, False], ids=["facet", "no-facet"])
+    def use_facet(self, request):
+        return request.param
+
     @pytest.fixture(scope="session")
-    def app(self, builder, db_client, paginate_func):
+    def app(self, builder, db_client, paginate_func, use_facet):
         builder = builder.new()
+        pipeline = [
+            {"$group": {"_id": "$name", "name": {"$first": "$name"}}},
+            {"$sort": {"name": 1}},
+        ]
+
+        @builder.cursor.default
+        async def cursor_route():
+            return await maybe_async(paginate_func(db_client.test_agg.users, pipeline, use_facet=use_facet))
 
         @builder.both.default
         async def route():
-            return await maybe_async(
-                paginate_func(
-                    db_client.test_agg.users,
-                    [
-                        {"$group": {"_id": "$name", "name": {"$first": "$name"}}},
-                        {"$sort": {"name": 1}},
-                    ],
+            return await maybe_async(paginate_func(db_client.test_agg.users, pipeline, use_facet=use_facet))
+
+        return builder.build()
+
+
+@mongodb_test
+class TestPymongoStreaming(_BasePymongoSuite):
+    @pytest.mark.asyncio(scope="session")
+    async def test_stream_paginate(self, db_client, is_async_db, entities):
+        stream_func = astream_paginate if is_async_db else stream_paginate
+
+        with set_page(StreamingPage[UserOut]):
+            rsp = await maybe_async(
+                stream_func(
+                    db_client.test.users,
+                    params=StreamingParams(limit=30, offset=10),
+                    sort=[("id", 1)],
+                    chunk_size=7,
                 )
             )
 
-        return builder.build()
+        body = b"".join([chunk async for chunk in rsp.body_iterator])
+        expected = sorted(entities, key=lambda e: e.id)[10:40]
+
+        assert rsp.headers["x-pagination-total"] == str(len(entities))
+        assert [UserOut.model_validate_json(line) for line in body.splitlines()] == [
+            UserOut(id=e.id, name=e.name) for e in expected
+        ]
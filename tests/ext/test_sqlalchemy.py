@@ -1,19 +1,39 @@
 from contextlib import closing
+from functools import partial
 from typing import Any
 
 import pytest
-from fastapi import Depends
-from sqlalchemy import func, select, text
-from sqlalchemy.orm import selectinload
-
-from fastapi_pagination import Page, Params, set_page, set_params
-from fastapi_pagination.cursor import CursorPage
-from fastapi_pagination.customization import CustomizedPage, UseAdditionalFields, UseQuotedCursor
-from fastapi_pagination.ext.sqlalchemy import apaginate, paginate
+from fastapi import Depends, FastAPI, HTTPException
+from pydantic import BaseModel
+from sqlalchemy import case, create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, selectinload
+
+from fastapi_pagination import Page, Params, add_pagination, set_page, set_params
+from fastapi_pagination.columnar import columnar_transformer
+from fastapi_pagination.config import Config
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.customization import (
+    CustomizedPage,
+    UseAdditionalFields,
+    UseApproximateTotal,
+    UseQuotedCursor,
+)
+from fastapi_pagination.ext.sqlalchemy import (
+    apaginate,
+    astream_paginate,
+    create_total_cache_key,
+    paginate,
+    stream_paginate,
+)
+from fastapi_pagination.iterators import iter_pages
+from fastapi_pagination.keyset import KeysetCursor, encode_keyset_cursor
+from fastapi_pagination.streaming import StreamingPage
+from fastapi_pagination.total_cache import InMemoryTotalCache
 from tests.base import BasePaginationTestSuite, SuiteBuilder, async_sync_testsuite, sync_testsuite
 from tests.ext.utils import is_sqlalchemy20
 from tests.schemas import UserOut, UserWithoutIDOut
-from tests.utils import maybe_async
+from tests.utils import create_ctx, maybe_async
 
 
 class _SQLAlchemyPaginateFuncMixin:
@@ -490,3 +510,343 @@ class TestSQLAlchemyInlineCount:
             )
 
         assert page.page_item_count == len(page.items)
+
+
+class TestSQLAlchemyTotalCache:
+    def test_total_cache_key(self, sa_session, sa_user):
+        with closing(sa_session()) as session:
+            key = create_total_cache_key(session, select(sa_user).where(sa_user.id > 10))
+
+            assert key == create_total_cache_key(session, select(sa_user).where(sa_user.id > 10))
+            assert key != create_total_cache_key(session, select(sa_user).where(sa_user.id > 20))
+            assert key != create_total_cache_key(session, select(sa_user).where(sa_user.id > 10), subquery_count=False)
+
+    def test_total_cache(self, sa_session, sa_user, entities):
+        cache = InMemoryTotalCache()
+        config = Config(total_cache=cache)
+        query = select(sa_user).where(sa_user.id > 10)
+
+        with closing(sa_session()) as session, set_page(Page[UserOut]):
+            key = create_total_cache_key(session, query)
+            cache.set(key, 1_000)
+
+            page = paginate(session, query, params=Params(page=1, size=10), config=config)
+            assert page.total == 1_000
+
+            cache.invalidate(key)
+
+            page = paginate(session, query, params=Params(page=1, size=10), config=config)
+            assert page.total == len(entities) - 10
+            assert cache.get(key) == len(entities) - 10
+
+
+class TestSQLAlchemyAdaptiveTotal:
+    @pytest.mark.parametrize(
+        ("size", "expected_statements"),
+        [(10, 1), (2, 2)],
+        ids=["short-page", "full-page"],
+    )
+    def test_adaptive_total(self, sa_session, sa_user, entities, size, expected_statements):
+        query = select(sa_user).where(sa_user.id.in_([e.id for e in entities[:3]]))
+        statements: list[str] = []
+
+        def _on_execute(conn, cursor, statement, *_):
+            statements.append(statement)
+
+        with closing(sa_session()) as session, set_page(Page[UserOut]):
+            engine = session.get_bind()
+            event.listen(engine, "before_cursor_execute", _on_execute)
+            try:
+                page = paginate(session, query, params=Params(page=1, size=size), config=Config(adaptive_total=True))
+            finally:
+                event.remove(engine, "before_cursor_execute", _on_execute)
+
+        assert page.total == 3
+        assert len(statements) == expected_statements
+
+    def test_adaptive_total_uniqued_rows(self, sa_session, sa_user, sa_order, entities):
+        entity = next(entity for entity in entities if len(entity.orders) > 1)
+        # join returns a row per order, rows are uniqued to a single user
+        query = select(sa_user).join(sa_order).where(sa_user.id == entity.id)
+        params = Params(page=1, size=len(entity.orders))
+
+        with closing(sa_session()) as session, set_page(Page[UserOut]):
+            page = paginate(session, query, params=params, config=Config(adaptive_total=True))
+            expected = paginate(session, query, params=params)
+
+        assert len(page.items) == 1
+        assert page.total == expected.total == len(entity.orders)
+
+
+class _UserIdOut(BaseModel):
+    id: int
+
+
+class TestSQLAlchemyProjectionPushdown:
+    @pytest.mark.parametrize(
+        ("projection_pushdown", "name_loaded"),
+        [(True, False), (False, True)],
+        ids=["pushdown", "no-pushdown"],
+    )
+    def test_projection_pushdown(self, sa_session, sa_user, entities, projection_pushdown, name_loaded):
+        statements: list[str] = []
+
+        def _on_execute(conn, cursor, statement, *_):
+            statements.append(statement)
+
+        with closing(sa_session()) as session, set_page(Page[_UserIdOut]):
+            engine = session.get_bind()
+            event.listen(engine, "before_cursor_execute", _on_execute)
+            try:
+                page = paginate(
+                    session,
+                    select(sa_user).order_by(sa_user.id),
+                    params=Params(page=1, size=5),
+                    config=Config(projection_pushdown=projection_pushdown),
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", _on_execute)
+
+        assert page.total == len(entities)
+        assert [item.id for item in page.items] == sorted(entity.id for entity in entities)[:5]
+
+        (items_statement,) = [statement for statement in statements if "count" not in statement.lower()]
+        assert ("users.name" in items_statement) is name_loaded
+
+
+def test_columnar_transformer(sa_session, sa_user, entities):
+    transformer = columnar_transformer(lambda columns: {"name": [name.upper() for name in columns["name"]]})
+
+    with closing(sa_session()) as session, set_page(Page[UserOut]):
+        page = paginate(
+            session,
+            select(sa_user.id, sa_user.name).order_by(sa_user.id),
+            params=Params(page=1, size=5),
+            transformer=transformer,
+        )
+
+    expected = sorted(entities, key=lambda entity: entity.id)[:5]
+    assert page.items == [UserOut(id=entity.id, name=entity.name.upper()) for entity in expected]
+
+
+class TestSQLAlchemyApproximateTotal:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            lambda sa_user: select(sa_user),
+            lambda sa_user: select(sa_user).where(sa_user.id > 0),
+            lambda sa_user: select(sa_user).from_statement(text("SELECT * FROM users")),
+            lambda sa_user: text("SELECT * FROM users"),
+        ],
+        ids=["unfiltered", "filtered", "from-statement", "raw"],
+    )
+    def test_approximate_total(self, sa_session, sa_user, entities, db_type, query):
+        with closing(sa_session()) as session, set_page(CustomizedPage[Page[Any], UseApproximateTotal()]):
+            page = paginate(
+                session,
+                query(sa_user),
+                params=Params(page=1, size=10),
+                approximate_total=True,
+                approximate_total_threshold=0,
+            )
+
+        # approximate total supported only for postgres, other databases fallback to exact count
+        assert page.total_is_approximate is (db_type == "postgres")
+        assert len(page.items) == 10
+
+        if db_type != "postgres":
+            assert page.total == len(entities)
+
+    def test_approximate_total_below_threshold(self, sa_session, sa_user, entities):
+        with closing(sa_session()) as session, set_page(CustomizedPage[Page[Any], UseApproximateTotal()]):
+            page = paginate(
+                session,
+                select(sa_user),
+                params=Params(page=1, size=10),
+                approximate_total=True,
+                approximate_total_threshold=10**9,
+            )
+
+        assert page.total_is_approximate is False
+        assert page.total == len(entities)
+
+
+def _create_sa_session(database_url: str, is_async: bool) -> Any:
+    # session is created from the url of the test database, session-scoped sa_session fixture
+    # can be already created for another engine type by previous tests
+    url = database_url.replace("+asyncpg", "", 1).replace("+aiosqlite", "", 1)
+
+    if is_async:
+        url = url.replace("postgresql", "postgresql+asyncpg", 1).replace("sqlite", "sqlite+aiosqlite", 1)
+        return partial(AsyncSession, create_async_engine(url))
+
+    return partial(Session, create_engine(url))
+
+
+class TestSQLAlchemyFetchBatchSize:
+    @pytest.mark.parametrize("is_async", [True, False], ids=["async", "sync"])
+    @pytest.mark.parametrize(
+        "query",
+        [
+            lambda sa_user: select(sa_user).order_by(sa_user.id),
+            lambda sa_user: select(sa_user.id, sa_user.name).order_by(sa_user.id),
+        ],
+        ids=["scalar", "non-scalar"],
+    )
+    @pytest.mark.asyncio(scope="session")
+    async def test_fetch_batch_size(self, database_url, sa_user, entities, is_async, query):
+        batches: list[int] = []
+
+        def transformer(items):
+            batches.append(len(items))
+            return [UserOut(id=item.id, name=item.name) for item in items]
+
+        kwargs = {
+            "params": Params(page=2, size=25),
+            "transformer": transformer,
+            "config": Config(fetch_batch_size=10),
+        }
+
+        sa_session = _create_sa_session(database_url, is_async)
+
+        with set_page(Page[UserOut]):
+            if is_async:
+                async with sa_session() as session:
+                    page = await apaginate(session, query(sa_user), **kwargs)
+
+                await session.bind.dispose()
+            else:
+                with sa_session() as session:
+                    page = paginate(session, query(sa_user), **kwargs)
+
+                session.bind.dispose()
+
+        assert batches == [10, 10, 5]
+        assert page.items == [UserOut(id=e.id, name=e.name) for e in entities[25:50]]
+        assert page.total == len(entities)
+
+
+def _nullable_name(sa_user):
+    return case((sa_user.id % 3 == 0, None), else_=sa_user.name)
+
+
+class TestSQLAlchemyKeysetCursor:
+    @pytest.mark.parametrize(
+        "order_by",
+        [
+            lambda sa_user: [sa_user.id.desc()],
+            lambda sa_user: [sa_user.name, sa_user.id],
+            lambda sa_user: [sa_user.name.desc(), sa_user.id],
+            lambda sa_user: [_nullable_name(sa_user), sa_user.id],
+            lambda sa_user: [_nullable_name(sa_user).desc(), sa_user.id.desc()],
+            lambda sa_user: [_nullable_name(sa_user).asc().nulls_last(), sa_user.id],
+            lambda sa_user: [_nullable_name(sa_user).desc().nulls_first(), sa_user.id],
+        ],
+        ids=[
+            "desc",
+            "asc-asc",
+            "desc-asc",
+            "nullable-asc",
+            "nullable-desc",
+            "nullable-asc-nulls-last",
+            "nullable-desc-nulls-first",
+        ],
+    )
+    def test_ordering(self, sa_session, sa_user, order_by):
+        query = select(sa_user).order_by(*order_by(sa_user))
+
+        with closing(sa_session()) as session, set_page(CursorPage[UserOut]):
+            expected = [UserOut.model_validate(user, from_attributes=True) for user in session.scalars(query)]
+
+            forward = []
+            page = paginate(session, query, params=CursorParams(size=7))
+            forward.extend(page.items)
+
+            while page.next_page:
+                page = paginate(session, query, params=CursorParams(size=7, cursor=page.next_page))
+                forward.extend(page.items)
+
+            assert forward == expected
+
+            backward = [*page.items]
+            while page.previous_page:
+                page = paginate(session, query, params=CursorParams(size=7, cursor=page.previous_page))
+                backward[:0] = page.items
+
+            assert backward == expected
+
+    def test_current_page(self, sa_session, sa_user):
+        query = select(sa_user).order_by(sa_user.name, sa_user.id)
+
+        with closing(sa_session()) as session, set_page(CursorPage[UserOut]):
+            first = paginate(session, query, params=CursorParams(size=5))
+            page = paginate(session, query, params=CursorParams(size=5, cursor=first.next_page))
+
+            current = paginate(session, query, params=CursorParams(size=5, cursor=page.current_page))
+            backwards = paginate(session, query, params=CursorParams(size=5, cursor=page.current_page_backwards))
+
+        assert current.items == page.items
+        assert backwards.items == page.items
+
+    def test_invalid_cursor(self, sa_session, sa_user):
+        query = select(sa_user).order_by(sa_user.name, sa_user.id)
+        cursor = CursorParams().encode_cursor(encode_keyset_cursor(KeysetCursor(key=(1,))))
+
+        with (
+            closing(sa_session()) as session,
+            set_page(CursorPage[UserOut]),
+            pytest.raises(HTTPException, match=r"Invalid cursor value"),
+        ):
+            paginate(session, query, params=CursorParams(size=5, cursor=cursor))
+
+    def test_iter_pages(self, sa_session, sa_user):
+        query = select(sa_user).order_by(sa_user.name, sa_user.id)
+
+        with closing(sa_session()) as session:
+            expected = [*session.scalars(query)]
+            pages = [*iter_pages(paginate, session, query, params=CursorParams(size=7))]
+
+        assert [item for page in pages for item in page.items] == expected
+        assert pages[0].total == len(expected)
+        assert all(page.total is None for page in pages[1:])
+
+
+class TestSQLAlchemyStreaming:
+    @pytest.fixture(scope="session", params=[True, False], ids=["async", "sync"])
+    def is_async_stream(self, request):
+        return request.param
+
+    @pytest.fixture(scope="session")
+    def app(self, database_url, sa_user, is_async_stream):
+        app = FastAPI()
+        query = select(sa_user).order_by(sa_user.id)
+        session_ctx = create_ctx(_create_sa_session(database_url, is_async_stream), is_async_stream)
+
+        @app.get("/users", response_model=StreamingPage[UserOut])
+        async def route(db: Any = Depends(session_ctx), fmt: str = "ndjson") -> Any:
+            if is_async_stream:
+                return await astream_paginate(db, query, format=fmt, chunk_size=7)
+
+            return stream_paginate(db, query, format=fmt, chunk_size=7)
+
+        return add_pagination(app)
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_ndjson(self, client, entities):
+        rsp = await client.get("/users", params={"limit": 30, "offset": 10})
+
+        assert rsp.status_code == 200
+        assert rsp.headers["x-pagination-total"] == str(len(entities))
+        assert rsp.headers["x-pagination-offset"] == "10"
+
+        items = [UserOut.model_validate_json(line) for line in rsp.text.splitlines()]
+        assert items == [UserOut(id=e.id, name=e.name) for e in entities[10:40]]
+
+    @pytest.mark.asyncio(scope="session")
+    async def test_csv(self, client, entities):
+        rsp = await client.get("/users", params={"limit": 2, "fmt": "csv"})
+
+        assert rsp.text.splitlines() == [
+            "id,name",
+            *(f"{e.id},{e.name}" for e in entities[:2]),
+        ]
@@ -1,4 +1,32 @@
-from fastapi_pagination.ext.utils import get_mongo_pipeline_filter_end, len_or_none, unwrap_scalars, wrap_scalars
+import pytest
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.bases import CursorRawParams, RawParams
+from fastapi_pagination.config import Config
+from fastapi_pagination.ext.mongo import (
+    add_ordering_to_projection,
+    aggregate_cursor_flow,
+    create_aggregate_pipeline,
+    create_keyset_filter,
+    create_keyset_page,
+    create_limit_offset_stages,
+    create_projection,
+    find_cursor_flow,
+    get_keyset_ordering,
+    parse_facet_result,
+    split_sort_stage,
+)
+from fastapi_pagination.ext.utils import (
+    get_mongo_pipeline_filter_end,
+    len_or_none,
+    resolve_items_fields,
+    unwrap_scalars,
+    wrap_scalars,
+)
+from fastapi_pagination.flow import run_sync_flow
+from fastapi_pagination.keyset import KeysetCursor, decode_keyset_cursor
 
 
 def test_len_or_none():
@@ -14,6 +42,9 @@ def test_unwrap_scalars():
     assert unwrap_scalars([[1, 3], [2, 4]], force_unwrap=True) == [1, 2]
     assert unwrap_scalars([[1], [2, 3]]) == [1, [2, 3]]
 
+    items = [[1, 3], [2, 4]]
+    assert unwrap_scalars(items) is items
+
 
 def test_wrap_scalars():
     assert wrap_scalars([]) == []
@@ -29,3 +60,177 @@ def test_get_mongo_pipeline_filter_end():
     assert get_mongo_pipeline_filter_end([{"$match": {}}, {"$sort": {}}, {"$project": {}}]) == 2
     assert get_mongo_pipeline_filter_end([{"$match": {}}, {"$project": {}}, {"$sort": {}}, {"$project": {}}]) == 3
     assert get_mongo_pipeline_filter_end([{"$match": {}}, {"$project": {}}, {"$lookup": {}}, {"$project": {}}]) == 1
+
+
+class _ItemOut(BaseModel):
+    id: int = Field(alias="_id")
+    name: str
+
+
+class _ExtraItemOut(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    name: str
+
+
+class _AliasChoicesItemOut(BaseModel):
+    name: str = Field(validation_alias=AliasChoices("name", "title"))
+
+
+class _PopulateByNameItemOut(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    id: int
+    full_name: str
+
+
+class _ValidateByNameItemOut(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel, validate_by_name=True, validate_by_alias=False)
+
+    full_name: str
+
+
+def test_resolve_items_fields():
+    params = Params()
+    config = Config(projection_pushdown=True)
+
+    assert resolve_items_fields(params, None) is None
+    assert resolve_items_fields(params, Config(page_cls=Page[_ItemOut])) is None
+
+    assert resolve_items_fields(params, Config(page_cls=Page[_ItemOut], projection_pushdown=True)) == ("_id", "name")
+    assert resolve_items_fields(params, config) is None  # not parametrized page
+
+    with set_page(Page[_ItemOut]):
+        assert resolve_items_fields(params, config) == ("_id", "name")
+        # transformer can read fields that are not part of the item model
+        assert resolve_items_fields(params, config, transformer=lambda items: items) is None
+
+    with set_page(Page[_PopulateByNameItemOut]):
+        assert resolve_items_fields(params, config) == ("id", "fullName", "full_name")
+
+    with set_page(Page[_ValidateByNameItemOut]):
+        assert resolve_items_fields(params, config) == ("full_name",)
+
+    for item_tp in (int, _ExtraItemOut, _AliasChoicesItemOut):
+        with set_page(Page[item_tp]):
+            assert resolve_items_fields(params, config) is None
+
+
+def test_create_projection():
+    assert create_projection(None) is None
+    assert create_projection(("_id", "name")) == {"_id": 1, "name": 1}
+
+    ordering = [("age", -1), ("address.city", 1), ("_id", 1)]
+
+    assert add_ordering_to_projection(None, ordering) is None
+    assert add_ordering_to_projection({"name": 0}, ordering) == {"name": 0}
+    assert add_ordering_to_projection({"name": 1, "address": 1}, ordering) == {
+        "name": 1,
+        "address": 1,
+        "age": 1,
+        "_id": 1,
+    }
+
+
+def test_get_keyset_ordering():
+    assert get_keyset_ordering(None) == [("_id", 1)]
+    assert get_keyset_ordering("name") == [("name", 1), ("_id", 1)]
+    assert get_keyset_ordering({"name": -1, "_id": -1}) == [("name", -1), ("_id", -1)]
+    assert get_keyset_ordering([("name", -1), "age"], backwards=True) == [("name", 1), ("age", -1), ("_id", -1)]
+
+    with pytest.raises(ValueError, match=r"only ascending and descending"):
+        get_keyset_ordering({"score": {"$meta": "textScore"}})
+
+
+def test_create_keyset_filter():
+    assert create_keyset_filter([("_id", 1)], (1,)) == {"_id": {"$gt": 1}}
+    assert create_keyset_filter([("name", 1), ("_id", -1)], ("a", 1)) == {
+        "$or": [
+            {"name": {"$gt": "a"}},
+            {"name": "a", "$or": [{"_id": {"$lt": 1}}, {"_id": None}]},
+        ],
+    }
+    assert create_keyset_filter([("name", 1), ("_id", 1)], (None, 1)) == {
+        "$or": [
+            {"name": {"$ne": None}},
+            {"name": None, "_id": {"$gt": 1}},
+        ],
+    }
+    assert create_keyset_filter([("name", -1), ("_id", 1)], (None, 1)) == {"name": None, "_id": {"$gt": 1}}
+
+
+def test_create_keyset_page_from_models():
+    class _Address(BaseModel):
+        city: str
+
+    class _Document(BaseModel):
+        id: int = Field(alias="_id")
+        address: _Address
+
+    documents = [_Document(_id=i, address=_Address(city=f"city-{i}")) for i in range(3)]
+    ordering = [("address.city", 1), ("_id", 1)]
+
+    items, cursor_data = create_keyset_page(documents, ordering, KeysetCursor(), 2)
+
+    assert items == documents[:2]
+    assert decode_keyset_cursor(cursor_data["next_"]) == KeysetCursor(key=("city-1", 1))
+
+
+def test_split_sort_stage():
+    assert split_sort_stage([]) == ([], None, [])
+    assert split_sort_stage([{"$match": {}}, {"$sort": {"a": 1}}, {"$project": {}}]) == (
+        [{"$match": {}}],
+        {"a": 1},
+        [{"$project": {}}],
+    )
+
+
+@pytest.mark.parametrize(
+    "stage",
+    [{"$match": {"a": 1}}, {"$group": {"_id": "$a"}}, {"$unwind": "$a"}, {"$limit": 1}],
+    ids=["match", "group", "unwind", "limit"],
+)
+def test_aggregate_cursor_flow_filter_after_sort(stage):
+    pipeline = [{"$sort": {"a": 1}}, {"$project": {"a": 1}}, stage]
+
+    with pytest.raises(ValueError, match=r"after the last \$sort stage"):
+        run_sync_flow(
+            aggregate_cursor_flow(
+                lambda _: pytest.fail("aggregate must not be called"),
+                pipeline,
+                CursorRawParams(cursor=None, size=10),
+                use_facet=False,
+            ),
+        )
+
+
+def test_find_cursor_flow():
+    documents = [{"_id": i, "age": i % 3} for i in range(10)]
+    calls = []
+
+    def _find(keyset_filter, ordering, limit):
+        calls.append((keyset_filter, ordering, limit))
+        return sorted(documents, key=lambda d: (d["age"], d["_id"]))[:limit]
+
+    items, cursor_data = run_sync_flow(find_cursor_flow(_find, [("age", 1)], CursorRawParams(cursor=None, size=2)))
+
+    assert items == [{"_id": 0, "age": 0}, {"_id": 3, "age": 0}]
+    assert calls == [(None, [("age", 1), ("_id", 1)], 3)]
+    assert decode_keyset_cursor(cursor_data["next_"]) == KeysetCursor(key=(0, 3))
+
+
+def test_create_aggregate_pipeline():
+    pipeline = [{"$match": {}}]
+    data = create_limit_offset_stages(RawParams(limit=10, offset=20))
+
+    assert data == [{"$limit": 30}, {"$skip": 20}]
+    assert create_aggregate_pipeline(pipeline, data, with_facet=False) == [*pipeline, *data]
+    assert create_aggregate_pipeline(pipeline, data, with_facet=True) == [
+        *pipeline,
+        {"$facet": {"metadata": [{"$count": "total"}], "data": data}},
+    ]
+
+
+def test_parse_facet_result():
+    assert parse_facet_result([{"metadata": [{"total": 3}], "data": [1, 2]}]) == ([1, 2], 3)
+    assert parse_facet_result([{"metadata": [], "data": []}]) == ([], 0)
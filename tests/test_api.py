@@ -6,9 +6,10 @@ import pytest
 from fastapi import Depends, FastAPI, Request, Response, status
 from fastapi.routing import APIRouter
 from fastapi.testclient import TestClient
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.customization import CustomizedPage, UseResponseHeaders
 from fastapi_pagination.errors import UninitializedConfigurationError
 
 try:
@@ -27,12 +28,15 @@ from fastapi_pagination import (
     response,
 )
 from fastapi_pagination.api import (
+    JSONPageResponse,
     _iter_api_routes,
     apply_items_transformer,
     create_page,
+    create_page_json,
     pagination_ctx,
     pagination_items,
     resolve_page,
+    resolve_params,
     set_page,
 )
 from fastapi_pagination.bases import AbstractPage, AbstractParams, BaseRawParams, RawParams
@@ -207,6 +211,30 @@ def test_page_resolve_set_page() -> None:
         assert resolve_page(CursorParams()) is CustomPage
 
 
+def test_route_context_priority():
+    app = FastAPI()
+    client = TestClient(app)
+
+    @app.get("/", response_model=Page[int])
+    async def route(params: Annotated[Params, Depends()]):
+        assert resolve_page() is Page[int]
+        assert resolve_params() == params
+
+        with set_page(LimitOffsetPage[int]):
+            assert resolve_page() is LimitOffsetPage[int]
+            assert resolve_params() == params
+
+        assert resolve_page() is Page[int]
+
+        return paginate([1, 2, 3])
+
+    add_pagination(app)
+
+    with set_page(CursorPage[int]):
+        assert client.get("/", params={"size": 2}).json()["items"] == [1, 2]
+        assert resolve_page() is CursorPage[int]
+
+
 def test_resolve_page_no_page_set() -> None:
     with pytest.raises(UninitializedConfigurationError):
         resolve_page()
@@ -404,3 +432,40 @@ class TestPatchOpenAPI:
 
         data = rsp.json()
         assert data["info"]["title"] == "Custom Title"
+
+
+class _JSONItem(BaseModel):
+    id: int
+    name: str = Field(serialization_alias="fullName")
+
+
+def test_create_page_json():
+    app = FastAPI()
+    client = TestClient(app)
+
+    items = [_JSONItem(id=i, name=f"name-{i}") for i in range(10)]
+    CustomPage = CustomizedPage[
+        Page[_JSONItem],
+        UseResponseHeaders(lambda page: {"X-Total-Count": str(page.total)}),
+    ]
+
+    @app.get("/model", response_model=CustomPage)
+    def route_model(params: Annotated[Params, Depends()]):
+        return create_page(items[params.to_raw_params().as_slice()], total=len(items), params=params)
+
+    @app.get("/json", response_model=CustomPage)
+    def route_json(params: Annotated[Params, Depends()]) -> JSONPageResponse:
+        return create_page_json(items[params.to_raw_params().as_slice()], total=len(items), params=params)
+
+    add_pagination(app)
+
+    expected = client.get("/model", params={"page": 2, "size": 3})
+    actual = client.get("/json", params={"page": 2, "size": 3})
+
+    assert actual.status_code == status.HTTP_200_OK
+    assert actual.json() == expected.json()
+    assert actual.headers["content-type"] == "application/json"
+    assert actual.headers["x-total-count"] == "10"
+
+    schema = app.openapi()["paths"]
+    assert schema["/json"]["get"]["responses"] == schema["/model"]["get"]["responses"]
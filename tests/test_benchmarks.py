@@ -0,0 +1,26 @@
+import asyncio
+
+import pytest
+
+from benchmarks.runner import collect_benchmarks, compare_results, run_benchmarks
+
+_benchmarks = collect_benchmarks()
+
+
+@pytest.mark.parametrize("bench", _benchmarks, ids=[bench.name for bench in _benchmarks])
+def test_benchmark_smoke(bench):
+    with bench.setup() as func:
+        result = func()
+
+        if bench.is_async:
+            asyncio.run(result)
+
+
+def test_run_and_compare():
+    benchmarks = collect_benchmarks("flow.run_sync_flow")
+    results = run_benchmarks(benchmarks, rounds=2, min_time=0.001)
+
+    assert [bench["name"] for bench in results["benchmarks"]] == ["flow.run_sync_flow"]
+    assert [*compare_results(results, results)] == [
+        ("flow.run_sync_flow", results["benchmarks"][0]["median"], results["benchmarks"][0]["median"], 0.0),
+    ]
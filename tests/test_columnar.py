@@ -0,0 +1,114 @@
+from importlib.util import find_spec
+from typing import NamedTuple
+
+import pytest
+from pydantic import BaseModel
+
+from fastapi_pagination import Page, Params, paginate, set_page
+from fastapi_pagination.columnar import columnar_transformer, items_from_columns, items_to_columns
+
+
+class _Row(NamedTuple):
+    id: int
+    price: float
+
+
+_HAS_NUMPY = find_spec("numpy") is not None
+
+
+class _ItemOut(BaseModel):
+    id: int
+    price: float
+    price_usd: float
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [_Row(1, 10.0), _Row(2, 20.0)],
+        [{"id": 1, "price": 10.0}, {"id": 2, "price": 20.0}],
+    ],
+    ids=["rows", "mappings"],
+)
+def test_items_to_columns(items):
+    assert items_to_columns(items) == {"id": [1, 2], "price": [10.0, 20.0]}
+    assert items_to_columns([]) == {}
+
+
+def test_items_to_columns_unsupported_items():
+    with pytest.raises(TypeError, match=r"only mappings and rows"):
+        items_to_columns([1, 2])
+
+
+def test_items_from_columns():
+    assert items_from_columns({"id": [1, 2], "name": ["a", "b"]}) == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+    ]
+    assert items_from_columns({}) == []
+
+    with pytest.raises(ValueError, match=r"same length"):
+        items_from_columns({"id": [1, 2], "name": ["a"]})
+
+
+def test_columnar_transformer():
+    calls = []
+
+    def _to_usd(columns):
+        calls.append(columns)
+        return {"price_usd": [price * 2 for price in columns["price"]]}
+
+    items = [_Row(i, float(i)) for i in range(10)]
+
+    with set_page(Page[_ItemOut]):
+        page = paginate(items, params=Params(page=2, size=3), transformer=columnar_transformer(_to_usd))
+
+    assert page.items == [_ItemOut(id=i, price=i, price_usd=i * 2) for i in range(3, 6)]
+    assert len(calls) == 1
+
+    # transformer is not called for empty pages
+    with set_page(Page[_ItemOut]):
+        page = paginate([], params=Params(), transformer=columnar_transformer(_to_usd))
+
+    assert page.items == []
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_columnar_transformer():
+    async def _to_usd(columns):
+        return {"price_usd": [price * 2 for price in columns["price"]]}
+
+    transformer = columnar_transformer(_to_usd)
+
+    assert await transformer([{"id": 1, "price": 1.5}]) == [{"id": 1, "price": 1.5, "price_usd": 3.0}]
+
+
+@pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+def test_columnar_transformer_numpy():
+    import numpy as np
+
+    transformer = columnar_transformer(lambda columns: {"price_usd": columns["price"] * 2}, numpy=True)
+    items = transformer([_Row(1, 1.5), _Row(2, 2.5)])
+
+    assert items == [{"id": 1, "price": 1.5, "price_usd": 3.0}, {"id": 2, "price": 2.5, "price_usd": 5.0}]
+    assert all(type(value) is not np.float64 for item in items for value in item.values())
+
+
+@pytest.mark.skipif(not _HAS_NUMPY, reason="numpy is not installed")
+def test_items_to_columns_numpy_non_scalar():
+    items = [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": ["c"]}, {"id": 3, "tags": ()}]
+    columns = items_to_columns(items, numpy=True)
+
+    assert columns["id"].dtype != object
+    assert columns["tags"].dtype == object
+    assert columns["tags"].shape == (3,)
+    assert items_from_columns(columns) == items
+
+
+@pytest.mark.skipif(_HAS_NUMPY, reason="numpy is installed")
+def test_columnar_transformer_numpy_not_installed():
+    assert items_to_columns([_Row(1, 1.5)]) == {"id": [1], "price": [1.5]}
+
+    with pytest.raises(ImportError, match=r"numpy is required"):
+        items_to_columns([_Row(1, 1.5)], numpy=True)
@@ -1,9 +1,12 @@
+from urllib.parse import quote
+
 import pytest
-from fastapi import FastAPI, status
+from fastapi import FastAPI, HTTPException, status
 from fastapi.testclient import TestClient
 
 from fastapi_pagination import Params, add_pagination, paginate, resolve_params
-from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.cursor import CompactCursorCodec, CursorPage, CursorParams
+from fastapi_pagination.customization import CustomizedPage, UseCursorEncoding
 
 
 def test_unsupported_params():
@@ -44,3 +47,61 @@ def test_invalid_cursor(cursor):
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json() == {"detail": "Invalid cursor value"}
+
+
+_KEY = b"test-key"
+_OTHER_KEY = b"other-key"
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        CompactCursorCodec(),
+        CompactCursorCodec(compress_threshold=None),
+        CompactCursorCodec(secret=_KEY),
+        CompactCursorCodec(secret=_KEY.decode(), compress_threshold=0, signature_size=8),
+    ],
+)
+@pytest.mark.parametrize("cursor", [b"a", b">[1,2]", b"\x00\xff" * 10, b"x" * 1_000])
+def test_compact_codec_roundtrip(codec, cursor):
+    encoded = codec.encode(cursor)
+
+    assert "=" not in encoded
+    assert quote(encoded) == encoded
+    assert codec.decode(encoded) == cursor
+
+
+def test_compact_codec_compression():
+    cursor = b"x" * 1_000
+
+    assert len(CompactCursorCodec().encode(cursor)) < len(CompactCursorCodec(compress_threshold=None).encode(cursor))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        CompactCursorCodec(secret=_OTHER_KEY).encode(b"cursor"),
+        CompactCursorCodec().encode(b"cursor"),
+    ],
+    ids=["empty", "invalid-base64", "wrong-secret", "unsigned"],
+)
+def test_compact_codec_rejects_invalid(cursor):
+    with pytest.raises(ValueError):  # noqa: PT011
+        CompactCursorCodec(secret=_KEY).decode(cursor)
+
+
+def test_cursor_params_codec():
+    CustomPage = CustomizedPage[
+        CursorPage[int],
+        UseCursorEncoding(codec=CompactCursorCodec(secret=_KEY)),
+    ]
+    params = CustomPage.__params_type__()
+
+    encoded = params.encode_cursor(">[1]")
+    assert encoded == CompactCursorCodec(secret=_KEY).encode(b">[1]")
+    assert params.decode_cursor(encoded) == ">[1]"
+
+    with pytest.raises(HTTPException, match=r"Invalid cursor value"):
+        params.decode_cursor(CompactCursorCodec(secret=_OTHER_KEY).encode(b">[1]"))
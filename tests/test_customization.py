@@ -2,6 +2,8 @@ from typing import ClassVar, Generic, TypeVar
 
 import pytest
 from fastapi import FastAPI, Query, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 from fastapi_pagination import Page, Params, add_pagination, paginate
 from fastapi_pagination.bases import AbstractPage, AbstractParams
@@ -9,8 +11,10 @@ from fastapi_pagination.cursor import CursorPage, encode_cursor
 from fastapi_pagination.customization import (
     ClsNamespace,
     CustomizedPage,
+    CustomizedPageCacheInfo,
     PageCustomizer,
     UseAdditionalFields,
+    UseApproximateTotal,
     UseCursorEncoding,
     UseExcludedFields,
     UseFieldsAliases,
@@ -25,7 +29,11 @@ from fastapi_pagination.customization import (
     UseQuotedCursor,
     UseResponseHeaders,
     UseStrCursor,
+    UseTrustedConstruction,
+    clear_customized_page_cache,
+    customized_page_cache_info,
 )
+from fastapi_pagination.limit_offset import LimitOffsetPage, LimitOffsetParams
 from tests.utils import dump_obj
 
 
@@ -341,6 +349,65 @@ def test_additional_fields():
     assert CustomPage.model_fields["b"].default == "my-default"
 
 
+@pytest.mark.parametrize("field", ["total_is_approximate", "estimated"])
+def test_use_approximate_total(field):
+    CustomPage = CustomizedPage[
+        Page[int],
+        UseApproximateTotal(field),
+    ]
+
+    exact = CustomPage.create([1, 2], Params(), total=2)
+    approximate = CustomPage.create([1, 2], Params(), total=1_000, total_is_approximate=True)
+
+    assert dump_obj(exact)[field] is False
+    assert dump_obj(approximate)[field] is True
+
+
+class _Item(BaseModel):
+    id: int
+
+
+@pytest.mark.parametrize(
+    ("page_cls", "params"),
+    [
+        (Page, Params()),
+        (LimitOffsetPage, LimitOffsetParams()),
+        (CursorPage, CursorPage.__params_type__()),
+    ],
+    ids=["page", "limit-offset", "cursor"],
+)
+def test_use_trusted_construction(page_cls, params):
+    CustomPage = CustomizedPage[
+        page_cls[_Item],
+        UseTrustedConstruction(),
+        UseApproximateTotal("estimated"),
+    ]
+
+    items = [_Item(id=1), _Item(id=2)]
+    page = CustomPage.create(items, params, total=1_000, total_is_approximate=True)
+
+    assert page.items is items
+    assert page.total == 1_000
+    assert page.estimated is True
+
+    # items of other types are still validated
+    page = CustomPage.create([{"id": 1}], params, total=1)
+    assert page.items == [_Item(id=1)]
+
+
+def test_use_trusted_construction_disabled():
+    CustomPage = CustomizedPage[
+        Page[_Item],
+        UseTrustedConstruction(False),
+    ]
+
+    items = [_Item(id=1)]
+    page = CustomPage.create(items, Params(), total=1)
+
+    assert page.items is not items
+    assert page.items == items
+
+
 @pytest.mark.parametrize(
     "kwargs",
     [
@@ -434,3 +501,98 @@ def test_use_flatten_page():
     )
 
     assert dump_obj(page) == [1, 2, 3]
+
+
+def test_customized_page_cache():
+    clear_customized_page_cache()
+
+    def _create(size: int) -> type:
+        return CustomizedPage[
+            Page[int],
+            UseName("CachedPage"),
+            UseParamsFields(size=size),
+            UseFieldsAliases(total="count"),
+        ]
+
+    first = _create(10)
+
+    assert _create(10) is first
+    assert _create(20) is not first
+    assert customized_page_cache_info() == CustomizedPageCacheInfo(hits=1, misses=2, currsize=2)
+
+    clear_customized_page_cache()
+
+    assert _create(10) is not first
+    assert customized_page_cache_info() == CustomizedPageCacheInfo(hits=0, misses=1, currsize=1)
+
+
+def test_customized_page_cache_unhashable():
+    class _Unhashable(PageCustomizer):
+        def __init__(self) -> None:
+            self.value = bytearray()
+
+        def customize_page_ns(self, page_cls: type[AbstractPage], ns: ClsNamespace) -> None:
+            pass
+
+    clear_customized_page_cache()
+
+    first = CustomizedPage[Page[int], _Unhashable()]
+    second = CustomizedPage[Page[int], _Unhashable()]
+
+    assert first is not second
+    assert customized_page_cache_info() == CustomizedPageCacheInfo(hits=0, misses=2, currsize=0)
+
+
+def test_use_model_config_defer_build():
+    CustomPage = CustomizedPage[
+        Page[int],
+        UseName("DeferredPage"),
+        UseFieldsAliases(total="count"),
+        UseModelConfig(defer_build=True),
+    ]
+
+    assert not CustomPage.__pydantic_complete__
+    assert not CustomPage.__params_type__.__pydantic_complete__
+
+    app = FastAPI()
+
+    @app.get("/", response_model=CustomPage)
+    async def route():
+        return paginate([1, 2, 3])
+
+    add_pagination(app)
+
+    assert CustomPage.__pydantic_complete__
+    assert CustomPage.__params_type__.__pydantic_complete__
+
+    rsp = TestClient(app).get("/", params={"size": 2})
+    assert rsp.json() == {"items": [1, 2], "count": 3, "page": 1, "size": 2, "pages": 2}
+
+
+def test_customized_page_cache_callables():
+    clear_customized_page_cache()
+
+    first = CustomizedPage[Page[int], UseResponseHeaders(lambda _: {})]
+    second = CustomizedPage[Page[int], UseResponseHeaders(lambda _: {})]
+
+    assert first is not second
+    assert customized_page_cache_info() == CustomizedPageCacheInfo(hits=0, misses=2, currsize=0)
+
+
+def test_customized_page_cache_maxsize(monkeypatch):
+    monkeypatch.setattr("fastapi_pagination.customization._PAGE_CACHE_MAXSIZE", 2)
+    clear_customized_page_cache()
+
+    def _create(size: int) -> type:
+        return CustomizedPage[Page[int], UseParamsFields(size=size)]
+
+    first = _create(10)
+    _create(20)
+
+    assert _create(10) is first
+
+    # least recently used page is evicted
+    _create(30)
+    assert customized_page_cache_info().currsize == 2
+    assert _create(10) is first
+    assert customized_page_cache_info().hits == 2
@@ -0,0 +1,284 @@
+import asyncio
+from functools import partial
+
+import pytest
+from pydantic import BaseModel
+
+from fastapi_pagination import LimitOffsetPage, LimitOffsetParams, Page, Params, set_page
+from fastapi_pagination.config import Config
+from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
+from fastapi_pagination.flows import InlineTotal, batched_items_flow, generic_flow
+
+
+class _Item(BaseModel):
+    id: int
+
+
+def _tracked_flows(events: list[str]):
+    async def _total():
+        events.append("total-start")
+        await asyncio.sleep(0.01)
+        events.append("total-end")
+        return 10
+
+    async def _items(raw_params):
+        events.append("items-start")
+        await asyncio.sleep(0.01)
+        events.append("items-end")
+        return [*range(raw_params.offset, raw_params.offset + raw_params.limit)]
+
+    @flow
+    def total_flow():
+        total = yield _total()
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        items = yield _items(raw_params)
+        return items
+
+    return total_flow, limit_offset_flow
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("concurrent", "expected"),
+    [
+        (False, ["total-start", "total-end", "items-start", "items-end"]),
+        (True, ["total-start", "items-start", "total-end", "items-end"]),
+    ],
+    ids=["sequential", "concurrent"],
+)
+async def test_concurrent_total(concurrent, expected):
+    events: list[str] = []
+    total_flow, limit_offset_flow = _tracked_flows(events)
+
+    with set_page(LimitOffsetPage[int]):
+        page = await run_async_flow(
+            generic_flow(
+                async_=True,
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=LimitOffsetParams(limit=2, offset=1),
+                config=Config(concurrent_total=concurrent),
+            ),
+        )
+
+    assert events == expected
+    assert page.items == [1, 2]
+    assert page.total == 10
+
+
+def test_concurrent_total_ignored_for_sync_flow():
+    @flow
+    def total_flow():
+        total = yield 3
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        items = yield [1, 2, 3][raw_params.as_slice()]
+        return items
+
+    with set_page(LimitOffsetPage[int]):
+        page = run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=LimitOffsetParams(limit=2, offset=0),
+                config=Config(concurrent_total=True),
+            ),
+        )
+
+    assert page.items == [1, 2]
+    assert page.total == 3
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_trusted_construction_config(trusted):
+    items = [_Item(id=1), _Item(id=2)]
+
+    @flow
+    def total_flow():
+        total = yield len(items)
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        result = yield items
+        return result
+
+    with set_page(Page[_Item]):
+        page = run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=Params(size=2),
+                config=Config(trusted_construction=trusted),
+            ),
+        )
+
+    assert (page.items is items) is trusted
+    assert page.items == items
+
+
+@pytest.mark.parametrize(
+    ("offset", "expected_items", "expected_calls"),
+    [(0, [0, 1], []), (10, [], ["total"])],
+    ids=["inline", "fallback"],
+)
+def test_inline_total(offset, expected_items, expected_calls):
+    calls: list[str] = []
+
+    @flow
+    def total_flow():
+        calls.append("total")
+        total = yield 3
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        items = yield [0, 1, 2][raw_params.as_slice()]
+        return InlineTotal(items, 3 if items else None)
+
+    with set_page(LimitOffsetPage[int]):
+        page = run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=LimitOffsetParams(limit=2, offset=offset),
+                inline_total=True,
+            ),
+        )
+
+    assert page.items == expected_items
+    assert page.total == 3
+    assert calls == expected_calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("async_", [False, True], ids=["sync", "async"])
+async def test_batched_items_flow(async_):
+    batches = iter([[1, 2], [3, 4], [5], []])
+    additional_data_items: list[list[str]] = []
+
+    async def _fetch_async():
+        return next(batches)
+
+    @flow
+    def total_flow():
+        total = yield 5
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        items = yield from batched_items_flow(
+            _fetch_async if async_ else partial(next, batches),
+            inner_transformer=lambda batch: [item * 10 for item in batch],
+            transformer=lambda batch: [str(item) for item in batch],
+            async_=async_,
+        )
+        return items
+
+    def additional_data(items):
+        additional_data_items.append(items)
+        return {}
+
+    flow_ = generic_flow(
+        async_=async_,
+        total_flow=total_flow,
+        limit_offset_flow=limit_offset_flow,
+        params=LimitOffsetParams(limit=5, offset=0),
+        inner_transformer=lambda _: pytest.fail("inner transformer must not be applied to transformed items"),
+        transformer=lambda _: pytest.fail("transformer must not be applied to transformed items"),
+        additional_data=additional_data,
+    )
+
+    with set_page(LimitOffsetPage[str]):
+        page = await run_async_flow(flow_) if async_ else run_sync_flow(flow_)
+
+    assert page.items == ["10", "20", "30", "40", "50"]
+    assert page.total == 5
+    assert additional_data_items == [page.items]
+
+
+@pytest.mark.parametrize(
+    ("limit", "offset", "expected_calls"),
+    [
+        (15, 0, []),
+        (5, 8, []),
+        (5, 5, ["total"]),
+        (5, 10, ["total"]),
+    ],
+    ids=["short-first-page", "short-last-page", "full-page", "empty-page"],
+)
+def test_adaptive_total(limit, offset, expected_calls):
+    calls: list[str] = []
+    items = [*range(10)]
+
+    @flow
+    def total_flow():
+        calls.append("total")
+        total = yield len(items)
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        result = yield items[raw_params.as_slice()]
+        return result
+
+    with set_page(LimitOffsetPage[int]):
+        page = run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=LimitOffsetParams(limit=limit, offset=offset),
+                config=Config(adaptive_total=True),
+            ),
+        )
+
+    assert page.items == items[offset:][:limit]
+    assert page.total == len(items)
+    assert calls == expected_calls
+
+
+@pytest.mark.parametrize("batched", [False, True], ids=["plain", "batched"])
+def test_adaptive_total_filtered_items(batched):
+    calls: list[str] = []
+    items = [*range(10)]
+
+    @flow
+    def total_flow():
+        calls.append("total")
+        total = yield len(items)
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        page = items[raw_params.as_slice()]
+        if not batched:
+            result = yield page
+            return result
+
+        batches = iter([page, []])
+        result = yield from batched_items_flow(partial(next, batches), transformer=_drop_odd)
+        return result
+
+    def _drop_odd(batch):
+        return [item for item in batch if item % 2 == 0]
+
+    with set_page(LimitOffsetPage[int]):
+        page = run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                params=LimitOffsetParams(limit=4, offset=0),
+                transformer=_drop_odd,
+                config=Config(adaptive_total=True),
+            ),
+        )
+
+    # page is full before items are filtered by transformer, so total is counted
+    assert page.items == [0, 2]
+    assert page.total == len(items)
+    assert calls == ["total"]
@@ -0,0 +1,218 @@
+import pytest
+
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.config import Config
+from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
+from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.instrumentation import (
+    NoopTracer,
+    PerfCounterHistogramHook,
+    SpanHook,
+    StageEvent,
+    add_flow_hook,
+    clear_flow_hooks,
+    remove_flow_hook,
+)
+from fastapi_pagination.paginator import paginate
+
+
+class _RecordingHook:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, str | None]] = []
+
+    def on_stage_start(self, event: StageEvent, /) -> str:
+        self.events.append(("start", event.stage, event.module))
+        return event.stage
+
+    def on_stage_end(self, event: StageEvent, token: str, exc: BaseException | None, /) -> None:
+        assert token == event.stage
+        self.events.append(("error" if exc else "end", event.stage, event.module))
+
+
+class _Span:
+    def __init__(self, name: str, attributes: dict) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.exceptions: list[BaseException] = []
+        self.ended = False
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.spans: list[_Span] = []
+
+    def start_span(self, name: str, attributes: dict | None = None) -> _Span:
+        span = _Span(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+@flow
+def _total_flow():
+    total = yield 5
+    return total
+
+
+@flow
+def _limit_offset_flow(raw_params):
+    items = yield [*range(5)][raw_params.as_slice()]
+    return items
+
+
+@pytest.fixture
+def hook():
+    hook = _RecordingHook()
+    add_flow_hook(hook)
+
+    yield hook
+
+    remove_flow_hook(hook)
+
+
+def test_global_hook(hook):
+    with set_page(Page[int]):
+        paginate([1, 2, 3], Params(size=2))
+
+    module = "fastapi_pagination.paginator"
+    assert hook.events == [
+        ("start", "total", module),
+        ("end", "total", module),
+        ("start", "items", module),
+        ("end", "items", module),
+        ("start", "additional_data", module),
+        ("end", "additional_data", module),
+        ("start", "transformer", module),
+        ("end", "transformer", module),
+        ("start", "create_page", module),
+        ("end", "create_page", module),
+    ]
+
+
+def test_config_hooks():
+    hook = _RecordingHook()
+
+    with set_page(Page[int]):
+        run_sync_flow(
+            generic_flow(
+                total_flow=_total_flow,
+                limit_offset_flow=_limit_offset_flow,
+                params=Params(size=2),
+                inner_transformer=lambda items: items,
+                config=Config(flow_hooks=[hook]),
+            ),
+        )
+
+    assert [stage for kind, stage, _ in hook.events if kind == "start"] == [
+        "total",
+        "items",
+        "inner_transformer",
+        "additional_data",
+        "transformer",
+        "create_page",
+    ]
+    assert {module for *_, module in hook.events} == {__name__}
+
+
+def test_hook_receives_error():
+    hook = _RecordingHook()
+
+    def _transformer(_):
+        raise ValueError("boom")
+
+    with set_page(Page[int]), pytest.raises(ValueError, match="boom"):
+        run_sync_flow(
+            generic_flow(
+                total_flow=_total_flow,
+                limit_offset_flow=_limit_offset_flow,
+                params=Params(size=2),
+                transformer=_transformer,
+                config=Config(flow_hooks=[hook]),
+            ),
+        )
+
+    assert hook.events[-2:] == [
+        ("start", "transformer", __name__),
+        ("error", "transformer", __name__),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_perf_counter_histogram_hook_concurrent():
+    hook = PerfCounterHistogramHook(buckets=[10.0])
+
+    with set_page(Page[int]):
+        for _ in range(3):
+            await run_async_flow(
+                generic_flow(
+                    async_=True,
+                    total_flow=_total_flow,
+                    limit_offset_flow=_limit_offset_flow,
+                    params=Params(size=2),
+                    config=Config(concurrent_total=True, flow_hooks=[hook]),
+                ),
+            )
+
+    snapshot = hook.snapshot()
+    histogram = snapshot[__name__, "items"]
+
+    assert set(snapshot) == {
+        (__name__, stage) for stage in ("total", "items", "additional_data", "transformer", "create_page")
+    }
+    assert histogram.count == 3
+    assert histogram.counts == [3, 0]
+    assert 0 <= histogram.min <= histogram.max <= histogram.sum
+
+    histogram.observe(1.0)
+    assert hook.snapshot()[__name__, "items"].count == 3
+
+    hook.reset()
+    assert hook.snapshot() == {}
+
+
+def test_span_hook():
+    tracer = _Tracer()
+
+    with set_page(Page[int]):
+        run_sync_flow(
+            generic_flow(
+                total_flow=_total_flow,
+                limit_offset_flow=_limit_offset_flow,
+                params=Params(size=2),
+                config=Config(flow_hooks=[SpanHook(tracer)]),
+            ),
+        )
+
+    assert [span.name for span in tracer.spans] == [
+        "fastapi_pagination.total",
+        "fastapi_pagination.items",
+        "fastapi_pagination.additional_data",
+        "fastapi_pagination.transformer",
+        "fastapi_pagination.create_page",
+    ]
+    assert tracer.spans[0].attributes == {"pagination.stage": "total", "pagination.module": __name__}
+    assert all(span.ended for span in tracer.spans)
+
+
+def test_span_hook_noop_tracer():
+    hook = SpanHook(NoopTracer())
+    event = StageEvent(stage="items")
+
+    span = hook.on_stage_start(event)
+    hook.on_stage_end(event, span, ValueError())
+
+
+def test_clear_flow_hooks():
+    hook = _RecordingHook()
+    add_flow_hook(hook)
+    clear_flow_hooks()
+
+    with set_page(Page[int]):
+        paginate([1, 2, 3], Params(size=2))
+
+    assert hook.events == []
@@ -3,7 +3,8 @@ from typing import ClassVar
 
 import pytest
 
-from fastapi_pagination.iterables import LimitOffsetPage, Page, paginate
+from fastapi_pagination.config import Config
+from fastapi_pagination.iterables import LimitOffsetPage, LimitOffsetParams, Page, paginate
 
 from .base import BasePaginationTestSuite, SuiteBuilder
 
@@ -45,3 +46,28 @@ class TestIterablesPaginationNoTotal(_IterablesSuiteMixin, BasePaginationTestSui
 
 class TestIterablesPaginationWithTotal(_IterablesSuiteMixin, BasePaginationTestSuite):
     with_total = True
+
+
+@pytest.mark.parametrize(
+    "iterable",
+    [
+        lambda: range(100),
+        lambda: [*range(100)],
+        lambda: iter(range(100)),
+        lambda: tuple(range(100)),
+        lambda: bytearray(range(100)),
+    ],
+    ids=["range", "list", "iterator", "tuple", "bytearray"],
+)
+@pytest.mark.parametrize("trusted_construction", [False, True], ids=["validated", "trusted"])
+def test_paginate_sequence_and_iterator(iterable, trusted_construction):
+    page = paginate(
+        iterable(),
+        params=LimitOffsetParams(limit=5, offset=90),
+        total=100,
+        config=Config(trusted_construction=trusted_construction),
+    )
+
+    assert page.items == [90, 91, 92, 93, 94]
+    assert page.total == 100
+    assert page.model_dump()["items"] == [90, 91, 92, 93, 94]
@@ -0,0 +1,102 @@
+import pytest
+
+from fastapi_pagination import LimitOffsetParams, Params
+from fastapi_pagination.async_paginator import apaginate
+from fastapi_pagination.bases import AbstractParams
+from fastapi_pagination.cursor import CursorParams
+from fastapi_pagination.flow import flow, run_sync_flow
+from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.iterators import RawPage, aiter_items, aiter_pages, iter_items, iter_pages
+from fastapi_pagination.paginator import paginate
+
+
+def _tracked_paginate(items: list[int], totals: list[int]):
+    @flow
+    def total_flow():
+        totals.append(len(items))
+        total = yield len(items)
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        page = yield items[raw_params.as_slice()]
+        return page
+
+    @flow
+    def cursor_flow(raw_params):
+        start = int(raw_params.cursor or 0)
+        page = yield items[start : start + raw_params.size]
+
+        next_ = start + raw_params.size
+        return page, {"next_": str(next_) if next_ < len(items) else None}
+
+    def _paginate(*, params: AbstractParams) -> RawPage[int]:
+        return run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                limit_offset_flow=limit_offset_flow,
+                cursor_flow=cursor_flow,
+                params=params,
+            ),
+        )
+
+    return _paginate
+
+
+@pytest.mark.parametrize(
+    "params",
+    [Params(size=3), LimitOffsetParams(limit=3, offset=0), CursorParams(size=3)],
+    ids=["page", "limit-offset", "cursor"],
+)
+def test_iter_pages(params):
+    totals: list[int] = []
+    pages = [*iter_pages(_tracked_paginate([*range(10)], totals), params=params)]
+
+    assert [page.items for page in pages] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert [page.total for page in pages] == [10, None, None, None]
+    assert totals == [10]
+
+
+def test_iter_pages_is_lazy():
+    totals: list[int] = []
+    pages = iter_pages(_tracked_paginate([*range(10)], totals), params=CursorParams(size=3))
+
+    assert totals == []
+    assert next(pages).items == [0, 1, 2]
+    assert next(pages).items == [3, 4, 5]
+
+
+def test_iter_items():
+    items = [*range(7)]
+
+    assert [*iter_items(paginate, items, params=Params(size=2))] == items
+    assert [*iter_items(paginate, [], params=Params(size=2))] == []
+
+
+@pytest.mark.parametrize(
+    "params",
+    [Params(size=3), LimitOffsetParams(limit=3, offset=0)],
+    ids=["page", "limit-offset"],
+)
+def test_iter_pages_filtered_items(params):
+    # filtered pages are shorter than the limit, but they are not the last ones
+    pages = [*iter_pages(paginate, [*range(10)], params=params, transformer=lambda items: [i for i in items if i % 2])]
+
+    assert [page.items for page in pages] == [[1], [3, 5], [7], [9]]
+
+
+@pytest.mark.asyncio
+async def test_aiter_pages():
+    items = [*range(5)]
+
+    pages = [page async for page in aiter_pages(apaginate, items, params=Params(size=2))]
+
+    assert [page.items for page in pages] == [[0, 1], [2, 3], [4]]
+    assert [page.total for page in pages] == [5, None, None]
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_sync_paginate():
+    items = [*range(5)]
+
+    assert [item async for item in aiter_items(paginate, items, params=LimitOffsetParams(limit=2))] == items
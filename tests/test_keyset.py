@@ -0,0 +1,54 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from uuid import uuid4
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+
+from fastapi_pagination.keyset import KeysetCursor, decode_keyset_cursor, encode_keyset_cursor
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        KeysetCursor(),
+        KeysetCursor(backwards=True),
+        KeysetCursor(key=(1, "a", None, True, 1.5)),
+        KeysetCursor(
+            key=(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), date(2024, 1, 2), time(3, 4)), backwards=True
+        ),
+        KeysetCursor(key=(Decimal("1.10"), uuid4(), b"\x00\xff", timedelta(seconds=90))),
+        KeysetCursor(key=("a", ObjectId())),
+    ],
+)
+def test_roundtrip(cursor):
+    assert decode_keyset_cursor(encode_keyset_cursor(cursor)) == cursor
+
+
+def test_enum_value():
+    assert decode_keyset_cursor(encode_keyset_cursor(KeysetCursor(key=(_Color.RED,)))) == KeysetCursor(key=("red",))
+
+
+def test_empty_cursor():
+    assert decode_keyset_cursor(None) == KeysetCursor()
+    assert decode_keyset_cursor(b">[1]") == KeysetCursor(key=(1,))
+
+
+def test_unsupported_value():
+    with pytest.raises(TypeError, match=r"^Unsupported keyset cursor value type 'object'$"):
+        encode_keyset_cursor(KeysetCursor(key=(object(),)))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["[1]", ">[1", '>[{"$unknown":1}]', ">1", '>[{"$dec":"abc"}]', '>[{"$td":1e20}]'],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(HTTPException, match=r"Invalid cursor value"):
+        decode_keyset_cursor(cursor)
@@ -136,3 +136,22 @@ def test_openapi_schema(endpoint, schema):
     actual_schema = openapi_schema["components"]["schemas"][name]
 
     assert actual_schema == schema
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "name"),
+    [
+        ("/links-default", "Page__TAny_Customized_int_"),
+        ("/links-limit-offset", "LimitOffsetPage__TAny_Customized_int_"),
+        ("/optional-default", "Page__T_Customized_int_"),
+        ("/optional-limit-offset", "LimitOffsetPage__T_Customized_int_"),
+    ],
+)
+def test_openapi_schema_name(endpoint, name):
+    response = client.get("/openapi.json")
+    assert response.status_code == status.HTTP_200_OK
+
+    endpoint = response.json()["paths"][endpoint]
+    schema_ref = endpoint["get"]["responses"]["200"]["content"]["application/json"]["schema"]["$ref"]
+
+    assert schema_ref == f"#/components/schemas/{name}"
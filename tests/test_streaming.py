@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_pagination import add_pagination, set_page
+from fastapi_pagination.api import pagination_ctx
+from fastapi_pagination.streaming import StreamingPage, StreamingPageResponse, StreamingParams, create_streaming_page
+
+
+class _User(BaseModel):
+    id: int
+    name: str
+    tags: list[str] = []
+
+
+class _Row:
+    def __init__(self, id: int) -> None:  # noqa: A002
+        self.id = id
+        self.name = f"user-{id}"
+        self.tags = ["a"] if id % 2 else []
+
+
+_ROWS = [_Row(i) for i in range(25)]
+
+
+async def _arows(rows):
+    for row in rows:
+        yield row
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/users", response_model=StreamingPage[_User])
+    async def route(params: Annotated[StreamingParams, Depends()], fmt: str = "ndjson", aio: bool = False):
+        rows = _ROWS[params.to_raw_params().as_slice()]
+
+        return create_streaming_page(
+            _arows(rows) if aio else iter(rows),
+            total=len(_ROWS),
+            format=fmt,
+            chunk_size=4,
+        )
+
+    @app.get("/transformed", dependencies=[Depends(pagination_ctx(StreamingPage[int], transformer=lambda x: x[:1]))])
+    async def transformed() -> StreamingPageResponse:
+        return create_streaming_page(range(10), total=10, chunk_size=3)
+
+    add_pagination(app)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("aio", [False, True], ids=["sync", "async"])
+def test_ndjson(client, aio):
+    rsp = client.get("/users", params={"limit": 10, "offset": 5, "aio": aio})
+
+    assert rsp.status_code == 200
+    assert rsp.headers["content-type"] == "application/x-ndjson"
+    assert rsp.headers["x-pagination-total"] == "25"
+    assert rsp.headers["x-pagination-limit"] == "10"
+    assert rsp.headers["x-pagination-offset"] == "5"
+
+    items = [json.loads(line) for line in rsp.text.splitlines()]
+    assert items == [_User.model_validate(row, from_attributes=True).model_dump() for row in _ROWS[5:15]]
+
+
+def test_csv(client):
+    rsp = client.get("/users", params={"limit": 3, "fmt": "csv"})
+
+    assert rsp.headers["content-type"].startswith("text/csv")
+    assert [*csv.reader(io.StringIO(rsp.text))] == [
+        ["id", "name", "tags"],
+        ["0", "user-0", "[]"],
+        ["1", "user-1", '["a"]'],
+        ["2", "user-2", "[]"],
+    ]
+
+
+def test_transformer_applied_per_chunk(client):
+    rsp = client.get("/transformed")
+
+    assert rsp.text.splitlines() == ["0", "3", "6", "9"]
+
+
+def test_default_limit():
+    assert StreamingParams().limit == 1_000
+
+
+def test_invalid_chunk_size():
+    with set_page(StreamingPage[int]), pytest.raises(ValueError, match="chunk_size must be greater than 0"):
+        create_streaming_page([], total=0, params=StreamingParams(), chunk_size=0)
@@ -0,0 +1,158 @@
+import pytest
+
+from fastapi_pagination import Page, Params, set_page
+from fastapi_pagination.config import Config
+from fastapi_pagination.flow import flow, run_async_flow, run_sync_flow
+from fastapi_pagination.flows import generic_flow
+from fastapi_pagination.total_cache import InMemoryTotalCache, create_total_cache_key
+
+
+def test_create_total_cache_key():
+    key = create_total_cache_key("ns", "select 1", {"a": 1})
+
+    assert key.startswith("ns:")
+    assert key == create_total_cache_key("ns", "select 1", {"a": 1})
+    assert key != create_total_cache_key("ns", "select 1", {"a": 2})
+    assert key != create_total_cache_key("other", "select 1", {"a": 1})
+
+
+def test_in_memory_cache_lru():
+    cache = InMemoryTotalCache(maxsize=2, ttl=None)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_in_memory_cache_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("fastapi_pagination.total_cache.time.monotonic", lambda: now)
+
+    cache = InMemoryTotalCache(ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    now = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_invalidate():
+    cache = InMemoryTotalCache()
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    cache.invalidate("unknown")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_invalid_maxsize():
+    with pytest.raises(ValueError, match=r"^maxsize must be greater than 0$"):
+        InMemoryTotalCache(maxsize=0)
+
+
+class _AsyncCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, total):
+        self.data[key] = total
+
+    async def invalidate(self, key):
+        self.data.pop(key, None)
+
+    async def clear(self):
+        self.data.clear()
+
+
+def _counting_flows(calls: list[int]):
+    @flow
+    def total_flow():
+        calls.append(1)
+        total = yield 100
+        return total
+
+    @flow
+    def limit_offset_flow(raw_params):
+        items = yield [*range(100)][raw_params.as_slice()]
+        return items
+
+    return total_flow, limit_offset_flow
+
+
+def test_generic_flow_total_cache():
+    calls: list[int] = []
+    total_flow, limit_offset_flow = _counting_flows(calls)
+    config = Config(total_cache=InMemoryTotalCache())
+
+    with set_page(Page[int]):
+        for page in range(1, 4):
+            result = run_sync_flow(
+                generic_flow(
+                    total_flow=total_flow,
+                    total_cache_key=lambda: "key",
+                    limit_offset_flow=limit_offset_flow,
+                    params=Params(page=page, size=10),
+                    config=config,
+                ),
+            )
+
+            assert result.total == 100
+
+    assert len(calls) == 1
+
+    config.total_cache.invalidate("key")
+
+    with set_page(Page[int]):
+        run_sync_flow(
+            generic_flow(
+                total_flow=total_flow,
+                total_cache_key=lambda: "key",
+                limit_offset_flow=limit_offset_flow,
+                params=Params(page=1, size=10),
+                config=config,
+            ),
+        )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_generic_flow_async_total_cache():
+    calls: list[int] = []
+    total_flow, limit_offset_flow = _counting_flows(calls)
+    cache = _AsyncCache()
+
+    with set_page(Page[int]):
+        for _ in range(2):
+            result = await run_async_flow(
+                generic_flow(
+                    async_=True,
+                    total_flow=total_flow,
+                    total_cache_key=lambda: "key",
+                    limit_offset_flow=limit_offset_flow,
+                    params=Params(page=1, size=10),
+                    config=Config(total_cache=cache),
+                ),
+            )
+
+            assert result.total == 100
+
+    assert len(calls) == 1
+    assert cache.data == {"key": 100}
@@ -1,3 +1,5 @@
+import warnings
+
 import pytest
 
 from fastapi_pagination import utils
@@ -6,12 +8,28 @@ utils._EXTENSIONS = [
     "unknown_extension",
     "sqlalchemy",
 ]
+utils._find_installed_extension.cache_clear()
 
 
 def test_check_installed_extensions():
     utils._CHECK_INSTALLED_EXTENSIONS = True
 
-    with pytest.warns(utils.FastAPIPaginationWarning):
+    with pytest.warns(utils.FastAPIPaginationWarning, match='Package "sqlalchemy" is installed'):
+        utils.check_installed_extensions()
+
+    assert utils._find_installed_extension.cache_info().currsize == 1
+
+
+def test_check_installed_extensions_ignored(monkeypatch):
+    utils._CHECK_INSTALLED_EXTENSIONS = True
+
+    def _warn(*_, **__):
+        raise AssertionError("warnings.warn should not be called")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", utils.FastAPIPaginationWarning)
+        monkeypatch.setattr(utils.warnings, "warn", _warn)
+
         utils.check_installed_extensions()
 
 